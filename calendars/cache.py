@@ -0,0 +1,135 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+from django.conf import settings
+from django.core.cache import cache
+
+CALENDAR_POINTER_TIMEOUT = 60 * 60 * 24 * 7
+CALENDARS_LAST_MODIFIED_KEY = "calendars:last_modified"
+
+
+def calendar_fingerprint(data):
+    """
+    Function to build the fingerprint of a calendar page: a hash of everything drawn in it. The
+    modification time of the background is included, so replacing the image changes the fingerprint
+
+    :param data: Dictionary built by calendar_render_data
+    :return: Hexadecimal fingerprint
+    """
+    background = data["background"]
+    content = dict(data, background_modified_at=os.path.getmtime(background) if background else None)
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def calendar_pointer_key(calendar_id):
+    """
+    Function to build the cache key that holds the fingerprint of the current image of a calendar
+
+    :param calendar_id: Id of the Calendar object
+    :return: Cache key
+    """
+    return "calendar_image:{}".format(calendar_id)
+
+
+def get_calendar_pointer(calendar_id):
+    return cache.get(calendar_pointer_key(calendar_id))
+
+
+def set_calendar_pointer(calendar_id, fingerprint):
+    cache.set(calendar_pointer_key(calendar_id), fingerprint, CALENDAR_POINTER_TIMEOUT)
+
+
+def invalidate_calendars(calendar_ids):
+    """
+    Function to invalidate the cached images of one or more calendars. The images themselves stay
+    on disk, shared by any calendar with the same content, until the store is pruned
+
+    :param calendar_ids: Iterable of Calendar ids
+    """
+    keys = [calendar_pointer_key(calendar_id) for calendar_id in set(calendar_ids) if calendar_id]
+    if keys:
+        cache.delete_many(keys)
+
+
+def get_calendars_last_modified():
+    """
+    Function to get the moment any calendar, month calendar or activity was last changed. If it is not
+    known, the current moment is used, so nothing cached before is considered up to date
+
+    :return: Timestamp of the last modification
+    """
+    return cache.get_or_set(CALENDARS_LAST_MODIFIED_KEY, time.time, CALENDAR_POINTER_TIMEOUT)
+
+
+def touch_calendars():
+    cache.set(CALENDARS_LAST_MODIFIED_KEY, time.time(), CALENDAR_POINTER_TIMEOUT)
+
+
+def cache_path(fingerprint):
+    return os.path.join(settings.CALENDAR_CACHE_DIR, fingerprint + ".png")
+
+
+def read_cached_image(fingerprint):
+    """
+    Function to read a rendered calendar page from the disk store. Its modification time is updated,
+    so the least recently used images are the first ones to be pruned
+
+    :param fingerprint: Fingerprint of the calendar page
+    :return: PNG image, in bytes, or None if it is not stored
+    """
+    path = cache_path(fingerprint)
+    try:
+        with open(path, "rb") as image_file:
+            image = image_file.read()
+        os.utime(path)
+    except OSError:
+        return None
+    return image
+
+
+def write_cached_image(fingerprint, image):
+    """
+    Function to store a rendered calendar page on disk. The file is written to a temporary name and then
+    renamed, so a concurrent reader never sees a partial image
+
+    :param fingerprint: Fingerprint of the calendar page
+    :param image: PNG image, in bytes
+    """
+    os.makedirs(settings.CALENDAR_CACHE_DIR, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=settings.CALENDAR_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(file_descriptor, "wb") as image_file:
+        image_file.write(image)
+    os.replace(temporary_path, cache_path(fingerprint))
+    prune_cached_images()
+
+
+def prune_cached_images(max_size=None):
+    """
+    Function to keep the disk store under its maximum size, deleting the least recently used images first
+
+    :param max_size: Maximum size of the store in bytes, CALENDAR_CACHE_MAX_SIZE by default
+    :return: Number of images deleted
+    """
+    max_size = settings.CALENDAR_CACHE_MAX_SIZE if max_size is None else max_size
+    entries = []
+    with os.scandir(settings.CALENDAR_CACHE_DIR) as directory:
+        for entry in directory:
+            if entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for modified_at, size, path in entries)
+    deleted = 0
+    for modified_at, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        deleted += 1
+    return deleted
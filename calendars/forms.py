@@ -1,6 +1,7 @@
 import datetime
 
 from django import forms
+from django.core.exceptions import ValidationError
 from django.forms import modelformset_factory
 from .models import MonthCalendar, Calendar, Activity
 from django.utils.translation import gettext_lazy as _
@@ -140,4 +141,15 @@ class ActivityEditForm(forms.ModelForm):
         return date_formatted
 
 
+class ActivityImportForm(forms.Form):
+    activities_file = forms.FileField(label=_("Choose a .csv or .ics file"))
+
+    def clean_activities_file(self):
+        activities_file = self.cleaned_data.get("activities_file")
+        if activities_file:
+            if not activities_file.name.lower().endswith(('.csv', '.ics')):
+                raise ValidationError(_("The uploaded file must be a CSV or an iCalendar file."))
+        return activities_file
+
+
 ActivityFormSet = modelformset_factory(Activity, form=ActivityForm, extra=1, can_delete=True, max_num=10)
\ No newline at end of file
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from calendars.utils import year_calendars, stream_calendars_zip, make_pdf_of_calendars
+
+
+class Command(BaseCommand):
+    help = "Exports every calendar page of a year as a PDF or as a ZIP file of images"
+
+    def add_arguments(self, parser):
+        parser.add_argument("year", type=int)
+        parser.add_argument("--format", choices=["pdf", "zip"], default="pdf")
+        parser.add_argument("--output", help="Path of the file to create, calendario_<year>.<format> by default")
+        parser.add_argument("--workers", type=int, help="Number of processes drawing the pages")
+
+    def handle(self, *args, **options):
+        calendars = list(year_calendars(options["year"]))
+        if not calendars:
+            raise CommandError("There are no calendars for {}.".format(options["year"]))
+
+        output = options["output"] or "calendario_{}.{}".format(options["year"], options["format"])
+        with open(output, "wb") as output_file:
+            if options["format"] == "zip":
+                for chunk in stream_calendars_zip(calendars, options["workers"]):
+                    output_file.write(chunk)
+            else:
+                output_file.write(make_pdf_of_calendars(calendars, options["workers"]))
+
+        self.stdout.write(self.style.SUCCESS("Exported {} calendar pages to {}.".format(len(calendars), output)))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from calendars.models import MonthCalendar
+from calendars.utils import generate_background_variants
+
+
+class Command(BaseCommand):
+    help = "Generates the resized variants of every month calendar background"
+
+    def handle(self, *args, **options):
+        count = 0
+        for month_calendar in MonthCalendar.objects.exclude(background_image=""):
+            background_image = month_calendar.background_image
+            if not background_image.storage.exists(background_image.name):
+                self.stderr.write("Missing background for {}: {}".format(month_calendar.month, background_image.name))
+                continue
+            generate_background_variants(background_image)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS("Generated the background variants of {} month calendars.".format(count)))
@@ -1,5 +1,3 @@
-import calendar
-import locale
 from datetime import datetime
 
 
@@ -28,20 +26,7 @@ class MonthCalendar(models.Model):
     background_image = models.ImageField(_("Background image"), upload_to='month_calendars/')
 
     def __str__(self):
-        month_name = self.get_month_name_in_english()
-        return str(_(month_name)).capitalize()
-
-    def get_month_name_in_english(self):
-        current_locale = locale.getlocale(locale.LC_TIME)
-        try:
-            locale.setlocale(locale.LC_TIME, 'en_US.UTF-8')
-        except locale.Error:
-            locale.setlocale(locale.LC_TIME, 'en_US')
-
-        month_name = calendar.month_name[int(self.month)]
-        locale.setlocale(locale.LC_TIME, current_locale)
-
-        return month_name
+        return str(self.get_month_display()).capitalize()
 
 
 class Calendar(models.Model):
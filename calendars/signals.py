@@ -0,0 +1,50 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from sorl.thumbnail import delete as delete_thumbnails
+
+from calendars.cache import invalidate_calendars, touch_calendars
+from calendars.models import MonthCalendar, Calendar, Activity
+from calendars.utils import generate_background_variants
+
+
+@receiver(post_save, sender=Activity)
+@receiver(post_delete, sender=Activity)
+def invalidate_activity_calendar(sender, instance, **kwargs):
+    invalidate_calendars([instance.calendar_id])
+    touch_calendars()
+
+
+@receiver(post_save, sender=Calendar)
+@receiver(post_delete, sender=Calendar)
+def invalidate_calendar(sender, instance, **kwargs):
+    invalidate_calendars([instance.pk])
+    touch_calendars()
+
+
+@receiver(post_save, sender=MonthCalendar)
+@receiver(post_delete, sender=MonthCalendar)
+def invalidate_month_calendars(sender, instance, **kwargs):
+    invalidate_calendars(Calendar.objects.filter(calendar=instance).values_list("id", flat=True))
+    touch_calendars()
+
+
+@receiver(pre_save, sender=MonthCalendar)
+def delete_previous_background_variants(sender, instance, raw=False, **kwargs):
+    if raw or not instance.pk:
+        return
+    previous = MonthCalendar.objects.filter(pk=instance.pk).values_list("background_image", flat=True).first()
+    if previous and previous != instance.background_image.name:
+        delete_thumbnails(previous, delete_file=False)
+
+
+@receiver(post_save, sender=MonthCalendar)
+def generate_month_calendar_background_variants(sender, instance, raw=False, **kwargs):
+    background_image = instance.background_image
+    if not raw and background_image and background_image.storage.exists(background_image.name):
+        generate_background_variants(background_image)
+
+
+@receiver(post_delete, sender=MonthCalendar)
+def delete_month_calendar_background_variants(sender, instance, **kwargs):
+    if instance.background_image:
+        delete_thumbnails(instance.background_image, delete_file=False)
@@ -0,0 +1,16 @@
+from django import template
+
+from calendars.utils import background_variant
+
+
+register = template.Library()
+
+
+@register.inclusion_tag("calendars/background_picture.html")
+def background_picture(image, width, alt=""):
+    width = int(width)
+    return {
+        "webp": (background_variant(image, width, "WEBP"), background_variant(image, width * 2, "WEBP")),
+        "png": (background_variant(image, width), background_variant(image, width * 2)),
+        "alt": alt,
+    }
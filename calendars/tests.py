@@ -1,3 +1,583 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import zipfile
+import tempfile
+from datetime import date, time, timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from PIL import Image
+
+from django.core.cache import cache
+from django.core.management import call_command, CommandError
+from django.db import connection
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from calendars.cache import get_calendar_pointer, write_cached_image, prune_cached_images
+from calendars.models import MonthCalendar, Calendar, Activity
+from calendars.utils import (render_calendar_image, calendar_render_data, render_calendar_images, year_calendars,
+                             read_activities_ics, background_variant, layout_activities, page_overflow,
+                             calendar_layout, apply_calendar_layout, CANVAS_SIZE)
+
+
+class CalendarRenderingTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root,
+                                                   CALENDAR_CACHE_DIR=os.path.join(self.media_root, "calendar_cache"))
+        self.settings_override.enable()
+        cache.clear()
+
+        background = io.BytesIO()
+        Image.new("RGB", (100, 100), "blue").save(background, format="PNG")
+        self.month_calendar = MonthCalendar.objects.create(
+            month="03", background_image=SimpleUploadedFile("marco.png", background.getvalue(), "image/png"))
+        self.calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=1)
+        Activity.objects.create(calendar=self.calendar, title="Edit-a-thon", date_start=date(2024, 3, 2),
+                                hour_start=time(14, 30))
+        Activity.objects.create(calendar=self.calendar, title="Wiki Loves Monuments", date_start=date(2024, 3, 10),
+                                date_end=date(2024, 3, 12))
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_month_calendar_str(self):
+        self.assertEqual(str(self.month_calendar), "March")
+        with translation.override("pt-br"):
+            self.assertEqual(str(self.month_calendar), "Março")
+            self.assertEqual(str(self.calendar), "Março de 2024")
+
+    def test_background_variants_are_generated_on_upload(self):
+        variants_dir = os.path.join(self.media_root, "cache")
+        variants = [os.path.splitext(name)[1] for root, dirs, files in os.walk(variants_dir) for name in files]
+        self.assertEqual(sorted(variants), [".png"] * 3 + [".webp"] * 3)
+
+        with patch("sorl.thumbnail.base.ThumbnailBackend._create_thumbnail") as create_thumbnail:
+            variant = background_variant(self.month_calendar.background_image, 600, "WEBP")
+            create_thumbnail.assert_not_called()
+        self.assertTrue(variant.url.endswith(".webp"))
+        self.assertEqual(variant.width, 100)
+
+    def test_month_calendar_detail_uses_the_variants(self):
+        response = self.client.get(reverse("calendars:month_calendar_detail", kwargs={"pk": self.month_calendar.pk}))
+        self.assertContains(response, '<source type="image/webp"')
+        self.assertNotContains(response, self.month_calendar.background_image.url + '"')
+
+    def test_background_variants_are_deleted_with_the_month_calendar(self):
+        self.month_calendar.delete()
+        variants_dir = os.path.join(self.media_root, "cache")
+        self.assertEqual([name for root, dirs, files in os.walk(variants_dir) for name in files], [])
+
+    def test_calendar_render_data(self):
+        data = calendar_render_data(self.calendar)
+        self.assertEqual(data["month"], "03")
+        self.assertTrue(os.path.exists(data["background"]))
+        self.assertNotEqual(data["background"], self.month_calendar.background_image.path)
+        self.assertEqual(data["activities"], [
+            {"title": "Edit-a-thon", "date": "2", "hour_start": "14h30"},
+            {"title": "Wiki Loves Monuments", "date": "10 to 12", "hour_start": ""},
+        ])
+
+    def test_render_calendar_image(self):
+        image = Image.open(io.BytesIO(render_calendar_image(self.calendar)))
+        self.assertEqual(image.format, "PNG")
+        self.assertEqual(image.size, (CANVAS_SIZE, CANVAS_SIZE))
+
+    def test_render_calendar_image_is_cached_by_content(self):
+        with patch("calendars.utils.render_calendar", return_value=b"image") as render_calendar:
+            self.assertEqual(render_calendar_image(self.calendar), b"image")
+            self.assertEqual(render_calendar_image(self.calendar), b"image")
+            self.assertEqual(render_calendar.call_count, 1)
+
+            Activity.objects.create(calendar=self.calendar, title="Wikidata Day", date_start=date(2024, 3, 20))
+            render_calendar_image(self.calendar)
+            self.assertEqual(render_calendar.call_count, 2)
+
+    def test_cached_calendar_image_needs_no_query(self):
+        image = render_calendar_image(self.calendar)
+        with self.assertNumQueries(0):
+            self.assertEqual(render_calendar_image(self.calendar), image)
+
+    def test_calendar_image_is_shared_by_identical_calendars(self):
+        other_calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=2)
+        for activity in self.calendar.activities.all():
+            Activity.objects.create(calendar=other_calendar, title=activity.title, date_start=activity.date_start,
+                                    date_end=activity.date_end, hour_start=activity.hour_start)
+        render_calendar_image(self.calendar)
+        with patch("calendars.utils.render_calendar") as render_calendar:
+            render_calendar_image(other_calendar)
+            render_calendar.assert_not_called()
+        self.assertEqual(get_calendar_pointer(self.calendar.pk), get_calendar_pointer(other_calendar.pk))
+
+    def test_calendar_image_is_invalidated_by_signals(self):
+        activity = self.calendar.activities.first()
+        changes = [
+            lambda: Activity.objects.filter(pk=activity.pk).first().save(),
+            lambda: activity.delete(),
+            lambda: self.calendar.save(),
+            lambda: self.month_calendar.save(),
+        ]
+        for change in changes:
+            render_calendar_image(self.calendar)
+            self.assertIsNotNone(get_calendar_pointer(self.calendar.pk))
+            change()
+            self.assertIsNone(get_calendar_pointer(self.calendar.pk))
+
+    def test_prune_cached_images(self):
+        for index, fingerprint in enumerate(["a", "b", "c"]):
+            write_cached_image(fingerprint, b"x" * 10)
+            os.utime(os.path.join(self.media_root, "calendar_cache", fingerprint + ".png"), (index, index))
+        self.assertEqual(prune_cached_images(max_size=20), 1)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.media_root, "calendar_cache"))), ["b.png", "c.png"])
+
+    def test_calendar_download_returns_png(self):
+        response = self.client.get(reverse("calendars:calendar_download", kwargs={"pk": self.calendar.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertEqual(Image.open(io.BytesIO(response.content)).size, (CANVAS_SIZE, CANVAS_SIZE))
+
+    def test_calendar_download_not_found(self):
+        response = self.client.get(reverse("calendars:calendar_download", kwargs={"pk": 999}))
+        self.assertEqual(response.status_code, 404)
+
+
+    def create_year(self):
+        pages = [self.calendar]
+        for page in (2, 3):
+            wmb_calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=page)
+            Activity.objects.create(calendar=wmb_calendar, title="Page {}".format(page), date_start=date(2024, 3, page))
+            pages.append(wmb_calendar)
+        return pages
+
+    def test_year_calendars_order(self):
+        pages = self.create_year()
+        Calendar.objects.create(calendar=self.month_calendar, year=2025, page=1)
+        january = Calendar.objects.create(calendar=MonthCalendar.objects.create(month="01", background_image="janeiro.png"),
+                                          year=2024, page=1)
+        self.assertEqual(list(year_calendars(2024)), [january] + pages)
+
+    def test_render_calendar_images_in_parallel(self):
+        pages = self.create_year()
+        rendered = list(render_calendar_images(year_calendars(2024), workers=2))
+        self.assertEqual([wmb_calendar for wmb_calendar, image in rendered], pages)
+        for wmb_calendar, image in rendered:
+            self.assertEqual(image, render_calendar_image(wmb_calendar))
+
+        with patch("calendars.utils.render_calendar") as render_calendar:
+            list(render_calendar_images(year_calendars(2024), workers=2))
+            render_calendar.assert_not_called()
+
+    def test_calendar_year_download_zip(self):
+        self.create_year()
+        response = self.client.get(reverse("calendars:calendar_year_download", kwargs={"year": 2024}),
+                                   {"format": "zip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as zf:
+            self.assertEqual(zf.namelist(), ["calendario_2024_03_1.png", "calendario_2024_03_2.png",
+                                             "calendario_2024_03_3.png"])
+
+    def test_calendar_year_download_pdf(self):
+        self.create_year()
+        with patch("calendars.utils.ProcessPoolExecutor") as executor:
+            response = self.client.get(reverse("calendars:calendar_year_download", kwargs={"year": 2024}))
+        executor.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertTrue(response.content.startswith(b"%PDF"))
+        self.assertEqual(response.content.count(b"/Type /Page\n"), 3)
+
+    def test_calendar_year_download_without_calendars(self):
+        response = self.client.get(reverse("calendars:calendar_year_download", kwargs={"year": 2030}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_calendar_year_command(self):
+        self.create_year()
+        output = os.path.join(self.media_root, "calendario.zip")
+        call_command("export_calendar_year", "2024", format="zip", output=output, stdout=io.StringIO())
+        with zipfile.ZipFile(output) as zf:
+            self.assertEqual(len(zf.namelist()), 3)
+
+        with self.assertRaises(CommandError):
+            call_command("export_calendar_year", "2030", stdout=io.StringIO())
+
+
+class CalendarViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.month_calendars = [MonthCalendar.objects.create(month="{:02d}".format(month), background_image="x.png")
+                                for month in range(1, 4)]
+        for month_calendar in self.month_calendars:
+            for year in (2024, 2025):
+                wmb_calendar = Calendar.objects.create(calendar=month_calendar, year=year)
+                for day in range(1, 4):
+                    Activity.objects.create(calendar=wmb_calendar, title="Activity {}".format(day),
+                                            date_start=date(year, int(month_calendar.month), day))
+        self.calendar = Calendar.objects.get(calendar=self.month_calendars[0], year=2025)
+
+    def test_calendar_list_shows_the_latest_year(self):
+        response = self.client.get(reverse("calendars:calendar_list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["year"], 2025)
+        self.assertEqual(response.context["years"], [2025, 2024])
+        self.assertEqual([wmb_calendar.year for wmb_calendar in response.context["calendars"]], [2025] * 3)
+        self.assertContains(response, "Activities: 3", count=3)
+
+    def test_calendar_list_by_year(self):
+        response = self.client.get(reverse("calendars:calendar_list"), {"year": 2024})
+        self.assertEqual([wmb_calendar.year for wmb_calendar in response.context["calendars"]], [2024] * 3)
+
+    def test_calendar_list_number_of_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("calendars:calendar_list"))
+        self.assertLessEqual(len(queries), 2)
+
+        MonthCalendar.objects.create(month="04", background_image="x.png")
+        Calendar.objects.create(calendar=MonthCalendar.objects.get(month="04"), year=2025)
+        cache.clear()
+        with self.assertNumQueries(len(queries)):
+            self.client.get(reverse("calendars:calendar_list"))
+
+    def test_calendar_list_is_cached_until_a_change(self):
+        self.client.get(reverse("calendars:calendar_list"))
+        with self.assertNumQueries(1):
+            self.client.get(reverse("calendars:calendar_list"))
+
+        Activity.objects.create(calendar=self.calendar, title="New activity", date_start=date(2025, 1, 10))
+        response = self.client.get(reverse("calendars:calendar_list"))
+        self.assertContains(response, "Activities: 4", count=1)
+
+    def test_calendar_pages_are_cached_per_language(self):
+        for url in (reverse("calendars:calendar_list"), reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk})):
+            english = self.client.get(url, HTTP_ACCEPT_LANGUAGE="en").content.decode()
+            portuguese = self.client.get(url, HTTP_ACCEPT_LANGUAGE="pt-br").content.decode()
+            self.assertIn("Janeiro", portuguese)
+            self.assertNotIn("Janeiro", english)
+
+    def test_calendar_detail(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), 2)
+        self.assertContains(response, "Activity 1", count=2)
+
+        with self.assertNumQueries(1):
+            self.client.get(reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+
+        Activity.objects.filter(calendar=self.calendar).first().delete()
+        response = self.client.get(reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+        self.assertNotContains(response, "Activity 1")
+
+
+class ActivityImportTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.month_calendar = MonthCalendar.objects.create(month="03", background_image="x.png")
+        self.calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024)
+        self.url = reverse("calendars:activity_import", kwargs={"calendar_id": self.calendar.pk})
+
+    def upload(self, name, content):
+        return self.client.post(self.url, {"activities_file": SimpleUploadedFile(name, content.encode("utf-8"))})
+
+    def test_import_csv(self):
+        rows = ["title,date_start,date_end,hour_start,custom_date",
+                "Edit-a-thon,2024-03-02,,14:30,",
+                "Wiki Loves Monuments,2024-03-10,2024-03-12,,",
+                "Wikidata Day,2024-03-28,2024-04-02,,",
+                "Meetup,2024-03-15,,,Every friday"]
+        rows += ["Activity {},2024-03-{:02d},,,".format(day, day) for day in range(1, 29)] * 10
+        with CaptureQueriesContext(connection) as queries:
+            response = self.upload("activities.csv", "\n".join(rows))
+        self.assertLess(len(queries), 10)
+        self.assertRedirects(response, reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+
+        self.assertEqual(self.calendar.activities.count(), 284)
+        activities = {activity.title: activity for activity in self.calendar.activities.all()[:4]}
+        self.assertEqual(activities["Edit-a-thon"].custom_date, "2")
+        self.assertEqual(activities["Edit-a-thon"].date_end, date(2024, 3, 2))
+        self.assertEqual(activities["Edit-a-thon"].hour_start, time(14, 30))
+        self.assertEqual(activities["Wiki Loves Monuments"].custom_date, "10 to 12")
+        self.assertEqual(activities["Wikidata Day"].custom_date, "3/28 to 4/2")
+        self.assertEqual(activities["Meetup"].custom_date, "Every friday")
+
+    def test_import_custom_date_matches_model(self):
+        self.upload("activities.csv", "title,date_start,date_end\nA,2024-03-28,2024-04-02\nB,2024-03-01,2024-03-01")
+        for activity in self.calendar.activities.all():
+            self.assertEqual(activity.custom_date, activity.calculate_custom_date())
+
+    def test_import_csv_with_errors(self):
+        rows = ["title,date_start,date_end,hour_start",
+                ",2024-03-02,,",
+                "Edit-a-thon,02/03/2024,,",
+                "Wikidata Day,2024-03-28,2024-03-01,25:00"]
+        response = self.upload("activities.csv", "\n".join(rows))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calendar.activities.count(), 0)
+        errors = response.context["form"].non_field_errors()
+        self.assertEqual(list(errors)[1:], [
+            "Title invalid! Verify row 1, column 'title'",
+            "Start date invalid! Verify row 2, column 'date_start'",
+            "End date invalid! Verify row 3, column 'date_end'",
+            "Hour invalid! Verify row 3, column 'hour_start'",
+        ])
+
+    def test_import_csv_without_required_columns(self):
+        response = self.upload("activities.csv", "name,date\nEdit-a-thon,2024-03-02")
+        self.assertIn("One or more required columns are missing. Verify and submit again",
+                      response.context["form"].non_field_errors())
+
+    def test_import_wrong_file_type(self):
+        response = self.upload("activities.txt", "title,date_start")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].errors["activities_file"])
+
+    def test_import_ics(self):
+        content = "\r\n".join([
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "BEGIN:VEVENT",
+            "SUMMARY:Wiki Loves Monuments\\, Brasil",
+            "DTSTART;VALUE=DATE:20240310",
+            "DTEND;VALUE=DATE:20240313",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "SUMMARY:Edit-a-thon of a very long",
+            "  name",
+            "DTSTART;TZID=America/Sao_Paulo:20240302T143000",
+            "DTEND;TZID=America/Sao_Paulo:20240302T170000",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "SUMMARY:Online meeting",
+            "DTSTART:20240320T220000Z",
+            "END:VEVENT",
+            "END:VCALENDAR",
+        ])
+        with self.settings(TIME_ZONE="America/Sao_Paulo"):
+            response = self.upload("activities.ics", content)
+        self.assertEqual(response.status_code, 302)
+
+        activities = {activity.title: activity for activity in self.calendar.activities.all()}
+        self.assertEqual(activities["Wiki Loves Monuments, Brasil"].date_end, date(2024, 3, 12))
+        self.assertEqual(activities["Wiki Loves Monuments, Brasil"].custom_date, "10 to 12")
+        self.assertEqual(activities["Edit-a-thon of a very long name"].hour_start, time(14, 30))
+        self.assertEqual(activities["Online meeting"].date_start, date(2024, 3, 20))
+        self.assertEqual(activities["Online meeting"].hour_start, time(19, 0))
+
+    def test_import_invalidates_calendar_pages(self):
+        self.client.get(reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+        self.upload("activities.csv", "title,date_start\nEdit-a-thon,2024-03-02")
+        response = self.client.get(reverse("calendars:calendar_detail", kwargs={"pk": self.calendar.pk}))
+        self.assertContains(response, "Edit-a-thon")
+
+
+class CalendarFeedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.month_calendar = MonthCalendar.objects.create(month="03", background_image="x.png")
+        self.calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024)
+        self.other_calendar = Calendar.objects.create(calendar=self.month_calendar, year=2025)
+        Activity.objects.create(calendar=self.calendar, title="Edit-a-thon; São Paulo, SP", date_start=date(2024, 3, 2),
+                                hour_start=time(14, 30))
+        Activity.objects.create(calendar=self.calendar, title="Wiki Loves Monuments", date_start=date(2024, 3, 10),
+                                date_end=date(2024, 3, 12))
+        Activity.objects.create(calendar=self.other_calendar, title="Wikidata Day", date_start=date(2025, 3, 20))
+        self.url = reverse("calendars:calendar_feed_detail", kwargs={"pk": self.calendar.pk})
+
+    def test_calendar_feed(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        content = response.content.decode("utf-8")
+        self.assertTrue(content.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertIn("SUMMARY:Edit-a-thon\; São Paulo\\, SP\r\n", content)
+        self.assertIn("DTSTART:20240302T143000Z\r\n", content)
+        self.assertIn("DTSTART;VALUE=DATE:20240310\r\n", content)
+        self.assertIn("DTEND;VALUE=DATE:20240313\r\n", content)
+        self.assertNotIn("Wikidata Day", content)
+
+    def test_calendar_feed_can_be_imported_back(self):
+        df = read_activities_ics(self.client.get(self.url).content.decode("utf-8"))
+        self.assertEqual(df.drop(columns="custom_date").fillna("").to_dict("records"), [
+            {"title": "Edit-a-thon; São Paulo, SP", "date_start": "2024-03-02", "date_end": "2024-03-02",
+             "hour_start": "14:30"},
+            {"title": "Wiki Loves Monuments", "date_start": "2024-03-10", "date_end": "2024-03-12",
+             "hour_start": ""},
+        ])
+
+    def test_year_and_all_feeds(self):
+        content = self.client.get(reverse("calendars:calendar_feed_year", kwargs={"year": 2025})).content
+        self.assertEqual(content.count(b"BEGIN:VEVENT"), 1)
+        content = self.client.get(reverse("calendars:calendar_feed_all")).content
+        self.assertEqual(content.count(b"BEGIN:VEVENT"), 3)
+
+    def test_calendar_feed_conditional_requests(self):
+        response = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        not_modified = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(not_modified.status_code, 304)
+
+        Activity.objects.create(calendar=self.calendar, title="Wikidata Day", date_start=date(2024, 3, 20))
+        modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(modified.status_code, 200)
+        self.assertIn(b"Wikidata Day", modified.content)
+
+    def test_calendar_feed_is_cached(self):
+        self.client.get(self.url)
+        with patch("calendars.utils.activities_to_ics") as activities_to_ics:
+            self.client.get(self.url)
+            activities_to_ics.assert_not_called()
+
+    def test_long_lines_are_folded(self):
+        Activity.objects.create(calendar=self.calendar, title="Edit-a-thon " * 20, date_start=date(2024, 3, 25))
+        content = self.client.get(self.url).content
+        self.assertTrue(all(len(line) <= 75 for line in content.split(b"\r\n")))
+
+
+class CalendarEmbedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        self.month_calendar = MonthCalendar.objects.create(month="{:02d}".format(today.month), background_image="x.png")
+        self.calendar = Calendar.objects.create(calendar=self.month_calendar, year=today.year, page=1)
+        Calendar.objects.create(calendar=self.month_calendar, year=today.year, page=2)
+        Activity.objects.create(calendar=self.calendar, title="Edit-a-thon", date_start=today.replace(day=2),
+                                hour_start=time(14, 30))
+        self.url = reverse("calendars:calendar_embed_json", kwargs={"pk": self.calendar.pk})
+
+    def test_calendar_embed_json(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Access-Control-Allow-Origin"], "*")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=3600", response["Cache-Control"])
+        data = response.json()
+        self.assertEqual(data["id"], self.calendar.pk)
+        self.assertEqual(data["activities"], [{"title": "Edit-a-thon",
+                                               "date_start": self.calendar.activities.get().date_start.isoformat(),
+                                               "date_end": self.calendar.activities.get().date_end.isoformat(),
+                                               "hour_start": "14:30",
+                                               "custom_date": "2"}])
+
+    def test_calendar_embed_current_month(self):
+        response = self.client.get(reverse("calendars:calendar_embed_current_json"))
+        self.assertEqual(response.json()["id"], self.calendar.pk)
+
+        response = self.client.get(reverse("calendars:calendar_embed_current"))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Frame-Options", response)
+        self.assertContains(response, "Edit-a-thon")
+
+    def test_calendar_embed_is_served_from_cache(self):
+        self.client.get(self.url)
+        self.client.get(reverse("calendars:calendar_embed", kwargs={"pk": self.calendar.pk}))
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+            self.assertEqual(self.client.get(reverse("calendars:calendar_embed",
+                                                     kwargs={"pk": self.calendar.pk})).status_code, 200)
+
+    def test_calendar_embed_is_invalidated_by_activity_changes(self):
+        self.client.get(self.url)
+        Activity.objects.create(calendar=self.calendar, title="Wikidata Day", date_start=date(2024, 3, 20))
+        self.assertEqual(len(self.client.get(self.url).json()["activities"]), 2)
+
+    def test_calendar_embed_not_found_is_not_cached(self):
+        url = reverse("calendars:calendar_embed_json", kwargs={"pk": 999})
+        with patch("calendars.utils.cache.set") as cache_set:
+            self.assertEqual(self.client.get(url).status_code, 404)
+            cache_set.assert_not_called()
+
+    def test_calendar_embed_current_month_changes_with_the_month(self):
+        url = reverse("calendars:calendar_embed_current_json")
+        response = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304)
+
+        next_month = timezone.now() + timedelta(days=32)
+        with patch("django.utils.timezone.now", return_value=next_month):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 404)
+            self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 404)
+
+
+class CalendarLayoutTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.month_calendar = MonthCalendar.objects.create(month="03", background_image="x.png")
+        self.calendar = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=1)
+
+    def create_activities(self, number, title="Edit-a-thon"):
+        Activity.objects.bulk_create([
+            Activity(calendar=self.calendar, title="{} {}".format(title, day), date_start=date(2024, 3, day),
+                     date_end=date(2024, 3, day), custom_date=str(day))
+            for day in range(1, number + 1)
+        ])
+
+    def test_layout_activities_that_fit(self):
+        activities = [{"title": "Edit-a-thon", "date": "2", "hour_start": "14h30"}] * 4
+        self.assertEqual(layout_activities(activities), {"overflow": [], "pages": [[0, 1, 2, 3]]})
+        self.assertEqual(layout_activities([]), {"overflow": [], "pages": []})
+
+    def test_layout_activities_proposes_pages(self):
+        activities = [{"title": "Edit-a-thon of Wikipedia articles {}".format(day), "date": str(day), "hour_start": ""}
+                      for day in range(1, 31)]
+        layout = layout_activities(activities)
+        self.assertTrue(layout["overflow"])
+        self.assertGreater(len(layout["pages"]), 1)
+        self.assertEqual([index for page in layout["pages"] for index in page], list(range(30)))
+        for page in layout["pages"]:
+            self.assertEqual(page_overflow([activities[index] for index in page]), [])
+
+    def test_layout_reports_titles_that_never_fit(self):
+        activities = [{"title": "Wikipedia " * 400, "date": "2", "hour_start": ""}]
+        self.assertEqual(layout_activities(activities), {"overflow": [0], "pages": [[0]]})
+
+    def test_calendar_layout_view(self):
+        self.create_activities(3)
+        response = self.client.get(reverse("calendars:calendar_layout", kwargs={"pk": self.calendar.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["layout"]["overflow"], [])
+        self.assertEqual(len(response.context["layout"]["pages"]), 1)
+
+    def test_apply_calendar_layout(self):
+        self.create_activities(30, title="Edit-a-thon of Wikipedia articles")
+        second_page = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=2)
+        layout = calendar_layout(self.calendar)
+
+        response = self.client.post(reverse("calendars:calendar_layout", kwargs={"pk": self.calendar.pk}))
+        self.assertRedirects(response, reverse("calendars:calendar_list") + "?year=2024")
+
+        pages = Calendar.objects.filter(calendar=self.month_calendar, year=2024).order_by("page")
+        self.assertEqual([wmb_calendar.page for wmb_calendar in pages], list(range(1, len(layout["pages"]) + 2)))
+        self.assertEqual(pages.last(), second_page)
+        dates = [activity.date_start for wmb_calendar in pages
+                 for activity in wmb_calendar.activities.order_by("date_start")]
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual(self.calendar.activities.count(), len(layout["pages"][0]))
+        for wmb_calendar in pages:
+            self.assertEqual(calendar_layout(wmb_calendar)["overflow"], [])
+        self.assertEqual(Activity.objects.count(), 30)
+
+    def test_apply_calendar_layout_is_atomic(self):
+        self.create_activities(30, title="Edit-a-thon of Wikipedia articles")
+        pages = calendar_layout(self.calendar)["pages"]
+        activity_ids = [[activity["id"] for activity in page] for page in pages]
+        second_page = Calendar.objects.create(calendar=self.month_calendar, year=2024, page=2)
+
+        with patch("calendars.utils.Activity.objects.filter", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                apply_calendar_layout(self.calendar, activity_ids)
+
+        self.assertEqual(list(Calendar.objects.order_by("page")), [self.calendar, second_page])
+        second_page.refresh_from_db()
+        self.assertEqual(second_page.page, 2)
+        self.assertEqual(self.calendar.activities.count(), 30)
@@ -15,8 +15,18 @@ urlpatterns = [
     path('<int:pk>/update/', views.calendar_update, name='calendar_update'),
     path('<int:pk>/delete/', views.calendar_delete, name='calendar_delete'),
     path('<int:pk>/download/', views.calendar_download, name='calendar_download'),
+    path('<int:pk>/layout/', views.calendar_layout_check, name='calendar_layout'),
+    path('year/<int:year>/download/', views.calendar_year_download, name='calendar_year_download'),
+    path('feed.ics', views.calendar_feed_all, name='calendar_feed_all'),
+    path('<int:pk>/feed.ics', views.calendar_feed_detail, name='calendar_feed_detail'),
+    path('year/<int:year>/feed.ics', views.calendar_feed_year, name='calendar_feed_year'),
+    path('embed/current.json', views.calendar_embed_json, name='calendar_embed_current_json'),
+    path('embed/current/', views.calendar_embed_html, name='calendar_embed_current'),
+    path('embed/<int:pk>.json', views.calendar_embed_json, name='calendar_embed_json'),
+    path('embed/<int:pk>/', views.calendar_embed_html, name='calendar_embed'),
     path('<int:calendar_id>/activity/create/', views.activity_create, name='activity_create'),
     path('<int:calendar_id>/activity/create_in_bulk/', views.activity_create_in_bulk, name='activity_create_in_bulk'),
+    path('<int:calendar_id>/activity/import/', views.activity_import, name='activity_import'),
     path('<int:calendar_id>/activity/<int:pk>/update/', views.activity_update, name='activity_update'),
     path('<int:calendar_id>/activity/<int:pk>/delete/', views.activity_delete, name='activity_delete')
 ]
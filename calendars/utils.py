@@ -0,0 +1,810 @@
+import io
+import os
+import re
+import zipfile
+import datetime
+import tempfile
+from string import Formatter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from fpdf import FPDF
+from PIL import Image, ImageDraw
+from sorl.thumbnail import get_thumbnail
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone, translation
+from django.utils.translation import gettext_lazy as _
+
+from calendars.cache import (calendar_fingerprint, get_calendar_pointer, set_calendar_pointer, read_cached_image,
+                             write_cached_image, invalidate_calendars, touch_calendars, get_calendars_last_modified,
+                             CALENDAR_POINTER_TIMEOUT)
+from calendars.models import Calendar, Activity
+from certificates.utils import ZipStream
+from wmb.fonts import get_font
+
+# Geometry of the calendar image, in pixels
+CANVAS_SIZE = 1200
+PDF_PAGE_SIZE = CANVAS_SIZE * 72 / 96
+PADDING_TOP = 58
+PADDING_RIGHT = 58
+PADDING_BOTTOM = 58
+PADDING_LEFT = 270
+BOX_GAP = 20
+DATE_WIDTH = 130
+TITLE_MARGIN = 50
+TITLE_FONT_SIZE = 30
+TITLE_MIN_FONT_SIZE = 16
+TITLE_LINE_HEIGHT = 37 / 30
+DATE_FONT_SIZE = 44
+DATE_SMALL_FONT_SIZE = 29
+
+# Variants of the month backgrounds generated on upload, by format and width
+BACKGROUND_FORMATS = {"WEBP": 80, "PNG": 90}
+BACKGROUND_WIDTHS = (300, 600, CANVAS_SIZE)
+
+DATE_FONT = "FuturaBold.ttf"
+TITLE_FONT = "FuturaBoldCondensedBT.ttf"
+
+MONTH_COLORS = {"01": "#000000",
+                "02": "#5f174a",
+                "03": "#242856",
+                "04": "#2c70b7",
+                "05": "#23772d",
+                "06": "#e6520f",
+                "07": "#c10248",
+                "08": "#016668",
+                "09": "#f9b215",
+                "10": "#d81d61",
+                "11": "#18499a",
+                "12": "#cc1517", }
+
+
+def serialize_activities(activities):
+    """
+    Function to serialize the activities of a calendar into what is drawn in its image
+
+    :param activities: Iterable of Activity objects
+    :return: List of dictionaries with the title, date and starting hour of each activity
+    """
+    return [
+        {
+            "title": activity.title,
+            "date": activity.custom_date if activity.custom_date else "",
+            "hour_start": activity.hour_start.strftime("%Hh%M").replace("h00", "h") if activity.hour_start else "",
+        }
+        for activity in activities
+    ]
+
+
+def background_variant(image, width, image_format="PNG"):
+    """
+    Function to get a resized and recompressed variant of a month background, generating it if needed.
+    Images are never enlarged
+
+    :param image: ImageFieldFile of the background
+    :param width: Width of the variant, in pixels
+    :param image_format: Format of the variant, one of BACKGROUND_FORMATS
+    :return: Thumbnail of the background
+    """
+    return get_thumbnail(image, str(width), format=image_format, quality=BACKGROUND_FORMATS[image_format],
+                         upscale=False)
+
+
+def generate_background_variants(image):
+    """
+    Function to generate every variant of a month background, so pages never wait for them
+
+    :param image: ImageFieldFile of the background
+    :return: List of thumbnails
+    """
+    return [background_variant(image, width, image_format)
+            for image_format in BACKGROUND_FORMATS for width in BACKGROUND_WIDTHS]
+
+
+def calendar_render_data(wmb_calendar):
+    """
+    Function to gather everything needed to draw a calendar page, so the drawing itself
+    does not need to access the database
+
+    :param wmb_calendar: Calendar object
+    :return: Dictionary with the month, the path of the background image and the activities
+    """
+    background = ""
+    background_image = wmb_calendar.calendar.background_image
+    if background_image and background_image.storage.exists(background_image.name):
+        variant = background_variant(background_image, CANVAS_SIZE)
+        background = variant.storage.path(variant.name)
+    return {
+        "month": wmb_calendar.calendar.month,
+        "background": background,
+        "activities": serialize_activities(wmb_calendar.activities.all().order_by("date_start", "id")),
+    }
+
+
+@lru_cache(maxsize=12)
+def load_background(path, modified_at):
+    """
+    Function to load a background image already resized to the calendar size. The modification time
+    is part of the cache key, so a replaced file is loaded again
+
+    :param path: Path of the background image
+    :param modified_at: Modification time of the file
+    :return: Image object
+    """
+    with Image.open(path) as background:
+        return background.convert("RGB").resize((CANVAS_SIZE, CANVAS_SIZE), Image.LANCZOS)
+
+
+def box_width(index, total):
+    """
+    Function to get the width of the box of an activity. The first and the last two boxes are
+    narrower, to avoid the decorations of the background images
+
+    :param index: Position of the activity in the calendar
+    :param total: Number of activities in the calendar
+    :return: Width of the box, in pixels
+    """
+    content_width = CANVAS_SIZE - PADDING_LEFT - PADDING_RIGHT
+    if index == 0 or index >= total - 2:
+        return int(content_width * 0.7)
+    return int(content_width * 0.9)
+
+
+def box_height(total):
+    """
+    Function to get the height of the activity boxes of a page, which share the height of the page
+
+    :param total: Number of activities in the calendar
+    :return: Height of each box, in pixels
+    """
+    content_height = CANVAS_SIZE - PADDING_TOP - PADDING_BOTTOM
+    return (content_height - BOX_GAP * (total - 1)) / total
+
+
+def title_width(index, total):
+    return box_width(index, total) - DATE_WIDTH - TITLE_MARGIN
+
+
+@lru_cache(maxsize=8192)
+def text_length(text, font_name, size):
+    """
+    Function to measure a text. The measures are cached, as the same titles are measured
+    at several font sizes and page arrangements
+
+    :return: Width of the text, in pixels
+    """
+    return get_font(font_name, size).getlength(text)
+
+
+def wrap_text(text, font_name, size, width):
+    """
+    Function to break a text into lines that fit in the given width
+
+    :param text: Text to be broken
+    :param font_name: Filename of the font used to measure the text
+    :param size: Font size, in pixels
+    :param width: Maximum width of a line, in pixels
+    :return: List of lines
+    """
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if not line or text_length(candidate, font_name, size) <= width:
+            line = candidate
+        else:
+            lines.append(line)
+            line = word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def fit_title(activity, width, height):
+    """
+    Function to find the biggest font size in which the title and hour of an activity fit in its box
+
+    :return: Tuple with the font size, the lines of text and whether they fit in the box
+    """
+    text = activity["title"].upper()
+    for size in range(TITLE_FONT_SIZE, TITLE_MIN_FONT_SIZE - 1, -2):
+        lines = wrap_text(text, TITLE_FONT, size, width)
+        if activity["hour_start"]:
+            lines.append(activity["hour_start"])
+        fits = (len(lines) * size * TITLE_LINE_HEIGHT <= height
+                and all(text_length(line, TITLE_FONT, size) <= width for line in lines))
+        if fits:
+            break
+    return size, lines, fits
+
+
+def page_overflow(activities):
+    """
+    Function to find the activities that do not fit in their boxes when drawn together in one page
+
+    :param activities: List of dictionaries built by serialize_activities
+    :return: List with the positions of the activities that overflow their boxes
+    """
+    total = len(activities)
+    if not total:
+        return []
+    height = box_height(total)
+    if height < DATE_SMALL_FONT_SIZE * TITLE_LINE_HEIGHT:
+        return list(range(total))
+    return [index for index, activity in enumerate(activities)
+            if not fit_title(activity, title_width(index, total), height)[2]]
+
+
+def layout_activities(activities):
+    """
+    Function to check if the activities fit in one calendar page and, if they don't, to split them
+    into consecutive pages, each one with as many activities as fit in it
+
+    :param activities: List of dictionaries built by serialize_activities, in the order they are drawn
+    :return: Dictionary with the positions of the activities that overflow the current page and the
+             proposed pages, as lists of positions
+    """
+    pages = []
+    start = 0
+    while start < len(activities):
+        end = start + 1
+        while end < len(activities) and not page_overflow(activities[start:end + 1]):
+            end += 1
+        pages.append(list(range(start, end)))
+        start = end
+    return {"overflow": page_overflow(activities), "pages": pages}
+
+
+def calendar_layout(wmb_calendar):
+    """
+    Function to check the layout of a calendar page before drawing it
+
+    :param wmb_calendar: Calendar object
+    :return: Dictionary with the activities, the ones that overflow the page and the proposed pages,
+             with activities as dictionaries that include their ids
+    """
+    activities = list(wmb_calendar.activities.order_by("date_start", "id"))
+    serialized = serialize_activities(activities)
+    layout = layout_activities(serialized)
+    for activity, data in zip(activities, serialized):
+        data["id"] = activity.pk
+    return {
+        "activities": serialized,
+        "overflow": [serialized[index] for index in layout["overflow"]],
+        "pages": [[serialized[index] for index in page] for page in layout["pages"]],
+    }
+
+
+def apply_calendar_layout(wmb_calendar, pages):
+    """
+    Function to move the activities of a calendar to new pages, following a proposed layout. The first
+    page stays in the calendar and the others are inserted right after it, moving the later pages of
+    the same month and year forward, so the activities stay in chronological order
+
+    :param wmb_calendar: Calendar object
+    :param pages: Lists of activity ids, one list per page
+    :return: List of the Calendar objects of the new pages
+    """
+    new_calendars = []
+    with transaction.atomic():
+        later_pages = list(Calendar.objects.select_for_update()
+                           .filter(calendar_id=wmb_calendar.calendar_id, year=wmb_calendar.year,
+                                   page__gt=wmb_calendar.page)
+                           .values_list("pk", flat=True))
+        Calendar.objects.filter(pk__in=later_pages).update(page=F("page") + len(pages) - 1)
+        for offset, page in enumerate(pages[1:], start=1):
+            new_calendar = Calendar.objects.create(calendar_id=wmb_calendar.calendar_id, year=wmb_calendar.year,
+                                                   page=wmb_calendar.page + offset)
+            Activity.objects.filter(calendar=wmb_calendar, pk__in=page).update(calendar=new_calendar)
+            new_calendars.append(new_calendar)
+    invalidate_calendars([wmb_calendar.pk] + later_pages)
+    touch_calendars()
+    return new_calendars
+
+
+def render_calendar(data):
+    """
+    Function to draw a calendar page. It reproduces the layout of the calendar: a date
+    box in white and the title of the activity highlighted in the color of the month
+
+    :param data: Dictionary built by calendar_render_data
+    :return: PNG image, in bytes
+    """
+    if data["background"]:
+        image = load_background(data["background"], os.path.getmtime(data["background"])).copy()
+    else:
+        image = Image.new("RGB", (CANVAS_SIZE, CANVAS_SIZE), "white")
+    draw = ImageDraw.Draw(image)
+    color = MONTH_COLORS.get(data["month"], "#000000")
+
+    activities = data["activities"]
+    total = len(activities)
+    height = box_height(total) if total else 0
+
+    for index, activity in enumerate(activities):
+        top = PADDING_TOP + index * (height + BOX_GAP)
+
+        # Date
+        draw.rectangle([PADDING_LEFT, top, PADDING_LEFT + DATE_WIDTH, top + height], fill="white")
+        date_size = DATE_FONT_SIZE if len(activity["date"]) < 5 else DATE_SMALL_FONT_SIZE
+        draw.text((PADDING_LEFT + DATE_WIDTH / 2, top + height / 2), activity["date"], fill=color,
+                  font=get_font(DATE_FONT, date_size), anchor="mm")
+
+        # Title and hour
+        left = PADDING_LEFT + DATE_WIDTH + TITLE_MARGIN
+        size, lines, fits = fit_title(activity, title_width(index, total), height)
+        font = get_font(TITLE_FONT, size)
+        line_height = size * TITLE_LINE_HEIGHT
+        y = top + (height - len(lines) * line_height) / 2
+        for line in lines:
+            draw.rectangle([left, y, left + text_length(line, TITLE_FONT, size), y + line_height], fill=color)
+            draw.text((left, y + line_height / 2), line, fill="white", font=font, anchor="lm")
+            y += line_height
+
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+def find_calendar_image(wmb_calendar):
+    """
+    Function to look for an already drawn image of a calendar page. The fingerprint of the current image of
+    each calendar is kept in the cache until one of its activities, the calendar or its month changes, so
+    a cached page costs no query
+
+    :param wmb_calendar: Calendar object
+    :return: Tuple with the fingerprint, the render data (None if not needed) and the image (None if not drawn yet)
+    """
+    fingerprint = get_calendar_pointer(wmb_calendar.pk)
+    image = read_cached_image(fingerprint) if fingerprint else None
+    if image is not None:
+        return fingerprint, None, image
+
+    data = calendar_render_data(wmb_calendar)
+    fingerprint = calendar_fingerprint(data)
+    return fingerprint, data, read_cached_image(fingerprint)
+
+
+def render_calendar_image(wmb_calendar):
+    """
+    Function to get the image of a calendar page, drawing it only if the same content was not drawn before
+
+    :param wmb_calendar: Calendar object
+    :return: PNG image, in bytes
+    """
+    fingerprint, data, image = find_calendar_image(wmb_calendar)
+    if image is None:
+        image = render_calendar(data)
+        write_cached_image(fingerprint, image)
+    set_calendar_pointer(wmb_calendar.pk, fingerprint)
+    return image
+
+
+def year_calendars(year):
+    """
+    Function to get the calendar pages of a year, in the order they are printed
+
+    :param year: Year of the calendars
+    :return: Queryset of Calendar objects
+    """
+    return Calendar.objects.filter(year=year).select_related("calendar").order_by("calendar__month", "page")
+
+
+def render_calendar_images(calendars, workers=None):
+    """
+    Generator that yields the image of each calendar page. The pages that were not drawn before are drawn
+    in parallel by a pool of processes, which only receive the render data, and are yielded in order as
+    soon as they are ready
+
+    :param calendars: Iterable of Calendar objects
+    :param workers: Maximum number of processes, the number of CPUs by default
+    :return: Tuples with the Calendar object and its PNG image, in bytes
+    """
+    pages = [(wmb_calendar,) + find_calendar_image(wmb_calendar) for wmb_calendar in calendars]
+    missing = [data for wmb_calendar, fingerprint, data, image in pages if image is None]
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    rendered = executor.map(render_calendar, missing) if executor else map(render_calendar, missing)
+    try:
+        for wmb_calendar, fingerprint, data, image in pages:
+            if image is None:
+                image = next(rendered)
+                write_cached_image(fingerprint, image)
+            set_calendar_pointer(wmb_calendar.pk, fingerprint)
+            yield wmb_calendar, image
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def calendar_image_filename(wmb_calendar):
+    return "calendario_{}_{}_{}.png".format(wmb_calendar.year, wmb_calendar.calendar.month, wmb_calendar.page)
+
+
+def stream_calendars_zip(calendars, workers=None):
+    """
+    Generator that yields a ZIP file with the image of each calendar page, one page at a time.
+    The images are already compressed, so they are stored as they are
+
+    :param calendars: Iterable of Calendar objects
+    :param workers: Maximum number of processes drawing the pages
+    :return: Chunks of the ZIP file
+    """
+    stream = ZipStream()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as zf:
+        for wmb_calendar, image in render_calendar_images(calendars, workers):
+            zf.writestr(calendar_image_filename(wmb_calendar), image)
+            yield stream.collect()
+    yield stream.collect()
+
+
+def make_pdf_of_calendars(calendars, workers=None):
+    """
+    Function to build a PDF with one calendar page per sheet
+
+    :param calendars: Iterable of Calendar objects
+    :param workers: Maximum number of processes drawing the pages
+    :return: PDF file, in bytes
+    """
+    pdf = FPDF(unit="pt", format=(PDF_PAGE_SIZE, PDF_PAGE_SIZE))
+    pdf.set_auto_page_break(False)
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (wmb_calendar, image) in enumerate(render_calendar_images(calendars, workers)):
+            path = os.path.join(directory, "{}.png".format(index))
+            with open(path, "wb") as image_file:
+                image_file.write(image)
+            pdf.add_page()
+            pdf.image(path, 0, 0, PDF_PAGE_SIZE, PDF_PAGE_SIZE)
+            os.remove(path)
+        return pdf.output(dest="S").encode("latin-1")
+
+
+ACTIVITY_COLUMNS = ["title", "date_start", "date_end", "hour_start", "custom_date"]
+ACTIVITY_TEXT_MAX_LENGTH = 280
+
+
+def unfold_ics_lines(content):
+    """
+    Function to join the lines of an iCalendar file that were folded, that is, broken
+    into lines starting with a space or a tab
+
+    :param content: Content of the iCalendar file
+    :return: List of unfolded lines
+    """
+    lines = []
+    for line in content.splitlines():
+        if line[:1] in (" ", "\t") and lines:
+            lines[-1] += line[1:]
+        elif line:
+            lines.append(line)
+    return lines
+
+
+def unescape_ics_text(text):
+    return re.sub(r"\\([\\;,nN])", lambda match: "\n" if match.group(1) in "nN" else match.group(1), text)
+
+
+def parse_ics_datetime(value, parameters):
+    """
+    Function to read the date and hour of an iCalendar DTSTART or DTEND property. Times in UTC
+    are converted to the time zone of the project
+
+    :param value: Value of the property, as YYYYMMDD or YYYYMMDDTHHMMSS[Z]
+    :param parameters: Parameters of the property, such as VALUE=DATE
+    :return: Tuple with the date and the hour (None for whole day events)
+    """
+    if "VALUE=DATE" in parameters or len(value) == 8:
+        return datetime.datetime.strptime(value[:8], "%Y%m%d").date(), None
+    moment = datetime.datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        moment = timezone.localtime(moment.replace(tzinfo=datetime.timezone.utc))
+    return moment.date(), moment.time()
+
+
+def read_activities_ics(content):
+    """
+    Function to read the events of an iCalendar file as activities. The end of a whole day event is
+    exclusive in iCalendar, so one day is subtracted from it
+
+    :param content: Content of the iCalendar file
+    :return: DataFrame with the columns of ACTIVITY_COLUMNS, as text
+    """
+    rows = []
+    event = None
+    for line in unfold_ics_lines(content):
+        name, _separator, value = line.partition(":")
+        name, *parameters = name.upper().split(";")
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event = {}
+        elif name == "END" and value.upper() == "VEVENT" and event is not None:
+            rows.append(event)
+            event = None
+        elif event is not None and name == "SUMMARY":
+            event["title"] = unescape_ics_text(value).strip()
+        elif event is not None and name in ("DTSTART", "DTEND"):
+            try:
+                date, hour = parse_ics_datetime(value.strip(), parameters)
+            except ValueError:
+                event["date_start" if name == "DTSTART" else "date_end"] = value
+                continue
+            if name == "DTSTART":
+                event["date_start"] = date.isoformat()
+                event["hour_start"] = hour.strftime("%H:%M") if hour else None
+            else:
+                event["date_end"] = (date - datetime.timedelta(days=1) if hour is None else date).isoformat()
+
+    df = pd.DataFrame(rows, columns=ACTIVITY_COLUMNS)
+    df.loc[df["date_end"] < df["date_start"], "date_end"] = df["date_start"]
+    return df
+
+
+def read_activities_file(activities_file):
+    """
+    Function to read a CSV or iCalendar file of activities
+
+    :param activities_file: Uploaded file, ending in .csv or .ics
+    :return: DataFrame with one activity per row
+    """
+    if activities_file.name.lower().endswith(".ics"):
+        return read_activities_ics(activities_file.read().decode("utf-8-sig"))
+    df = pd.read_csv(activities_file, dtype=str, keep_default_na=False)
+    df.columns = df.columns.str.strip()
+    df.replace("", pd.NA, inplace=True)
+    return df
+
+
+def validate_activities(df):
+    """
+    Function to validate all the activities of a file at once. Dates must be written as YYYY-MM-DD
+    and hours as HH:MM
+
+    :param df: DataFrame with one activity per row
+    :return: List of errors
+    """
+    if not {"title", "date_start"}.issubset(df.columns):
+        return [_("One or more required columns are missing. Verify and submit again")]
+    if df.empty:
+        return [_("Your file is empty. Verify and submit again")]
+
+    df = df.reindex(columns=ACTIVITY_COLUMNS)
+    title = df["title"].astype("string").str.strip()
+    date_start = pd.to_datetime(df["date_start"], format="%Y-%m-%d", errors="coerce")
+    date_end = pd.to_datetime(df["date_end"], format="%Y-%m-%d", errors="coerce")
+    hour_start = pd.to_datetime(df["hour_start"], format="%H:%M", errors="coerce")
+
+    checks = [
+        (title.isna() | (title == "") | (title.str.len() > ACTIVITY_TEXT_MAX_LENGTH),
+         _("Title invalid! Verify row %(row)s, column 'title'")),
+        (date_start.isna(), _("Start date invalid! Verify row %(row)s, column 'date_start'")),
+        ((df["date_end"].notna() & date_end.isna()) | (date_end < date_start),
+         _("End date invalid! Verify row %(row)s, column 'date_end'")),
+        (df["hour_start"].notna() & hour_start.isna(), _("Hour invalid! Verify row %(row)s, column 'hour_start'")),
+        (df["custom_date"].astype("string").str.len() > ACTIVITY_TEXT_MAX_LENGTH,
+         _("Custom date invalid! Verify row %(row)s, column 'custom_date'")),
+    ]
+    errors = sorted((position, index, message)
+                    for index, (invalid, message) in enumerate(checks)
+                    for position in np.flatnonzero(invalid.fillna(False).to_numpy(dtype=bool)))
+    return [message % {"row": position + 1} for position, index, message in errors]
+
+
+def format_columns(template, columns):
+    """
+    Function to fill a format string with whole columns at once
+
+    :param template: Format string, such as "{d_start} to {d_end}"
+    :param columns: Dictionary of placeholder names to Series
+    :return: Series with the formatted text
+    """
+    result = pd.Series("", index=next(iter(columns.values())).index)
+    for literal, field, format_spec, conversion in Formatter().parse(str(template)):
+        result = result + literal
+        if field is not None:
+            result = result + columns[field].astype(str)
+    return result
+
+
+def format_custom_dates(date_start, date_end):
+    """
+    Function to compute the custom date of many activities at once, following Activity.calculate_custom_date
+
+    :param date_start: Series of start dates
+    :param date_end: Series of end dates
+    :return: Series with the custom dates
+    """
+    columns = {"d_start": date_start.dt.day, "d_end": date_end.dt.day,
+               "m_start": date_start.dt.month, "m_end": date_end.dt.month}
+    return pd.Series(np.select(
+        [date_start == date_end, date_start.dt.month == date_end.dt.month],
+        [format_columns(_("{d_start}"), columns), format_columns(_("{d_start} to {d_end}"), columns)],
+        default=format_columns(_("{m_start}/{d_start} to {m_end}/{d_end}"), columns)), index=date_start.index)
+
+
+def import_activities(wmb_calendar, df):
+    """
+    Function to create the activities of a validated file with a single insertion. As bulk_create
+    does not send signals, the cached images and pages of the calendar are invalidated here
+
+    :param wmb_calendar: Calendar object the activities belong to
+    :param df: DataFrame validated by validate_activities
+    :return: List of the Activity objects created
+    """
+    df = df.reindex(columns=ACTIVITY_COLUMNS)
+    title = df["title"].str.strip()
+    date_start = pd.to_datetime(df["date_start"], format="%Y-%m-%d")
+    date_end = pd.to_datetime(df["date_end"], format="%Y-%m-%d").fillna(date_start)
+    hour_start = pd.to_datetime(df["hour_start"], format="%H:%M")
+    custom_date = df["custom_date"].astype("string").str.strip().replace("", pd.NA)
+    custom_date = custom_date.fillna(format_custom_dates(date_start, date_end))
+
+    activities = [
+        Activity(calendar=wmb_calendar,
+                 title=row_title,
+                 date_start=row_date_start.date(),
+                 date_end=row_date_end.date(),
+                 hour_start=None if pd.isna(row_hour_start) else row_hour_start.time(),
+                 custom_date=row_custom_date)
+        for row_title, row_date_start, row_date_end, row_hour_start, row_custom_date
+        in zip(title, date_start, date_end, hour_start, custom_date)
+    ]
+    with transaction.atomic():
+        activities = Activity.objects.bulk_create(activities, batch_size=500)
+    invalidate_calendars([wmb_calendar.pk])
+    touch_calendars()
+    return activities
+
+
+def escape_ics_text(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def fold_ics_line(line):
+    """
+    Function to break a line of an iCalendar file in lines of at most 75 bytes, as required by the format.
+    The continuation lines start with a space
+
+    :param line: Content line
+    :return: Folded line, without the final line break
+    """
+    parts = []
+    current = ""
+    for char in line:
+        limit = 75 if not parts else 74
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = char
+        else:
+            current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def activities_to_ics(activities, name, modified_at):
+    """
+    Function to write activities as an iCalendar feed. Activities with an hour start at that hour,
+    in UTC, and the others are whole day events, whose end is exclusive
+
+    :param activities: Iterable of dictionaries with the id, title, date_start, date_end and hour_start of each activity
+    :param name: Name of the feed, shown by calendar clients
+    :param modified_at: Timestamp of the last change of the activities
+    :return: iCalendar file, in bytes
+    """
+    stamp = datetime.datetime.fromtimestamp(modified_at, tz=datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = ["BEGIN:VCALENDAR",
+             "VERSION:2.0",
+             "PRODID:-//Wikimedia Brasil//WMB calendars//PT",
+             "CALSCALE:GREGORIAN",
+             "METHOD:PUBLISH",
+             "X-WR-CALNAME:" + escape_ics_text(str(name))]
+    for activity in activities:
+        if not activity["date_start"]:
+            continue
+        date_end = activity["date_end"] or activity["date_start"]
+        lines += ["BEGIN:VEVENT",
+                  "UID:activity-{}@wmb".format(activity["id"]),
+                  "DTSTAMP:" + stamp,
+                  "SUMMARY:" + escape_ics_text(activity["title"])]
+        if activity["hour_start"]:
+            for prop, date in (("DTSTART", activity["date_start"]), ("DTEND", date_end)):
+                moment = timezone.make_aware(datetime.datetime.combine(date, activity["hour_start"]))
+                lines.append("{}:{}".format(prop, moment.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")))
+        else:
+            lines += ["DTSTART;VALUE=DATE:" + activity["date_start"].strftime("%Y%m%d"),
+                      "DTEND;VALUE=DATE:" + (date_end + datetime.timedelta(days=1)).strftime("%Y%m%d")]
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(fold_ics_line(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+def calendar_feed(scope, activities, name):
+    """
+    Function to get an iCalendar feed, serializing it only once after each change of the calendars.
+    The moment of the last change is part of the cache key, so the activities are only queried on a miss
+
+    :param scope: Identifier of the feed, such as "calendar-1" or "year-2024"
+    :param activities: Queryset of Activity objects
+    :param name: Name of the feed
+    :return: iCalendar file, in bytes
+    """
+    modified_at = get_calendars_last_modified()
+    key = "calendar_feed:{}:{}:{}".format(scope, translation.get_language(), modified_at)
+    feed = cache.get(key)
+    if feed is None:
+        activities = activities.order_by("date_start", "hour_start", "id").values("id", "title", "date_start",
+                                                                                  "date_end", "hour_start")
+        feed = activities_to_ics(activities, name, modified_at)
+        cache.set(key, feed, CALENDAR_POINTER_TIMEOUT)
+    return feed
+
+
+def calendar_embed_data(wmb_calendar):
+    """
+    Function to serialize a calendar for the public embed, with plain values only, so it can be cached
+
+    :param wmb_calendar: Calendar object, with its month calendar already loaded
+    :return: Dictionary with the calendar and its activities
+    """
+    activities = wmb_calendar.activities.order_by("date_start", "id").values("title", "date_start", "date_end",
+                                                                           "hour_start", "custom_date")
+    return {
+        "id": wmb_calendar.pk,
+        "name": str(wmb_calendar),
+        "year": wmb_calendar.year,
+        "month": wmb_calendar.calendar.month,
+        "page": wmb_calendar.page,
+        "activities": [
+            {
+                "title": activity["title"],
+                "date_start": activity["date_start"].isoformat() if activity["date_start"] else None,
+                "date_end": activity["date_end"].isoformat() if activity["date_end"] else None,
+                "hour_start": activity["hour_start"].strftime("%H:%M") if activity["hour_start"] else None,
+                "custom_date": activity["custom_date"] or "",
+            }
+            for activity in activities
+        ],
+    }
+
+
+def calendar_embed_scope(pk=None):
+    """
+    Function to identify what an embed shows: a given calendar, or the current month, which changes
+    with the date even if no calendar is edited
+
+    :param pk: Id of the Calendar object
+    :return: Id of the calendar, or a string with the current month
+    """
+    return pk if pk is not None else "current:{:%Y-%m}".format(timezone.localdate())
+
+
+def calendar_embed(pk=None):
+    """
+    Function to get the public embed of a calendar, or of the first page of the current month if no calendar
+    is given. It is cached until the calendars change. Calendars that don't exist are not cached, so
+    arbitrary ids can't fill the cache, except the current month, which only has one key
+
+    :param pk: Id of the Calendar object
+    :return: Dictionary built by calendar_embed_data, or None if there is no such calendar
+    """
+    modified_at = get_calendars_last_modified()
+    today = timezone.localdate()
+    key = "calendar_embed:{}:{}:{}".format(calendar_embed_scope(pk), translation.get_language(), modified_at)
+    data = cache.get(key)
+    if data is None:
+        calendars = Calendar.objects.select_related("calendar")
+        if pk is not None:
+            wmb_calendar = calendars.filter(pk=pk).first()
+        else:
+            wmb_calendar = (calendars.filter(year=today.year, calendar__month="{:02d}".format(today.month))
+                            .order_by("page").first())
+        data = calendar_embed_data(wmb_calendar) if wmb_calendar else {}
+        if data or pk is None:
+            cache.set(key, data, CALENDAR_POINTER_TIMEOUT)
+    return data or None
@@ -1,11 +1,25 @@
+import hashlib
+import datetime
 from calendar import calendar
 
+import pandas as pd
+from django.db.models import Count
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse, Http404, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
-from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.clickjacking import xframe_options_exempt
+from django.views.decorators.http import condition
+from django.utils.translation import gettext_lazy as _, get_language
 
+from .cache import get_calendars_last_modified
 from .models import MonthCalendar, Calendar, Activity
-from .forms import MonthCalendarForm, CalendarForm, ActivityForm, ActivityFormSet, ActivityEditForm
+from .forms import MonthCalendarForm, CalendarForm, ActivityForm, ActivityFormSet, ActivityEditForm, ActivityImportForm
+from .utils import (render_calendar_image, calendar_image_filename, year_calendars, stream_calendars_zip,
+                    make_pdf_of_calendars, read_activities_file, validate_activities, import_activities,
+                    calendar_feed, calendar_embed, calendar_embed_scope, calendar_layout, apply_calendar_layout)
 
 
 # ======================================================================================================================
@@ -78,17 +92,10 @@ def calendar_update(request, pk):
 
 
 def calendar_detail(request, pk):
-    calendar = get_object_or_404(Calendar, pk=pk)
-    activities = calendar.activities.all().order_by('date_start')
-    serialized_activities = [
-        {
-            "title": activity.title,
-            "date": activity.custom_date if activity.custom_date else "",
-            "hour_start": activity.hour_start.strftime("%Hh%M").replace("h00", "h") if activity.hour_start else "",
-        }
-        for activity in activities
-    ]
-    context = {"calendar": calendar, "activities": serialized_activities, "media_url": settings.MEDIA_URL, "static_url": settings.STATIC_URL}
+    calendar = get_object_or_404(Calendar.objects.select_related("calendar"), pk=pk)
+    activities = (calendar.activities.order_by("date_start", "id")
+                  .values("id", "title", "custom_date", "date_start", "date_end", "hour_start"))
+    context = {"calendar": calendar, "activities": activities, "last_modified": get_calendars_last_modified()}
     return render(request, 'calendars/calendar_detail.html', context)
 
 
@@ -99,8 +106,15 @@ def format_hour(hour):
 
 
 def calendar_list(request):
-    calendars = Calendar.objects.all().order_by('-year', '-calendar__id', '-page')
-    context = {"calendars": calendars}
+    years = list(Calendar.objects.order_by('-year').values_list('year', flat=True).distinct())
+    try:
+        year = int(request.GET["year"])
+    except (KeyError, ValueError):
+        year = years[0] if years else None
+
+    calendars = (Calendar.objects.filter(year=year).select_related('calendar')
+                 .annotate(number_of_activities=Count('activities')).order_by('-calendar__id', '-page'))
+    context = {"calendars": calendars, "years": years, "year": year, "last_modified": get_calendars_last_modified()}
     return render(request, 'calendars/calendar_list.html', context)
 
 
@@ -114,16 +128,114 @@ def calendar_delete(request, pk):
 
 
 def calendar_download(request, pk):
-    wmb_calendar = get_object_or_404(Calendar, pk=pk)
-    if wmb_calendar:
-        activities = Activity.objects.filter(calendar=wmb_calendar)
-        context = {"wmb_calendar": wmb_calendar,
-                   "activities": activities,
-                   "MEDIA_URL": settings.MEDIA_URL}
-        return render(request, "calendars/calendar_download.html", context)
+    wmb_calendar = get_object_or_404(Calendar.objects.select_related("calendar"), pk=pk)
+    response = HttpResponse(render_calendar_image(wmb_calendar), content_type="image/png")
+    response["Content-Disposition"] = 'attachment; filename="{}"'.format(calendar_image_filename(wmb_calendar))
+    return response
+
+
+def calendar_layout_check(request, pk):
+    calendar = get_object_or_404(Calendar.objects.select_related("calendar"), pk=pk)
+    layout = calendar_layout(calendar)
+    if request.method == "POST" and len(layout["pages"]) > 1:
+        apply_calendar_layout(calendar, [[activity["id"] for activity in page] for page in layout["pages"]])
+        return redirect(reverse("calendars:calendar_list") + "?year={}".format(calendar.year))
 
+    context = {"calendar": calendar, "layout": layout}
+    return render(request, "calendars/calendar_layout.html", context)
 
 
+def calendar_year_download(request, year):
+    calendars = list(year_calendars(year))
+    if not calendars:
+        raise Http404
+
+    # Pages are drawn serially in the web process; the export_calendar_year command draws them in parallel
+    if request.GET.get("format") == "zip":
+        response = StreamingHttpResponse(stream_calendars_zip(calendars, workers=1), content_type="application/zip")
+        response["Content-Disposition"] = 'attachment; filename="calendario_{}.zip"'.format(year)
+    else:
+        response = HttpResponse(make_pdf_of_calendars(calendars, workers=1), content_type="application/pdf")
+        response["Content-Disposition"] = 'attachment; filename="calendario_{}.pdf"'.format(year)
+    return response
+
+
+# ======================================================================================================================
+# ICALENDAR FEEDS AND PUBLIC EMBED
+# ======================================================================================================================
+def calendars_etag(request, *args, **kwargs):
+    return hashlib.md5("{}:{}:{}".format(request.path, get_language(), get_calendars_last_modified())
+                       .encode("utf-8")).hexdigest()
+
+
+def calendars_last_modified(request, *args, **kwargs):
+    return datetime.datetime.fromtimestamp(get_calendars_last_modified(), tz=datetime.timezone.utc)
+
+
+def feed_response(feed, filename):
+    response = HttpResponse(feed, content_type="text/calendar; charset=utf-8")
+    response["Content-Disposition"] = 'inline; filename="{}"'.format(filename)
+    return response
+
+
+@condition(etag_func=calendars_etag, last_modified_func=calendars_last_modified)
+def calendar_feed_detail(request, pk):
+    wmb_calendar = get_object_or_404(Calendar.objects.select_related("calendar"), pk=pk)
+    feed = calendar_feed("calendar-{}".format(pk), wmb_calendar.activities.all(), wmb_calendar)
+    return feed_response(feed, "calendario_{}_{}_{}.ics".format(wmb_calendar.year, wmb_calendar.calendar.month,
+                                                                 wmb_calendar.page))
+
+
+@condition(etag_func=calendars_etag, last_modified_func=calendars_last_modified)
+def calendar_feed_year(request, year):
+    feed = calendar_feed("year-{}".format(year), Activity.objects.filter(calendar__year=year),
+                         _("Wikimedia Brasil activities in %(year)s") % {"year": year})
+    return feed_response(feed, "calendario_{}.ics".format(year))
+
+
+@condition(etag_func=calendars_etag, last_modified_func=calendars_last_modified)
+def calendar_feed_all(request):
+    feed = calendar_feed("all", Activity.objects.all(), _("Wikimedia Brasil activities"))
+    return feed_response(feed, "calendario.ics")
+
+
+def embed_etag(request, pk=None):
+    return hashlib.md5("{}:{}:{}:{}".format(request.path, get_language(), get_calendars_last_modified(),
+                                            calendar_embed_scope(pk)).encode("utf-8")).hexdigest()
+
+
+def embed_last_modified(request, pk=None):
+    # The embed of the current month changes when the month does, even if no calendar was edited
+    last_modified = calendars_last_modified(request)
+    if pk is None:
+        month_start = timezone.make_aware(datetime.datetime.combine(timezone.localdate().replace(day=1), datetime.time()))
+        last_modified = max(last_modified, month_start)
+    return last_modified
+
+
+def embed_response(response):
+    patch_cache_control(response, public=True, max_age=settings.CALENDAR_EMBED_MAX_AGE,
+                        stale_while_revalidate=settings.CALENDAR_EMBED_MAX_AGE * 24)
+    response["Access-Control-Allow-Origin"] = "*"
+    return response
+
+
+@condition(etag_func=embed_etag, last_modified_func=embed_last_modified)
+def calendar_embed_json(request, pk=None):
+    data = calendar_embed(pk)
+    if data is None:
+        raise Http404
+    return embed_response(JsonResponse(data))
+
+
+@xframe_options_exempt
+@condition(etag_func=embed_etag, last_modified_func=embed_last_modified)
+def calendar_embed_html(request, pk=None):
+    data = calendar_embed(pk)
+    if data is None:
+        raise Http404
+    return embed_response(render(request, "calendars/calendar_embed.html", {"calendar": data}))
+
 
 # ======================================================================================================================
 # ACTIVITY CRUD
@@ -157,6 +269,28 @@ def activity_create_in_bulk(request, calendar_id):
     return render(request, "calendars/activity_create_in_bulk.html", context)
 
 
+def activity_import(request, calendar_id):
+    calendar = get_object_or_404(Calendar.objects.select_related("calendar"), pk=calendar_id)
+    form = ActivityImportForm(request.POST or None, request.FILES or None)
+    if request.method == "POST" and form.is_valid():
+        try:
+            df = read_activities_file(form.cleaned_data["activities_file"])
+            errors = validate_activities(df)
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError):
+            errors = [_("The file could not be read. Verify and submit again")]
+
+        if errors:
+            form.add_error(None, _("Errors in the file:"))
+            for err in errors:
+                form.add_error(None, err)
+        else:
+            import_activities(calendar, df)
+            return redirect(reverse("calendars:calendar_detail", kwargs={"pk": calendar.id}))
+
+    context = {"form": form, "calendar": calendar}
+    return render(request, "calendars/activity_import.html", context)
+
+
 def activity_update(request, calendar_id, pk):
     activity = get_object_or_404(Activity, pk=pk)
     calendar = get_object_or_404(Calendar, pk=calendar_id)
@@ -0,0 +1,41 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+from users.models import normalize_username
+
+PORTFOLIO_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def portfolio_version_key(username):
+    """
+    Function to build the cache key that holds the current version of a participant's
+    certificate portfolio. The normalized username is hashed so any character is accepted by the cache backend
+
+    :param username: Wikimedia username of the participant
+    :return: Cache key
+    """
+    return "certificate_portfolio:" + hashlib.md5(str(normalize_username(username)).encode("utf-8")).hexdigest()
+
+
+def get_portfolio_version(username):
+    """
+    Function to get the version of the cached portfolio of a participant, creating a new one if needed.
+    The version is part of the template fragment cache key, so replacing it invalidates the fragment
+
+    :param username: Wikimedia username of the participant
+    :return: Version string
+    """
+    return cache.get_or_set(portfolio_version_key(username), uuid.uuid4().hex, PORTFOLIO_CACHE_TIMEOUT)
+
+
+def invalidate_portfolios(usernames):
+    """
+    Function to invalidate the cached portfolio of one or more participants
+
+    :param usernames: Iterable of Wikimedia usernames
+    """
+    keys = [portfolio_version_key(username) for username in set(usernames) if username]
+    if keys:
+        cache.delete_many(keys)
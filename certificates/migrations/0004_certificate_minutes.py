@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:20
+
+import re
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_minutes(apps, schema_editor):
+    Certificate = apps.get_model('certificates', 'Certificate')
+    batch = []
+    for certificate in Certificate.objects.only('id', 'hours').order_by('id').iterator(chunk_size=BATCH_SIZE):
+        match = re.match(r"^(\d+)[h,H](\d+)$", certificate.hours or "")
+        certificate.minutes = int(match.group(1)) * 60 + int(match.group(2)) if match else 0
+        batch.append(certificate)
+        if len(batch) >= BATCH_SIZE:
+            Certificate.objects.bulk_update(batch, ['minutes'])
+            batch = []
+    if batch:
+        Certificate.objects.bulk_update(batch, ['minutes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certificates', '0003_certificate_with_hours'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='certificate',
+            name='minutes',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_minutes, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,54 @@
 from django.conf import settings
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Sum
+from django.db.models.functions import ExtractYear
 from events.models import Event
 from users.models import User, Participant
 import hashlib
+import re
 
 PRONOUN_CHOICES = [('a', 'a'), ('o', 'o')]
+HOURS_REGEX = r"^\d+[h,H]\d+$"
+
+
+def hours_to_minutes(hours):
+    """
+    Converts a credit hours string in the HHhMM format into minutes
+
+    :param hours: String such as "12h30"
+    :return: Number of minutes, or None if the string is not in the expected format
+    """
+    match = re.match(r"^(\d+)[h,H](\d+)$", str(hours or ""))
+    if not match:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def minutes_to_hours(minutes):
+    """
+    Converts a number of minutes back into the HHhMM format used by the certificates
+
+    :param minutes: Number of minutes
+    :return: String such as "12h30"
+    """
+    minutes = int(minutes or 0)
+    return "{}h{:02d}".format(minutes // 60, minutes % 60)
+
+
+class CertificateQuerySet(models.QuerySet):
+    def total_minutes(self):
+        return self.aggregate(total=Sum("minutes"))["total"] or 0
+
+    def minutes_per_participant(self):
+        return self.filter(username__isnull=False).values("username").annotate(minutes=Sum("minutes")).order_by("username")
+
+    def minutes_per_event(self):
+        return self.filter(event__isnull=False).values("event").annotate(minutes=Sum("minutes")).order_by("event")
+
+    def minutes_per_year(self):
+        return (self.filter(event__isnull=False).annotate(year=ExtractYear("event__date_start"))
+                .values("year").annotate(minutes=Sum("minutes")).order_by("year"))
 
 
 class Certificate(models.Model):
@@ -13,7 +56,8 @@ class Certificate(models.Model):
     username = models.ForeignKey(Participant, on_delete=models.SET_NULL, null=True, blank=True)
     pronoun = models.CharField(max_length=200, choices=PRONOUN_CHOICES, default='o')
     event = models.ForeignKey(Event, on_delete=models.SET_NULL, related_name='event_certificates', null=True)
-    hours = models.CharField(max_length=10, validators=[RegexValidator(regex=r"^\d+[h,H]\d+$")])
+    hours = models.CharField(max_length=10, validators=[RegexValidator(regex=HOURS_REGEX)])
+    minutes = models.PositiveIntegerField(default=0, editable=False)
     with_hours = models.BooleanField(default=True)
     role = models.CharField(max_length=200, default='ouvinte')
     background = models.ImageField(upload_to=settings.UPLOAD_FOLDER)
@@ -25,6 +69,8 @@ class Certificate(models.Model):
                                    blank=True,
                                    null=True)
 
+    objects = CertificateQuerySet.as_manager()
+
     permissions = [
         ("download_all", "Can download all certificates"),
     ]
@@ -39,7 +85,11 @@ class Certificate(models.Model):
         if not self.certificate_hash:
             self.certificate_hash = certificate_hash
 
-        super().save(*args, **kwargs)
+        self.minutes = hours_to_minutes(self.hours) or 0
+
+        # The signals that update the event statistics run before and after the save, in its transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         if self.username:
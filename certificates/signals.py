@@ -0,0 +1,60 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from certificates.cache import invalidate_portfolios
+from certificates.models import Certificate
+from events.models import Event
+from users.models import Participant
+
+
+def participant_usernames(participant_ids):
+    return Participant.objects.filter(pk__in=participant_ids).values_list("participant_username", flat=True)
+
+
+@receiver(pre_save, sender=Certificate)
+def invalidate_previous_certificate_portfolio(sender, instance, raw=False, **kwargs):
+    if raw or not instance.pk:
+        return
+    previous = Certificate.objects.filter(pk=instance.pk).values_list("username", flat=True).first()
+    if previous and previous != instance.username_id:
+        invalidate_portfolios(participant_usernames([previous]))
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+def invalidate_certificate_portfolio(sender, instance, **kwargs):
+    if instance.username_id:
+        invalidate_portfolios(participant_usernames([instance.username_id]))
+
+
+@receiver(pre_save, sender=Participant)
+def invalidate_previous_participant_portfolio(sender, instance, raw=False, **kwargs):
+    if raw or not instance.pk:
+        return
+    invalidate_portfolios(participant_usernames([instance.pk]))
+
+
+@receiver(post_save, sender=Participant)
+def invalidate_participant_portfolio(sender, instance, **kwargs):
+    invalidate_portfolios([instance.participant_username])
+
+
+@receiver(post_save, sender=Event)
+def invalidate_event_portfolios(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    invalidate_portfolios(Participant.objects.filter(certificate__event=instance)
+                          .values_list("participant_username", flat=True).distinct())
+
+
+@receiver(pre_delete, sender=Event)
+def collect_event_portfolios(sender, instance, **kwargs):
+    # The certificates lose their event with a bulk SET_NULL, which sends no signal, so the
+    # participants are found while the certificates still point to the event
+    instance.portfolio_usernames = list(Participant.objects.filter(certificate__event=instance)
+                                        .values_list("participant_username", flat=True).distinct())
+
+
+@receiver(post_delete, sender=Event)
+def invalidate_deleted_event_portfolios(sender, instance, **kwargs):
+    invalidate_portfolios(getattr(instance, "portfolio_usernames", []))
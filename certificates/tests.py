@@ -2,6 +2,7 @@ import os
 import calendar
 import hashlib
 import tempfile
+import zipfile
 import pandas as pd
 from io import BytesIO
 from PIL import Image
@@ -14,21 +15,43 @@ from unittest.mock import MagicMock, patch
 from PyPDF2 import PdfReader
 
 from django.conf import settings
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.core.files import File
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils.datastructures import MultiValueDictKeyError
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
-from certificates.models import Certificate
-from certificates.utils import clean_string, build_role, make_pdf_of_certificate, validate_csv, certificate_create, format_certificate_date
+from certificates.models import Certificate, hours_to_minutes, minutes_to_hours
+from certificates.utils import certificate_validation_url, clean_string, build_role, make_pdf_of_certificate, stream_certificates_zip, validate_csv, certificate_create, format_certificate_date, resolve_participants, month_name
 from certificates.forms import UploadForm, CertificateForm, ValidateForm
+from certificates.views import participant_certificates
 
 from events.models import Event
 
 from users.models import User, Participant
+from wmb.qrcodes import qr_code_png, qr_code_file, encode_qr_code
+
+
+class QRCodeStoreMixin:
+    """
+    Keeps the QR codes drawn by a test in a temporary directory, and out of the memory of the process
+    """
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(QR_CODE_CACHE_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        qr_code_png.cache_clear()
+        self.addCleanup(qr_code_png.cache_clear)
 
 
 class CertificateViewsTest(TestCase):
@@ -286,8 +309,9 @@ def generate_valid_image():
     return SimpleUploadedFile("background.jpg", temp_file.read(), content_type="image/jpeg")
 
 
-class CertificateDownloadByHashTest(TestCase):
+class CertificateDownloadByHashTest(QRCodeStoreMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.user = User.objects.create_user(username="admin", password="admin")
         self.participant = Participant.objects.create(participant_username="johndoe")
         self.event = Event.objects.create(event_name="Test Event", date_start=date(2024, 1, 1))
@@ -320,7 +344,107 @@ class CertificateDownloadByHashTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, expected_redirect_url)
 
-class CertificateUtilsTest(TestCase):
+class CertificatePortfolioTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="johndoe", password="password")
+        self.participant = Participant.objects.create(participant_username="johndoe")
+        self.event = Event.objects.create(event_name="Test Event", date_start=date(2024, 1, 1))
+        self.other_event = Event.objects.create(event_name="Other Event", date_start=date(2024, 5, 1))
+        for event in (self.event, self.other_event):
+            Certificate.objects.create(name="John Doe", username=self.participant, event=event,
+                                       hours="10h30", background="background.png")
+        self.client.force_login(self.user)
+
+    def test_certificate_list_loads_events_in_the_same_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("certificates:certificate_list"))
+
+        self.assertContains(response, "Other Event")
+        certificate_queries = [query for query in queries if "certificates_certificate" in query["sql"]]
+        self.assertEqual(len(certificate_queries), 1)
+        self.assertEqual(len([query for query in queries if "events_event" in query["sql"]]), 1)
+
+    def test_certificate_list_is_served_from_cache(self):
+        self.client.get(reverse("certificates:certificate_list"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("certificates:certificate_list"))
+
+        self.assertContains(response, "Other Event")
+        self.assertFalse([query for query in queries if "certificates_certificate" in query["sql"]])
+
+    def test_certificate_list_cache_is_invalidated_when_certificates_change(self):
+        self.client.get(reverse("certificates:certificate_list"))
+        new_event = Event.objects.create(event_name="New Event", date_start=date(2024, 8, 1))
+        certificate = Certificate.objects.create(name="John Doe", username=self.participant, event=new_event,
+                                                 hours="01h00", background="background.png")
+        self.assertContains(self.client.get(reverse("certificates:certificate_list")), "New Event")
+
+        certificate.delete()
+        self.assertNotContains(self.client.get(reverse("certificates:certificate_list")), "New Event")
+
+        self.event.event_name = "Renamed Event"
+        self.event.save()
+        self.assertContains(self.client.get(reverse("certificates:certificate_list")), "Renamed Event")
+
+    def test_certificate_list_cache_is_invalidated_when_an_event_is_deleted(self):
+        self.assertContains(self.client.get(reverse("certificates:certificate_list")), "Other Event")
+
+        self.other_event.delete()
+        self.assertNotContains(self.client.get(reverse("certificates:certificate_list")), "Other Event")
+
+    def test_certificate_list_matches_usernames_case_insensitively(self):
+        self.participant.participant_username = "JohnDoe"
+        self.participant.save()
+
+        response = self.client.get(reverse("certificates:certificate_list"))
+        self.assertEqual(len(response.context["certificates"]), 2)
+
+    @patch("certificates.utils.make_pdf_of_certificate")
+    def test_certificate_download_all_streams_a_zip(self, mock_make_pdf):
+        mock_make_pdf.return_value.output.return_value = "%PDF"
+
+        response = self.client.get(reverse("certificates:certificate_download_all"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with zipfile.ZipFile(BytesIO(b"".join(response.streaming_content))) as zf:
+            self.assertEqual(sorted(zf.namelist()), ["Certificate - Other Event.pdf", "Certificate - Test Event.pdf"])
+            self.assertEqual(zf.read("Certificate - Test Event.pdf"), b"%PDF")
+
+    def test_certificate_download_all_requires_login(self):
+        self.client.logout()
+        response = self.client.get(reverse("certificates:certificate_download_all"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_participants_without_username_are_not_matched(self):
+        nameless = Participant.objects.create(participant_full_name="No Username")
+        certificate = Certificate.objects.create(name="No Username", username=nameless, event=self.event,
+                                                 hours="10h30", background="background.png")
+        self.client.logout()
+
+        response = self.client.get(reverse("certificates:certificate_list"))
+        self.assertEqual(response.status_code, 302)
+        self.assertQuerySetEqual(participant_certificates(""), [])
+        self.assertQuerySetEqual(participant_certificates("   "), [])
+
+        response = self.client.get(reverse("events:event_download", kwargs={"event_id": self.event.id,
+                                                                            "certificate_id": certificate.id}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_blank_username_does_not_reuse_participants_without_username(self):
+        nameless = Participant.objects.create(participant_full_name="No Username")
+        data = {"username_string": "   ", "name": "Someone Else", "pronoun": "N", "hours": "1h00", "role": "ouvinte"}
+
+        certificate = certificate_create(data, self.event, "background.png", self.user)
+
+        self.assertNotEqual(certificate.username, nameless)
+        self.assertEqual(Participant.objects.filter(participant_username_key__isnull=True).count(), 2)
+
+
+class CertificateUtilsTest(QRCodeStoreMixin, TestCase):
     def test_clean_string_with_string_with_invalid_characters(self):
         test_string = "Teste: String? wi*th spe<cial charac|ters"
         expected_string = "Teste String with special characters"
@@ -379,6 +503,18 @@ class CertificateUtilsTest(TestCase):
         response = format_certificate_date(date_start, date_end)
         self.assertEqual(response, expected_string)
 
+    def test_format_certificate_date_in_another_language(self):
+        date_start = date(2024, 3, 1)
+        expected_string = _("on {m_start} {d_start}, {y_start}").format(d_start=1, m_start="março", y_start=2024)
+        response = format_certificate_date(date_start, date_start, "pt-br")
+        self.assertEqual(response, expected_string)
+
+    def test_month_name(self):
+        self.assertEqual(month_name(1, "en"), "January")
+        self.assertEqual(month_name("12", "pt-br"), "dezembro")
+        with translation.override("pt-br"):
+            self.assertEqual(month_name(3), "março")
+
     def test_format_certificate_date_different_date_different_year(self):
         date_start = date(2024, 1, 1)
         date_end = date(2025, 12, 31)
@@ -549,6 +685,36 @@ class CertificateUtilsTest(TestCase):
         errors = validate_csv(df)
         self.assertIn("Role invalid! Verify row 1, column 'role'", errors)
 
+    def test_certificate_create_reuses_participant_with_different_case(self):
+        event = Event.objects.create(event_name="Test Event", date_start=date(2024, 1, 1))
+        participant = Participant.objects.create(participant_username="Foo", participant_full_name="Foo Bar")
+        data = {"name": "Foo Bar", "username": "foo", "pronoun": "o", "hours": "01h00", "role": "ouvinte"}
+
+        certificate = certificate_create(data, event, "background.png", None)
+
+        self.assertEqual(certificate.username, participant)
+        self.assertEqual(Participant.objects.count(), 1)
+
+    def test_resolve_participants_uses_a_single_lookup(self):
+        user = User.objects.create(username="admin")
+        existing = Participant.objects.create(participant_username="Foo")
+
+        with self.assertNumQueries(3):
+            participants = resolve_participants(["foo", "FOO", "Bar", "-", float("nan")], user)
+
+        self.assertEqual(set(participants), {"foo", "bar"})
+        self.assertEqual(participants["foo"], existing)
+        self.assertEqual(participants["bar"].participant_username, "Bar")
+        self.assertEqual(participants["bar"].created_by, user)
+
+    def test_resolve_participants_without_new_participants_runs_one_query(self):
+        Participant.objects.create(participant_username="Foo")
+
+        with self.assertNumQueries(1):
+            participants = resolve_participants(["foo", "Foo"], None)
+
+        self.assertEqual(len(participants), 1)
+
     def test_certificate_create_with_valid_form_succeeds_in_create_certificate(self):
         event = Event.objects.create(event_name="Test Event", date_start=date(2024,1,1))
         background = "Test Background.png"
@@ -682,6 +848,67 @@ class CertificateUtilsTest(TestCase):
         self.mock_structure(mock_image, certificate_name, expected_name)
 
 
+class CertificateQRCodeTest(QRCodeStoreMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.event = Event.objects.create(event_name="Test Event", date_start=date(2024, 1, 1), date_end=date(2024, 1, 2))
+        self.certificates = [Certificate.objects.create(name="Test Name {}".format(number), background="Test Background.png",
+                                                        event=self.event, hours="02h00", role="ouvinte")
+                             for number in range(2)]
+
+    def test_qr_code_is_encoded_once(self):
+        url = certificate_validation_url(self.certificates[0].certificate_hash)
+        self.assertEqual(url, "https://wmb.toolforge.org/certificates/validate/?certificate_hash=" + self.certificates[0].certificate_hash)
+
+        with patch("wmb.qrcodes.encode_qr_code", wraps=encode_qr_code) as mock_encode:
+            image = qr_code_png(url)
+            self.assertEqual(qr_code_png(url), image)
+            qr_code_png.cache_clear()
+            with open(qr_code_file(url), "rb") as image_file:
+                self.assertEqual(image_file.read(), image)
+            self.assertEqual(qr_code_png(url), image)
+        self.assertEqual(mock_encode.call_count, 1)
+
+        qr_code = Image.open(BytesIO(image))
+        self.assertEqual(qr_code.mode, "1")
+        self.assertEqual(qr_code.width, qr_code.height)
+
+    @patch('certificates.utils.FPDF.image')
+    def test_certificate_pdf_has_qr_code_of_the_validation_link(self, mock_image):
+        certificate = self.certificates[0]
+        make_pdf_of_certificate(certificate)
+
+        path = qr_code_file(certificate_validation_url(certificate.certificate_hash))
+        mock_image.assert_any_call(path, x=272, y=186, w=18, h=18, type='PNG')
+
+    @override_settings(SITE_URL="https://example.org")
+    @patch('certificates.utils.FPDF.cell')
+    @patch('certificates.utils.FPDF.image')
+    def test_certificate_pdf_validation_phrase_uses_the_site_url(self, mock_image, mock_cell):
+        make_pdf_of_certificate(self.certificates[0])
+
+        phrases = [call.kwargs["txt"] for call in mock_cell.call_args_list
+                   if self.certificates[0].certificate_hash in call.kwargs.get("txt", "")]
+        self.assertEqual(len(phrases), 1)
+        self.assertIn("https://example.org/", phrases[0])
+        self.assertNotIn("toolforge", phrases[0])
+
+    @patch('certificates.utils.FPDF.image')
+    def test_certificates_zip_encodes_each_qr_code_once(self, mock_image):
+        with patch("wmb.qrcodes.encode_qr_code", wraps=encode_qr_code) as mock_encode:
+            b"".join(stream_certificates_zip(self.certificates))
+            b"".join(stream_certificates_zip(self.certificates))
+        self.assertEqual(mock_encode.call_count, 2)
+
+    def test_certificate_validate_from_qr_code(self):
+        url = reverse("certificates:certificate_validate")
+        response = self.client.get(url, {"certificate_hash": self.certificates[0].certificate_hash})
+        self.assertTemplateUsed(response, "certificates/certificate_detail.html")
+
+        response = self.client.get(url, {"certificate_hash": "Test Certificate Hash"})
+        self.assertTemplateUsed(response, "certificates/certificate_validate.html")
+
+
 class UploadFormTest(TestCase):
     def setUp(self):
         self.event = Event.objects.create(event_name="Sample Event", date_start=date(2024, 1, 1))
@@ -928,3 +1155,43 @@ class CertificateModelTest(TestCase):
                 background=self.uploaded_file
             )
             certificate.full_clean()
+
+
+    def test_minutes_are_kept_in_sync_with_hours(self):
+        certificate = Certificate.objects.create(
+            name="John Doe",
+            event=self.event,
+            hours="12h30",
+            role="speaker",
+            background=self.uploaded_file
+        )
+        self.assertEqual(certificate.minutes, 750)
+
+        certificate.hours = "1H05"
+        certificate.save()
+        certificate.refresh_from_db()
+        self.assertEqual(certificate.minutes, 65)
+
+    def test_hours_totals_are_computed_in_sql(self):
+        other_event = Event.objects.create(event_name="Other Event", date_start=date(2025, 3, 1))
+        Certificate.objects.create(name="John Doe", username=self.participant, event=self.event, hours="10h30", background=self.uploaded_file)
+        Certificate.objects.create(name="John Doe", username=self.participant, event=other_event, hours="02h00", background=self.uploaded_file)
+        Certificate.objects.create(name="Jane Doe", event=other_event, hours="00h45", background=self.uploaded_file)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(Certificate.objects.total_minutes(), 795)
+        self.assertEqual(list(Certificate.objects.minutes_per_participant()), [{"username": self.participant.id, "minutes": 750}])
+        self.assertEqual(list(Certificate.objects.minutes_per_event()), [{"event": self.event.id, "minutes": 630}, {"event": other_event.id, "minutes": 165}])
+        self.assertEqual(list(Certificate.objects.minutes_per_year()), [{"year": 2024, "minutes": 630}, {"year": 2025, "minutes": 165}])
+
+    def test_hours_to_minutes(self):
+        self.assertEqual(hours_to_minutes("12h30"), 750)
+        self.assertEqual(hours_to_minutes("0H05"), 5)
+        self.assertIsNone(hours_to_minutes("12 hours"))
+        self.assertIsNone(hours_to_minutes(""))
+        self.assertIsNone(hours_to_minutes(None))
+
+    def test_minutes_to_hours(self):
+        self.assertEqual(minutes_to_hours(750), "12h30")
+        self.assertEqual(minutes_to_hours(5), "0h05")
+        self.assertEqual(minutes_to_hours(None), "0h00")
@@ -6,5 +6,6 @@ app_name = "certificates"
 urlpatterns = [
     path('', views.certificate_list, name='certificate_list'),
     path('validate/', views.certificate_validate, name='certificate_validate'),
+    path('download/', views.certificate_download_all, name='certificate_download_all'),
     path('download/<str:certificate_hash>', views.certificate_download_by_hash, name='download_by_hash'),
 ]
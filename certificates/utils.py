@@ -1,22 +1,24 @@
 import io
 import os
-import re
 import math
-import locale
-import calendar
 import hashlib
 import pandas as pd
 import datetime
 import zipfile
+from functools import lru_cache
+from urllib.parse import urlencode
 from fpdf import FPDF
 
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.conf import settings
 from django.shortcuts import redirect, reverse, get_object_or_404
+from django.utils import translation
+from django.utils.dates import MONTHS
 from django.utils.translation import gettext_lazy as _
 
-from certificates.models import Certificate, PRONOUN_CHOICES
-from users.models import Participant
+from certificates.models import Certificate, PRONOUN_CHOICES, hours_to_minutes
+from users.models import Participant, normalize_username
+from wmb.qrcodes import qr_code_file
 
 
 class CertificationPDF(FPDF):
@@ -59,9 +61,36 @@ def build_role(role):
         return " como " + role
 
 
-def format_certificate_date(date_start, date_end):
+CERTIFICATE_LANGUAGE = "pt-br"
+
+
+@lru_cache(maxsize=None)
+def month_names(language):
+    """
+    Function to build the table of month names of a language from the Django translation catalogs,
+    so dates can be formatted without changing the locale of the process
+
+    :param language: Language code
+    :return: Tuple with the names of the twelve months
+    """
+    with translation.override(language):
+        return tuple(str(MONTHS[month]) for month in range(1, 13))
+
+
+def month_name(month, language=None):
+    """
+    Function to get the name of a month
+
+    :param month: Number of the month, from 1 to 12
+    :param language: Language code, the active language by default
+    :return: Name of the month
+    """
+    return month_names(language or translation.get_language() or settings.LANGUAGE_CODE)[int(month) - 1]
+
+
+def format_certificate_date(date_start, date_end, language=None):
     d_start, d_end = date_start.day, date_end.day
-    m_start, m_end = calendar.month_name[date_start.month], calendar.month_name[date_end.month]
+    m_start, m_end = month_name(date_start.month, language), month_name(date_end.month, language)
     y_start, y_end = date_start.year, date_end.year
 
     if date_start == date_end:
@@ -90,6 +119,11 @@ def format_certificate_date(date_start, date_end):
     return date_formatted
 
 
+def certificate_validation_url(certificate_hash):
+    return "{}{}?{}".format(settings.SITE_URL, reverse("certificates:certificate_validate"),
+                            urlencode({"certificate_hash": certificate_hash}))
+
+
 def make_pdf_of_certificate(certificate):
     # Create page
     pdf = CertificationPDF(orientation='L', unit='mm', format='A4')
@@ -108,7 +142,6 @@ def make_pdf_of_certificate(certificate):
     pdf.set_font('Merriweather', '', 35)  # Text of the body in Times New Roman, regular, 13 pt
 
     title_phrase = _('CERTIFICATE')
-    locale.setlocale(locale.LC_TIME, "pt_BR")  # Setting the language to portuguese for the date
     pdf.cell(w=0, h=10, border=0, ln=1, align='C', txt=str(title_phrase))
 
     identification_phrase = _('The Wikimedia Brasil chapter (CNPJ 29.801.908/0001-86) certifies that')
@@ -164,7 +197,9 @@ def make_pdf_of_certificate(certificate):
     #######################################################################################################
     pdf.set_font('Merriweather', '', 13)
 
-    phrase_date = format_certificate_date(certificate.event.date_start, certificate.event.date_end)
+    # The months of the certificate are always written in portuguese
+    phrase_date = format_certificate_date(certificate.event.date_start, certificate.event.date_end,
+                                          CERTIFICATE_LANGUAGE)
     if certificate.with_hours:
         phrase_time = _("%(date)s (Credit hours: %(hours)s).") % {"date": phrase_date, "hours": certificate.hours}
     else:
@@ -189,11 +224,12 @@ def make_pdf_of_certificate(certificate):
     pdf.cell(w=0, h=5, border=0, ln=1, align='C', txt=str(president_role))
 
     user_hash = certificate.certificate_hash
-    validation_phrase =_('The validity of this document can be checked at https://wmb.toolforge.org/. The hash code for validation is: %(certificate_hash)s') % {"certificate_hash": user_hash}
+    validation_phrase =_('The validity of this document can be checked at %(site_url)s/. The hash code for validation is: %(certificate_hash)s') % {"site_url": settings.SITE_URL, "certificate_hash": user_hash}
     pdf.in_footer = 1
     pdf.set_y(-16.5)
     pdf.set_font('Merriweather', '', 8.8)
     pdf.cell(w=0, h=5, border=0, ln=1, align='C', txt=str(validation_phrase))
+    pdf.image(qr_code_file(certificate_validation_url(user_hash)), x=272, y=186, w=18, h=18, type='PNG')
     pdf.in_footer = 0
 
     return pdf
@@ -214,7 +250,7 @@ def validate_csv(df):
                     errors.append(_("Name invalid! Verify row %(row)s, column 'name'") % {"row": i + 1})
                 if pd.isnull(row["pronoun"]) or not isinstance(row["pronoun"], str) or row["pronoun"].lower() not in {pronoun[0] for pronoun in PRONOUN_CHOICES}:
                     errors.append(_("Pronoun invalid! Verify row %(row)s, column 'pronoun'") % {"row": i + 1})
-                if pd.isnull(row["hours"]) or not isinstance(row["hours"], str) or not re.match(r"^\d+[h,H]\d+$", str(row["hours"])):
+                if pd.isnull(row["hours"]) or not isinstance(row["hours"], str) or hours_to_minutes(row["hours"]) is None:
                     errors.append(_("Hours invalid! Verify row %(row)s, column 'hours'") % {"row": i + 1})
                 if pd.isnull(row["role"]) or not isinstance(row["role"], str):
                     errors.append(_("Role invalid! Verify row %(row)s, column 'role'") % {"row": i + 1})
@@ -223,17 +259,49 @@ def validate_csv(df):
     return errors
 
 
+def resolve_participants(usernames, created_by):
+    """
+    Function to find the participants of a bulk import with a single lookup on the
+    normalized username, creating the ones that do not exist yet
+
+    :param usernames: Iterable of usernames, as they appear in the CSV file
+    :param created_by: User responsible for the import
+    :return: Dictionary of normalized usernames to Participant objects
+    """
+    usernames = {normalize_username(username): username.strip() for username in usernames
+                 if isinstance(username, str) and username.strip() != "-" and normalize_username(username)}
+    participants = {participant.participant_username_key: participant
+                    for participant in Participant.objects.filter(participant_username_key__in=usernames)}
+
+    missing = [Participant(participant_username=username,
+                           participant_username_key=key,
+                           created_by=created_by,
+                           modified_by=created_by,
+                           enrolled_at=datetime.datetime.today())
+               for key, username in usernames.items() if key not in participants]
+    if missing:
+        Participant.objects.bulk_create(missing)
+        created = Participant.objects.filter(participant_username_key__in=[participant.participant_username_key
+                                                                           for participant in missing])
+        participants.update({participant.participant_username_key: participant for participant in created})
+    return participants
+
+
 def certificate_create(data, event, background, emitted_by, with_hours=True):
     if "username_string" in data:
         certificate_user = data["username_string"]
     else:
         certificate_user = data["username"]
+    if isinstance(certificate_user, str) and not normalize_username(certificate_user):
+        certificate_user = None
     full_name = data["name"].strip()
 
     certificate_data = {}
     if certificate_user and certificate_user != "-":
         if isinstance(certificate_user, str):
-            certificate_user, created = Participant.objects.get_or_create(participant_username=certificate_user)
+            certificate_user, created = Participant.objects.get_or_create(
+                participant_username_key=normalize_username(certificate_user),
+                defaults={"participant_username": certificate_user})
             if created:
                 certificate_user.created_by = certificate_user.modified_by = emitted_by
                 certificate_user.enrolled_at = datetime.datetime.today()
@@ -285,11 +353,71 @@ def make_one_certificate_pdf(certificate):
     return response
 
 
+class ZipStream:
+    """
+    Write-only file-like object that keeps the bytes written by ZipFile until they are
+    collected, so a ZIP file can be streamed while it is being built
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+
+    def write(self, data):
+        self.buffer.extend(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def collect(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def stream_certificates_zip(certificates):
+    """
+    Generator that yields a ZIP file with the PDF of each certificate, one certificate at a time
+
+    :param certificates: Iterable of Certificate objects, with their events already loaded
+    :return: Chunks of the ZIP file
+    """
+    stream = ZipStream()
+    filenames = set()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for certificate in certificates:
+            filename = "{} - {}".format(_("Certificate"), clean_string(str(certificate.event)))
+            if filename in filenames:
+                filename = "{} ({})".format(filename, certificate.id)
+            filenames.add(filename)
+
+            pdf = make_pdf_of_certificate(certificate)
+            zf.writestr(filename + ".pdf", pdf.output(dest='S').encode('latin-1'))
+            yield stream.collect()
+    yield stream.collect()
+
+
+def download_participant_certificates(certificates, username):
+    response = StreamingHttpResponse(stream_certificates_zip(certificates), content_type='application/zip')
+    content_disposition = 'attachment; filename="{} - {}.zip"'.format(_("Certificates"), clean_string(username))
+    response['Content-Disposition'] = content_disposition
+    return response
+
+
 def download_certificate(event, certificate_id, user):
     if user.has_perm('certificates.download_all'):
         certificate = get_object_or_404(Certificate, event=event, pk=certificate_id)
     else:
-        certificate = get_object_or_404(Certificate, event=event, username__participant_username=user.username)
+        username_key = normalize_username(user.username)
+        if not username_key:
+            raise Http404
+        certificate = get_object_or_404(Certificate, event=event, pk=certificate_id,
+                                        username__participant_username_key=username_key)
 
     return make_one_certificate_pdf(certificate)
 
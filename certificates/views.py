@@ -1,14 +1,15 @@
 import datetime
 from django.shortcuts import render, redirect, reverse
-from django.contrib.auth.decorators import permission_required
+from django.contrib.auth.decorators import login_required, permission_required
 
 from certificates.forms import CertificateForm
 from certificates.models import Certificate
-from certificates.utils import certificate_create, make_one_certificate_pdf
+from certificates.cache import get_portfolio_version
+from certificates.utils import certificate_create, make_one_certificate_pdf, download_participant_certificates
 
 from events.models import Event
 
-from users.models import Participant
+from users.models import Participant, normalize_username
 
 
 @permission_required('certificates.add_certificate', raise_exception=True)
@@ -22,8 +23,10 @@ def certificate_create_manually(request, event_id):
     if number_of_certificates > 0:
         if request.method == "POST":
             username = form.data.get('username_string')
-            if username:
-                Participant.objects.get_or_create(participant_username=username)
+            username_key = normalize_username(username)
+            if username_key:
+                Participant.objects.get_or_create(participant_username_key=username_key,
+                                                  defaults={"participant_username": username})
 
             if form.is_valid():
                 background = Certificate.objects.filter(event=event).first().background
@@ -46,8 +49,9 @@ def certificate_update(request, event_id, certificate_id):
             form.save()
 
             username_string = form.cleaned_data.get('username_string')
-            if username_string:
-                participant = Participant.objects.filter(participant_username=username_string).first()
+            username_key = normalize_username(username_string)
+            if username_key:
+                participant = Participant.objects.filter(participant_username_key=username_key).first()
                 if participant:
                     certificate.username = participant
                     certificate.save()
@@ -79,16 +83,35 @@ def certificate_delete(request, event_id, certificate_id):
     return render(request, "certificates/certificate_delete.html", context)
 
 
+def participant_certificates(username):
+    username_key = normalize_username(username)
+    if not username_key:
+        return Certificate.objects.none()
+    return (Certificate.objects.filter(username__participant_username_key=username_key, event__isnull=False)
+            .select_related("event")
+            .order_by("-event__date_start", "-id"))
+
+
+@login_required
 def certificate_list(request):
     user = request.user
-    certificates = Certificate.objects.filter(username__participant_username=user.username)
-    context = {"certificates": certificates}
+    certificates = participant_certificates(user.username)
+    context = {"certificates": certificates, "portfolio_version": get_portfolio_version(user.username)}
     return render(request, "certificates/certificate_list.html", context)
 
 
+@login_required
+def certificate_download_all(request):
+    user = request.user
+    return download_participant_certificates(participant_certificates(user.username).iterator(), user.username)
+
+
 def certificate_validate(request):
-    if request.method == "POST":
-        certificate_hash = request.POST["certificate_hash"]
+    if request.method == "POST" or "certificate_hash" in request.GET:
+        if request.method == "POST":
+            certificate_hash = request.POST["certificate_hash"]
+        else:
+            certificate_hash = request.GET["certificate_hash"].strip()
         certificate = Certificate.objects.filter(certificate_hash=certificate_hash).first()
         if certificate:
             context = {"certificate": certificate}
@@ -1,4 +1,5 @@
 from django.contrib import admin
-from credentials.models import Credential
+from credentials.models import Credential, ExpiredCredential
 
-admin.site.register(Credential)
\ No newline at end of file
+admin.site.register(Credential)
+admin.site.register(ExpiredCredential)
@@ -0,0 +1,252 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils.formats import date_format
+from PIL import Image, ImageDraw
+
+from credentials.photographs import photograph_thumbnail
+from wmb.fonts import get_font
+from wmb.qrcodes import qr_code_png
+
+# A4 sheets drawn at 150 DPI, with ten ID-1 sized badges (85.6mm x 54mm) each
+DPI = 150
+SHEET_SIZE = (1240, 1754)
+PDF_SHEET_SIZE = (595.28, 841.89)
+BADGE_SIZE = (506, 319)
+BADGE_COLUMNS = 2
+BADGE_ROWS = 5
+BADGES_PER_SHEET = BADGE_COLUMNS * BADGE_ROWS
+BADGE_GAP = 24
+BADGE_PADDING = 18
+PHOTO_SIZE = (150, 200)
+QR_CODE_SIZE = 110
+NAME_FONT_SIZE = 26
+TEXT_FONT_SIZE = 18
+SMALL_FONT_SIZE = 13
+SHEET_JPEG_QUALITY = 90
+BADGE_COLOR = "#006699"
+
+BOLD_FONT = "Merriweather-Bold.ttf"
+REGULAR_FONT = "Merriweather-Regular.ttf"
+
+
+def credential_validation_url(verification_code):
+    return "{}{}?{}".format(settings.SITE_URL, reverse("credentials:credential_validate"),
+                            urlencode({"verification_code": verification_code}))
+
+
+@lru_cache(maxsize=256)
+def qr_code_image(data, size):
+    """
+    Function to draw the QR code of a text in the size of the badges. The code itself is only encoded
+    once, and kept in the QR code store, so every process that draws sheets shares it
+
+    :param data: Text encoded in the QR code
+    :param size: Width and height of the image, in pixels
+    :return: Grayscale image of the QR code
+    """
+    return Image.open(io.BytesIO(qr_code_png(data))).convert("L").resize((size, size), Image.NEAREST)
+
+
+def badge_photograph(credential):
+    """
+    Function to get the photograph printed on a badge from the local store. Photographs that were never
+    downloaded are not fetched while the sheets are drawn: the badge gets the placeholder instead
+
+    :param credential: Credential object
+    :return: Content of the resized photograph, or None if the credential has no stored photograph
+    """
+    if not credential.photograph_file:
+        return None
+    return photograph_thumbnail(credential, "badge").read()
+
+
+def badge_data(credential):
+    """
+    Function to gather what is printed on the badge of a credential, so it can be drawn by another process
+
+    :param credential: Credential object
+    :return: Dictionary with the texts, the photograph and the validation URL of the badge
+    """
+    return {
+        "full_name": credential.full_name,
+        "username": credential.username,
+        "event": credential.event,
+        "validity": "{} - {}".format(date_format(credential.valid_from, "SHORT_DATE_FORMAT"),
+                                     date_format(credential.valid_until, "SHORT_DATE_FORMAT")),
+        "verification_code": credential.verification_code,
+        "validation_url": credential_validation_url(credential.verification_code),
+        "photograph": badge_photograph(credential),
+    }
+
+
+def fit_text(draw, text, font_name, size, width, lines=1):
+    """
+    Function to break a text in at most a number of lines that fit in a width, cutting the last one
+
+    :return: List of lines
+    """
+    font = get_font(font_name, size)
+    result = []
+    line = ""
+    for word in text.split():
+        candidate = "{} {}".format(line, word).strip()
+        if draw.textlength(candidate, font=font) <= width or not line:
+            line = candidate
+        else:
+            result.append(line)
+            line = word
+    result.append(line)
+    if len(result) > lines:
+        result = result[:lines]
+        result[-1] += "…"
+    for index, line in enumerate(result):
+        while draw.textlength(line, font=font) > width and len(line) > 1:
+            line = line[:-2] + "…"
+        result[index] = line
+    return result
+
+
+def draw_badge(sheet, draw, left, top, badge):
+    width, height = BADGE_SIZE
+    draw.rounded_rectangle((left, top, left + width, top + height), radius=12, outline="#999999", width=2)
+    draw.rectangle((left + 2, top + height - 14, left + width - 2, top + height - 6), fill=BADGE_COLOR)
+
+    photo_left, photo_top = left + BADGE_PADDING, top + BADGE_PADDING
+    photo = None
+    if badge["photograph"]:
+        try:
+            photo = Image.open(io.BytesIO(badge["photograph"]))
+            photo = photo.convert("RGB")
+        except (OSError, Image.DecompressionBombError):
+            photo = None
+    if photo:
+        photo.thumbnail((PHOTO_SIZE[0] * 2, PHOTO_SIZE[1] * 2))
+        scale = max(PHOTO_SIZE[0] / photo.width, PHOTO_SIZE[1] / photo.height)
+        photo = photo.resize((max(PHOTO_SIZE[0], round(photo.width * scale)),
+                              max(PHOTO_SIZE[1], round(photo.height * scale))))
+        crop_left, crop_top = (photo.width - PHOTO_SIZE[0]) // 2, (photo.height - PHOTO_SIZE[1]) // 2
+        sheet.paste(photo.crop((crop_left, crop_top, crop_left + PHOTO_SIZE[0], crop_top + PHOTO_SIZE[1])),
+                    (photo_left, photo_top))
+    else:
+        draw.rectangle((photo_left, photo_top, photo_left + PHOTO_SIZE[0], photo_top + PHOTO_SIZE[1]),
+                       fill="#eeeeee", outline="#cccccc")
+
+    text_left = photo_left + PHOTO_SIZE[0] + BADGE_PADDING
+    text_width = left + width - BADGE_PADDING - text_left
+    y = top + BADGE_PADDING
+    for line in fit_text(draw, badge["full_name"], BOLD_FONT, NAME_FONT_SIZE, text_width, lines=2):
+        draw.text((text_left, y), line, font=get_font(BOLD_FONT, NAME_FONT_SIZE), fill="black")
+        y += NAME_FONT_SIZE + 8
+    for text, font_name, size, color in ((badge["username"], REGULAR_FONT, TEXT_FONT_SIZE, BADGE_COLOR),
+                                         (badge["event"], BOLD_FONT, TEXT_FONT_SIZE, "black"),
+                                         (badge["validity"], REGULAR_FONT, SMALL_FONT_SIZE, "#333333")):
+        y += 4
+        for line in fit_text(draw, text, font_name, size, text_width):
+            draw.text((text_left, y), line, font=get_font(font_name, size), fill=color)
+            y += size + 6
+
+    qr_left = left + width - BADGE_PADDING - QR_CODE_SIZE
+    qr_top = top + height - 20 - QR_CODE_SIZE
+    sheet.paste(qr_code_image(badge["validation_url"], QR_CODE_SIZE), (qr_left, qr_top))
+    draw.text((text_left, qr_top + QR_CODE_SIZE - SMALL_FONT_SIZE), badge["verification_code"],
+              font=get_font(REGULAR_FONT, SMALL_FONT_SIZE), fill="#333333")
+
+
+def render_badge_sheet(badges):
+    """
+    Function to draw one A4 sheet of badges. Runs in the worker processes, so it only receives plain data
+
+    :param badges: List with the data of up to BADGES_PER_SHEET badges, built by badge_data
+    :return: JPEG image of the sheet, in bytes
+    """
+    sheet = Image.new("RGB", SHEET_SIZE, "white")
+    draw = ImageDraw.Draw(sheet)
+    margin_left = (SHEET_SIZE[0] - BADGE_COLUMNS * BADGE_SIZE[0] - (BADGE_COLUMNS - 1) * BADGE_GAP) // 2
+    margin_top = (SHEET_SIZE[1] - BADGE_ROWS * BADGE_SIZE[1] - (BADGE_ROWS - 1) * BADGE_GAP) // 2
+    for index, badge in enumerate(badges):
+        row, column = divmod(index, BADGE_COLUMNS)
+        draw_badge(sheet, draw,
+                   margin_left + column * (BADGE_SIZE[0] + BADGE_GAP),
+                   margin_top + row * (BADGE_SIZE[1] + BADGE_GAP),
+                   badge)
+    output = io.BytesIO()
+    # Chroma subsampling is turned off so the small texts and the QR codes keep sharp edges
+    sheet.save(output, "JPEG", quality=SHEET_JPEG_QUALITY, subsampling=0, optimize=True)
+    return output.getvalue()
+
+
+def render_badge_sheets(credentials, workers=None):
+    """
+    Generator that yields the sheets of badges of the credentials, drawn in parallel by a pool of
+    processes and yielded in order as soon as they are ready
+
+    :param credentials: List of Credential objects
+    :param workers: Maximum number of processes, the number of CPUs by default
+    :return: JPEG image of each sheet
+    """
+    badges = [badge_data(credential) for credential in credentials]
+    sheets = [badges[start:start + BADGES_PER_SHEET] for start in range(0, len(badges), BADGES_PER_SHEET)]
+    workers = min(workers or os.cpu_count() or 1, len(sheets))
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        yield from executor.map(render_badge_sheet, sheets) if executor else map(render_badge_sheet, sheets)
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def stream_badge_sheets_pdf(credentials, workers=None):
+    """
+    Generator that yields a PDF with the sheets of badges of the credentials, one sheet at a time. Each
+    sheet is a single image, written as soon as it is drawn, and the page tree and cross-reference table
+    that reference them are written at the end
+
+    :param credentials: List of Credential objects
+    :param workers: Maximum number of processes drawing the sheets
+    :return: Chunks of the PDF file
+    """
+    offsets = {}
+    position = 0
+
+    def write_object(number, body, stream=None):
+        nonlocal position
+        offsets[number] = position
+        data = b"%d 0 obj\n" % number + body
+        if stream is not None:
+            data += b"\nstream\n" + stream + b"\nendstream"
+        data += b"\nendobj\n"
+        position += len(data)
+        return data
+
+    header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    position += len(header)
+    yield header
+
+    pages = []
+    content = b"q %.2f 0 0 %.2f 0 0 cm /Sheet Do Q" % PDF_SHEET_SIZE
+    for sheet in render_badge_sheets(credentials, workers):
+        image_number, content_number, page_number = 3 + 3 * len(pages), 4 + 3 * len(pages), 5 + 3 * len(pages)
+        pages.append(page_number)
+        yield (write_object(image_number, b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+                                          b"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+                                          b"/Length %d >>" % (SHEET_SIZE + (len(sheet),)), sheet)
+               + write_object(content_number, b"<< /Length %d >>" % len(content), content)
+               + write_object(page_number, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+                                           b"/Resources << /XObject << /Sheet %d 0 R >> >> /Contents %d 0 R >>"
+                              % (PDF_SHEET_SIZE + (image_number, content_number))))
+
+    kids = b" ".join(b"%d 0 R" % number for number in pages)
+    trailer = (write_object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages)))
+               + write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>"))
+    xref_position = position
+    trailer += b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1)
+    trailer += b"".join(b"%010d 00000 n \n" % offsets[number] for number in range(1, len(offsets) + 1))
+    trailer += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(offsets) + 1, xref_position)
+    yield trailer
@@ -1,17 +1,148 @@
+import hashlib
+import hmac
+import unicodedata
+from functools import lru_cache
+
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.db import models
-from cryptography.fernet import Fernet
+from django.db.models.query_utils import DeferredAttribute
+from cryptography.fernet import Fernet, MultiFernet
+
+
+def get_encryption_keys():
+    """
+    Function to get the active encryption keys. FIELD_ENCRYPTION_KEYS lists them with the key
+    used to encrypt first, followed by the older keys that are still accepted to decrypt.
+    Without it, FIELD_ENCRYPTION_KEY is the only key
+
+    :return: Tuple with the keys
+    """
+    keys = getattr(settings, "FIELD_ENCRYPTION_KEYS", None) or [settings.FIELD_ENCRYPTION_KEY]
+    return tuple(keys)
+
+
+@lru_cache(maxsize=None)
+def fernet_for_keys(keys):
+    """
+    Function to build the cipher of a set of keys only once per process
+
+    :param keys: Tuple with the Fernet keys, as strings
+    :return: MultiFernet object that encrypts with the first key and decrypts with any of them
+    """
+    return MultiFernet([Fernet(key.encode()) for key in keys])
 
 
 def get_fernet():
-    key = settings.FIELD_ENCRYPTION_KEY.encode()
-    return Fernet(key)
+    return fernet_for_keys(get_encryption_keys())
+
+
+def normalize_digits(value):
+    return "".join(char for char in value if char.isdigit())
+
+
+def normalize_document(value):
+    return "".join(char for char in value if char.isalnum()).upper()
+
+
+def normalize_full_name(value):
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(char for char in value if not unicodedata.combining(char)).casefold()
+    return " ".join(value.split())
+
+
+def get_blind_index_key():
+    """
+    Function to get the key of the blind indexes. It is a setting of its own, so SECRET_KEY can be
+    rotated without breaking the lookups of the encrypted fields
+
+    :return: Key of the blind indexes
+    """
+    key = getattr(settings, "FIELD_BLIND_INDEX_KEY", None)
+    if not key:
+        raise ImproperlyConfigured("The FIELD_BLIND_INDEX_KEY setting must not be empty.")
+    return key
+
+
+def blind_index(value, normalize):
+    """
+    Function to compute the keyed HMAC of a value, stored next to its encrypted field so equal
+    values can be looked up with an indexed query without decrypting anything. The key must not
+    change, or every blind index needs to be computed again with the reindex_credentials command
+
+    :param value: Plain text value
+    :param normalize: Function that puts the value in its canonical form before hashing it
+    :return: Hexadecimal digest, or None if the value is empty
+    """
+    value = normalize(value or "")
+    if not value:
+        return None
+    return hmac.new(get_blind_index_key().encode(), value.encode(), hashlib.sha256).hexdigest()
+
+
+class EncryptedValue:
+    """
+    Encrypted value loaded from the database. It is only decrypted when it is first read, so
+    rows whose encrypted fields are never shown don't pay for their decryption
+    """
+    __slots__ = ("token", "_value")
+
+    def __init__(self, token):
+        self.token = token
+        self._value = None
+
+    def decrypt(self):
+        if self._value is None:
+            self._value = get_fernet().decrypt(self.token.encode()).decode()
+        return self._value
+
+    def __str__(self):
+        return self.decrypt()
+
+    def __repr__(self):
+        return "<EncryptedValue>"
+
+    def __eq__(self, other):
+        if isinstance(other, EncryptedValue):
+            other = other.decrypt()
+        return self.decrypt() == other
+
+    def __hash__(self):
+        return hash(self.decrypt())
+
+
+class DecryptedAttribute(DeferredAttribute):
+    """
+    Descriptor that decrypts the value of an encrypted field the first time it is accessed
+    and keeps the plain text in the instance
+    """
+    def __get__(self, instance, cls=None):
+        value = super().__get__(instance, cls)
+        if isinstance(value, EncryptedValue):
+            value = value.decrypt()
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so __get__ runs even once the value is loaded
+        instance.__dict__[self.field.attname] = value
 
 
 class EncryptedTextField(models.TextField):
+    descriptor_class = DecryptedAttribute
+
+    def pre_save(self, model_instance, add):
+        # Values never read since they were loaded are saved back without decrypting them
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, EncryptedValue):
+            return value
+        return super().pre_save(model_instance, add)
+
     def get_prep_value(self, value):
         if value is None:
             return value
+        if isinstance(value, EncryptedValue):
+            return value.token
         f = get_fernet()
         encrypted = f.encrypt(value.encode())
         return encrypted.decode()
@@ -19,9 +150,9 @@ class EncryptedTextField(models.TextField):
     def from_db_value(self, value, expression, connection):
         if value is None:
             return value
-        f = get_fernet()
-        decrypted = f.decrypt(value.encode())
-        return decrypted.decode()
+        return EncryptedValue(value)
 
     def to_python(self, value):
-        return value
\ No newline at end of file
+        if isinstance(value, EncryptedValue):
+            return value.decrypt()
+        return value
@@ -2,6 +2,8 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
+from django.contrib.auth import get_user_model
+
 from .models import Credential
 
 
@@ -64,4 +66,64 @@ class CredentialForm(forms.ModelForm):
             if valid_until < valid_from:
                 raise ValidationError(_("Valid until date cannot be before valid from date."))
 
+        cpf = cleaned_data.get("cpf")
+        event = cleaned_data.get("event")
+        if cpf and event:
+            duplicates = Credential.objects.with_cpf(cpf).filter(event__iexact=event).exclude(pk=self.instance.pk)
+            if duplicates.exists():
+                self.add_error("cpf", _("A credential for this CPF was already issued for this event."))
+
         return cleaned_data
+
+
+class CredentialImportForm(forms.Form):
+    event = forms.CharField(label=_("Event name"), max_length=240)
+    valid_from = forms.DateField(label=_("Validity start date"),
+                                 widget=forms.DateInput(attrs={"type": "date", "class": "form-control form_value"}))
+    valid_until = forms.DateField(label=_("Validity end date"),
+                                  widget=forms.DateInput(attrs={"type": "date", "class": "form-control form_value"}))
+    credentials_file = forms.FileField(label=_("Choose a .csv file"))
+
+    def clean_credentials_file(self):
+        credentials_file = self.cleaned_data.get("credentials_file")
+        if credentials_file and not credentials_file.name.lower().endswith(".csv"):
+            raise ValidationError(_("The uploaded file must be a CSV file."))
+        return credentials_file
+
+    def clean(self):
+        cleaned_data = super().clean()
+        valid_from = cleaned_data.get("valid_from")
+        valid_until = cleaned_data.get("valid_until")
+
+        if valid_from and valid_until and valid_until < valid_from:
+            raise ValidationError(_("Valid until date cannot be before valid from date."))
+
+        return cleaned_data
+
+
+class CredentialFilterForm(forms.Form):
+    q = forms.CharField(required=False)
+    event = forms.CharField(required=False)
+    issued_by = forms.ModelChoiceField(queryset=get_user_model().objects.none(), required=False,
+                                       empty_label=_("Anyone"))
+    valid_from = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+    valid_until = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+    after = forms.CharField(required=False, widget=forms.HiddenInput)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["issued_by"].queryset = get_user_model().objects.filter(
+            credential_issued_by__isnull=False).distinct().order_by("username")
+
+    def filter(self, queryset):
+        """
+        Applies the valid filters to a queryset of credentials
+        """
+        data = self.cleaned_data if self.is_valid() else {}
+        if data.get("q"):
+            queryset = queryset.search(data["q"])
+        if data.get("event"):
+            queryset = queryset.filter(event=data["event"].strip())
+        if data.get("issued_by"):
+            queryset = queryset.filter(issued_by=data["issued_by"])
+        return queryset.valid_between(data.get("valid_from"), data.get("valid_until"))
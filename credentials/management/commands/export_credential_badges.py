@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from credentials.badges import stream_badge_sheets_pdf
+from credentials.models import Credential
+
+
+class Command(BaseCommand):
+    help = "Exports the badges of every credential of an event as a PDF"
+
+    def add_arguments(self, parser):
+        parser.add_argument("event")
+        parser.add_argument("--output", help="Path of the file to create, credentials.pdf by default")
+        parser.add_argument("--workers", type=int, help="Number of processes drawing the sheets")
+
+    def handle(self, *args, **options):
+        credentials = list(Credential.objects.filter(event__iexact=options["event"].strip()).order_by("username", "pk"))
+        if not credentials:
+            raise CommandError("There are no credentials for {}.".format(options["event"]))
+
+        output = options["output"] or "credentials.pdf"
+        with open(output, "wb") as output_file:
+            for chunk in stream_badge_sheets_pdf(credentials, options["workers"]):
+                output_file.write(chunk)
+
+        self.stdout.write(self.style.SUCCESS("Exported {} badges to {}.".format(len(credentials), output)))
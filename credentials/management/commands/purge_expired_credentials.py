@@ -0,0 +1,35 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from credentials.models import Credential
+from credentials.utils import PURGE_BATCH_SIZE, purge_expired_credentials
+
+
+class Command(BaseCommand):
+    help = ("Removes the credentials that expired more than CREDENTIAL_RETENTION_DAYS ago, keeping only their "
+            "verification code, or also their username, event and dates with --archive")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.CREDENTIAL_RETENTION_DAYS,
+                            help="Days an expired credential is kept")
+        parser.add_argument("--archive", action="store_true",
+                            help="Keep the username, event and dates of the credentials removed")
+        parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE,
+                            help="Number of credentials removed per transaction")
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to wait between two batches")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the credentials to remove")
+
+    def handle(self, *args, **options):
+        before = timezone.localdate() - datetime.timedelta(days=options["days"])
+
+        if options["dry_run"]:
+            total = Credential.objects.filter(valid_until__lt=before).count()
+            self.stdout.write(self.style.SUCCESS("{} credentials expired before {}.".format(total, before)))
+            return
+
+        total = purge_expired_credentials(before, options["archive"], options["batch_size"], options["sleep"],
+                                          lambda removed: self.stdout.write("Removed {} credentials.".format(removed)))
+        self.stdout.write(self.style.SUCCESS("Removed {} credentials expired before {}.".format(total, before)))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from credentials.utils import ROTATION_BATCH_SIZE, reindex_credentials
+
+
+class Command(BaseCommand):
+    help = ("Computes again the blind indexes of every credential. Run it after changing FIELD_BLIND_INDEX_KEY, "
+            "as searches and duplicate checks don't find the credentials indexed with the previous key")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=ROTATION_BATCH_SIZE,
+                            help="Number of credentials updated per query")
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to wait between two batches")
+
+    def handle(self, *args, **options):
+        def report(last_id):
+            self.stdout.write("Indexed up to credential {}.".format(last_id))
+
+        total = reindex_credentials(options["batch_size"], options["sleep"], report)
+        self.stdout.write(self.style.SUCCESS("Indexed {} credentials.".format(total)))
@@ -0,0 +1,37 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from credentials.utils import ROTATION_BATCH_SIZE, rotate_credentials_encryption
+
+
+class Command(BaseCommand):
+    help = ("Encrypts the credentials again with the first key of FIELD_ENCRYPTION_KEYS. Once it finishes, "
+            "the older keys can be removed from the setting")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=ROTATION_BATCH_SIZE,
+                            help="Number of credentials updated per query")
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to wait between two batches")
+        parser.add_argument("--checkpoint", default="rotate_encryption_key.checkpoint",
+                            help="File storing the id of the last credential rotated, to resume an interrupted run")
+        parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and rotate every credential")
+
+    def handle(self, *args, **options):
+        checkpoint = options["checkpoint"]
+        start_after = 0
+        if not options["restart"] and os.path.exists(checkpoint):
+            with open(checkpoint) as checkpoint_file:
+                start_after = int(checkpoint_file.read().strip() or 0)
+            self.stdout.write("Resuming after credential {}.".format(start_after))
+
+        def save_checkpoint(last_id):
+            with open(checkpoint, "w") as checkpoint_file:
+                checkpoint_file.write(str(last_id))
+            self.stdout.write("Rotated up to credential {}.".format(last_id))
+
+        total = rotate_credentials_encryption(options["batch_size"], start_after, options["sleep"], save_checkpoint)
+
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        self.stdout.write(self.style.SUCCESS("Rotated the encryption of {} credentials.".format(total)))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from credentials.utils import SHORTENING_BATCH_SIZE, shorten_pending_urls
+
+
+class Command(BaseCommand):
+    help = ("Shortens the Meta-Wiki profile URLs of the credentials that don't have one yet. Run it periodically, "
+            "it completes any shortening the web process didn't")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=SHORTENING_BATCH_SIZE,
+                            help="Number of credentials shortened before their URLs are saved")
+
+    def handle(self, *args, **options):
+        shortened, failed = shorten_pending_urls(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS("Shortened {} URLs, {} failed.".format(shortened, failed)))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from credentials.utils import store_photographs
+
+
+class Command(BaseCommand):
+    help = ("Downloads and stores the photographs of the credentials whose stored photograph is missing or "
+            "outdated. Run it periodically, it completes any download the web process didn't")
+
+    def handle(self, *args, **options):
+        stored, failed = store_photographs()
+        self.stdout.write(self.style.SUCCESS("Stored {} photographs, {} failed.".format(stored, failed)))
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+from credentials.fields import blind_index, normalize_digits, normalize_document, normalize_full_name
+
+
+def fill_blind_indexes(apps, schema_editor):
+    Credential = apps.get_model('credentials', 'Credential')
+    credentials = []
+    for credential in Credential.objects.only('id', 'full_name', 'cpf', 'cin').iterator():
+        credential.full_name_index = blind_index(credential.full_name, normalize_full_name)
+        credential.cpf_index = blind_index(credential.cpf, normalize_digits)
+        credential.cin_index = blind_index(credential.cin, normalize_document)
+        credentials.append(credential)
+    Credential.objects.bulk_update(credentials, ['full_name_index', 'cpf_index', 'cin_index'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credentials', '0002_alter_credential_photograph_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='credential',
+            name='cin_index',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='credential',
+            name='cpf_index',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='credential',
+            name='full_name_index',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_blind_indexes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credentials', '0003_credential_blind_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='credential',
+            name='photograph_file',
+            field=models.ImageField(blank=True, default='', editable=False, upload_to='credentials/photographs', verbose_name='Stored photograph'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credentials', '0004_credential_photograph_file'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='credential',
+            index=models.Index(fields=['-issued_at', '-id'], name='credential_issued_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='credential',
+            index=models.Index(fields=['event', '-issued_at', '-id'], name='credential_event_issued_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='credential',
+            index=models.Index(fields=['issued_by', '-issued_at', '-id'], name='credential_issuer_issued_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='credential',
+            index=models.Index(fields=['valid_until', 'valid_from'], name='credential_validity_idx'),
+        ),
+    ]
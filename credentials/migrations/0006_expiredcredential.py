@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('credentials', '0005_credential_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExpiredCredential',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verification_code', models.CharField(editable=False, max_length=24, unique=True, verbose_name='Verification code')),
+                ('valid_until', models.DateField(verbose_name='Valid until')),
+                ('username', models.CharField(blank=True, default='', max_length=240, verbose_name='Wikimedia username')),
+                ('event', models.CharField(blank=True, default='', max_length=240, verbose_name='Event name')),
+                ('valid_from', models.DateField(blank=True, null=True, verbose_name='Valid from')),
+                ('issued_at', models.DateTimeField(blank=True, null=True, verbose_name='Issued at')),
+                ('removed_at', models.DateTimeField(auto_now_add=True, verbose_name='Removed at')),
+            ],
+        ),
+    ]
@@ -3,7 +3,51 @@ from urllib.parse import quote
 from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
-from .fields import EncryptedTextField
+from .fields import (EncryptedTextField, EncryptedValue, blind_index, normalize_digits, normalize_document,
+                     normalize_full_name)
+
+BLIND_INDEXES = {
+    "full_name": ("full_name_index", normalize_full_name),
+    "cpf": ("cpf_index", normalize_digits),
+    "cin": ("cin_index", normalize_document),
+}
+
+
+class CredentialQuerySet(models.QuerySet):
+    def with_cpf(self, cpf):
+        index = blind_index(cpf, normalize_digits)
+        return self.filter(cpf_index=index) if index else self.none()
+
+    def issued_before(self, issued_at, pk):
+        """
+        Filters the credentials that come after a given one when ordered from the newest to the oldest
+        """
+        return self.filter(models.Q(issued_at__lt=issued_at) | models.Q(issued_at=issued_at, pk__lt=pk))
+
+    def valid_between(self, start=None, end=None):
+        """
+        Filters the credentials whose validity overlaps a window of dates
+        """
+        queryset = self
+        if start:
+            queryset = queryset.filter(valid_until__gte=start)
+        if end:
+            queryset = queryset.filter(valid_from__lte=end)
+        return queryset
+
+    def search(self, term):
+        """
+        Filters the credentials by username, or by the exact full name, CPF or CIN through their blind indexes
+        """
+        term = (term or "").strip()
+        if not term:
+            return self
+        query = models.Q(username__icontains=term)
+        for field_name, (index_name, normalize) in BLIND_INDEXES.items():
+            index = blind_index(term, normalize)
+            if index:
+                query |= models.Q(**{index_name: index})
+        return self.filter(query)
 
 
 class Credential(models.Model):
@@ -12,6 +56,8 @@ class Credential(models.Model):
     cpf = EncryptedTextField(_("CPF"), blank=True, null=True, help_text=_("CPF of user."))
     cin = EncryptedTextField(_("CIN"), max_length=24, blank=True, null=True, help_text=_("CIN of user."))
     photograph = EncryptedTextField(_("Photograph URL"), max_length=420, default="", help_text=_("Photograph URL."))
+    photograph_file = models.ImageField(_("Stored photograph"), upload_to="credentials/photographs", blank=True,
+                                        default="", editable=False)
     url = models.URLField(_("Meta-Wiki Profile URL"), blank=True, default="", help_text=_("Meta-Wiki Profile URL."))
 
     event = models.CharField(_("Event name"), max_length=240, help_text=_("Event which credentials are being created."))
@@ -22,9 +68,46 @@ class Credential(models.Model):
     valid_from = models.DateField(_("Valid from"))
     valid_until = models.DateField(_("Valid until"))
 
+    full_name_index = models.CharField(max_length=64, blank=True, null=True, editable=False, db_index=True)
+    cpf_index = models.CharField(max_length=64, blank=True, null=True, editable=False, db_index=True)
+    cin_index = models.CharField(max_length=64, blank=True, null=True, editable=False, db_index=True)
+
+    objects = CredentialQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-issued_at", "-id"], name="credential_issued_idx"),
+            models.Index(fields=["event", "-issued_at", "-id"], name="credential_event_issued_idx"),
+            models.Index(fields=["issued_by", "-issued_at", "-id"], name="credential_issuer_issued_idx"),
+            models.Index(fields=["valid_until", "valid_from"], name="credential_validity_idx"),
+        ]
+
+    def update_blind_indexes(self, fields=None, force=False):
+        """
+        Computes the blind indexes of the encrypted fields. Fields that were not read or changed
+        since they were loaded keep their index, so they are not decrypted
+
+        :param fields: Names of the encrypted fields to index, all of them by default
+        :param force: If True, the fields are decrypted and indexed even if they didn't change
+        :return: List with the names of the blind index fields updated
+        """
+        updated = []
+        for field_name, (index_name, normalize) in BLIND_INDEXES.items():
+            if fields is not None and field_name not in fields:
+                continue
+            if not force and isinstance(self.__dict__.get(field_name), EncryptedValue):
+                continue
+            setattr(self, index_name, blind_index(getattr(self, field_name), normalize))
+            updated.append(index_name)
+        return updated
+
     def save(self, *args, **kwargs):
         if not self.verification_code:
             self.verification_code = secrets.token_urlsafe(16)
+        update_fields = kwargs.get("update_fields")
+        updated = self.update_blind_indexes(update_fields)
+        if update_fields is not None:
+            kwargs["update_fields"] = list(update_fields) + updated
         super().save(*args, **kwargs)
 
     def get_wikimedia_profile_url(self):
@@ -68,4 +151,21 @@ class Credential(models.Model):
         return f"{first} {' '.join(initials)}"
 
     def __str__(self):
-        return f"{self.event} - {self.username}"
\ No newline at end of file
+        return f"{self.event} - {self.username}"
+
+
+class ExpiredCredential(models.Model):
+    """
+    What is kept of a credential after its retention period: enough to tell that a verification code
+    existed and expired and, when archived, which event it was issued for. No personal data is kept
+    """
+    verification_code = models.CharField(_("Verification code"), max_length=24, unique=True, editable=False)
+    valid_until = models.DateField(_("Valid until"))
+    username = models.CharField(_("Wikimedia username"), max_length=240, blank=True, default="")
+    event = models.CharField(_("Event name"), max_length=240, blank=True, default="")
+    valid_from = models.DateField(_("Valid from"), blank=True, null=True)
+    issued_at = models.DateTimeField(_("Issued at"), blank=True, null=True)
+    removed_at = models.DateTimeField(_("Removed at"), auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.event} - {self.username}" if self.event else self.verification_code
@@ -0,0 +1,224 @@
+import io
+import os
+import ipaddress
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils.module_loading import import_string
+from PIL import Image, ImageOps
+from requests.adapters import HTTPAdapter
+from sorl.thumbnail import get_thumbnail, delete as delete_thumbnails
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPSConnectionPool
+
+from credentials.fields import blind_index
+from credentials.services.wikimedia import USER_AGENT, TIMEOUT
+
+PHOTOGRAPH_MAX_BYTES = 10 * 1024 * 1024
+PHOTOGRAPH_MAX_PIXELS = 40_000_000
+PHOTOGRAPH_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+PHOTOGRAPH_STORED_SIZE = (900, 1200)
+# Sizes of the photographs served and printed, as sorl geometries (3:4 portraits)
+PHOTOGRAPH_SIZES = {"badge": "300x400", "thumbnail": "120x160"}
+# How long browsers may keep a served photograph, in seconds. A new photograph gets a new ETag
+PHOTOGRAPH_MAX_AGE = 60 * 60 * 24
+PHOTOGRAPH_MAX_REDIRECTS = 3
+
+
+class PhotographError(Exception):
+    pass
+
+
+def is_public_address(address):
+    address = ipaddress.ip_address(address.split("%")[0])
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    return address.is_global
+
+
+class PublicHTTPSConnection(HTTPSConnection):
+    """
+    HTTPS connection that refuses to talk to a private, loopback or link-local address. The address is
+    checked on the connected socket, before anything is sent, so a host name resolved again to another
+    address after the URL was validated can't reach the internal network
+    """
+
+    def _new_conn(self):
+        sock = super()._new_conn()
+        if not is_public_address(sock.getpeername()[0]):
+            sock.close()
+            raise PhotographError("The photograph host is not public")
+        return sock
+
+
+class PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = PublicHTTPSConnection
+
+
+class PublicHTTPSAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = dict(self.poolmanager.pool_classes_by_scheme,
+                                                       https=PublicHTTPSConnectionPool)
+
+
+@lru_cache(maxsize=None)
+def get_photograph_session():
+    """
+    Function to build the HTTP session used to download the photographs. It is shared by the process, and
+    its https connections only reach public addresses
+
+    :return: requests.Session object
+    """
+    session = requests.Session()
+    # Proxies from the environment would be the address connected to, so they are ignored
+    session.trust_env = False
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", PublicHTTPSAdapter(max_retries=2, pool_maxsize=4))
+    return session
+
+
+def validate_photograph_url(url):
+    """
+    Function to check that a photograph URL can be downloaded by the server. Only https is accepted, the
+    host must be in CREDENTIAL_PHOTOGRAPH_HOSTS when that list is set, and an address given instead of a
+    host name must be public. Host names are checked by PublicHTTPSConnection, on the address connected to
+
+    :param url: URL of the photograph
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "https" or not parts.hostname:
+        raise PhotographError("Only https photograph URLs are accepted")
+    allowed_hosts = settings.CREDENTIAL_PHOTOGRAPH_HOSTS
+    if allowed_hosts and parts.hostname.lower() not in allowed_hosts:
+        raise PhotographError("The photograph host is not allowed")
+    try:
+        public = is_public_address(parts.hostname)
+    except ValueError:
+        return
+    if not public:
+        raise PhotographError("The photograph host is not public")
+
+
+def fetch_photograph(url):
+    """
+    Function to download a photograph, refusing files that are too big. Redirects are followed by hand,
+    so each target is validated like the original URL
+
+    :param url: URL of the photograph
+    :return: Content of the file
+    """
+    try:
+        for _ in range(PHOTOGRAPH_MAX_REDIRECTS + 1):
+            validate_photograph_url(url)
+            with get_photograph_session().get(url, timeout=TIMEOUT, stream=True, allow_redirects=False) as response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers["Location"])
+                    continue
+                response.raise_for_status()
+                content = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    content.extend(chunk)
+                    if len(content) > PHOTOGRAPH_MAX_BYTES:
+                        raise PhotographError("The photograph is bigger than {} bytes".format(PHOTOGRAPH_MAX_BYTES))
+                return bytes(content)
+    except requests.RequestException as error:
+        raise PhotographError(str(error)) from error
+    raise PhotographError("Too many redirects")
+
+
+def get_fetcher():
+    return import_string(settings.CREDENTIAL_PHOTOGRAPH_FETCHER)
+
+
+def photograph_filename(url):
+    return "{}.jpg".format(blind_index(url, str.strip)[:32])
+
+
+def photograph_is_current(credential):
+    """
+    Function to check if the stored photograph of a credential was downloaded from its current URL. The
+    storage may add a suffix to the file name, so only the hash of the URL is compared
+
+    :param credential: Credential object
+    :return: True if the stored photograph matches the photograph URL
+    """
+    if not credential.photograph or not credential.photograph_file:
+        return False
+    stored_name = os.path.basename(credential.photograph_file.name)
+    return stored_name.startswith(os.path.splitext(photograph_filename(credential.photograph))[0])
+
+
+def prepare_photograph(content):
+    """
+    Function to validate a downloaded photograph and to convert it to a JPEG of bounded size, without
+    its metadata and with its orientation applied
+
+    :param content: Content of the downloaded file
+    :return: Content of the JPEG file
+    """
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            image.verify()
+        image = Image.open(io.BytesIO(content))
+        if image.format not in PHOTOGRAPH_FORMATS or image.width * image.height > PHOTOGRAPH_MAX_PIXELS:
+            raise PhotographError("Unsupported photograph")
+        image = ImageOps.exif_transpose(image).convert("RGB")
+    except (OSError, SyntaxError, Image.DecompressionBombError) as error:
+        raise PhotographError("Invalid photograph") from error
+
+    image.thumbnail(PHOTOGRAPH_STORED_SIZE)
+    output = io.BytesIO()
+    image.save(output, "JPEG", quality=90, optimize=True)
+    return output.getvalue()
+
+
+def photograph_thumbnail(credential, size):
+    """
+    Function to get one of the resized versions of the stored photograph of a credential. They are
+    generated once by sorl.thumbnail and kept in the media storage
+
+    :param credential: Credential object with a stored photograph
+    :param size: Key of PHOTOGRAPH_SIZES
+    :return: sorl ImageFile of the resized photograph
+    """
+    return get_thumbnail(credential.photograph_file, PHOTOGRAPH_SIZES[size], crop="center", format="JPEG",
+                         quality=85)
+
+
+def delete_stored_photograph(credential):
+    if credential.photograph_file:
+        delete_thumbnails(credential.photograph_file)
+        credential.photograph_file = ""
+
+
+def store_photograph(credential):
+    """
+    Function to download the photograph of a credential once and keep it, and its resized versions,
+    under MEDIA_ROOT. The file is named after a keyed hash of its URL, so it doesn't reveal it. The
+    previous photograph is only deleted once the new one is stored, so a failed download keeps it
+
+    :param credential: Credential object
+    :return: True if the photograph was stored, False if the credential has none or it could not be used
+    """
+    if not credential.photograph:
+        delete_stored_photograph(credential)
+        credential.save(update_fields=["photograph_file"])
+        return False
+    try:
+        content = prepare_photograph(get_fetcher()(credential.photograph))
+    except PhotographError:
+        return False
+
+    previous_name = credential.photograph_file.name
+    credential.photograph_file.save(photograph_filename(credential.photograph), ContentFile(content), save=False)
+    for size in PHOTOGRAPH_SIZES:
+        photograph_thumbnail(credential, size)
+    credential.save(update_fields=["photograph_file"])
+    if previous_name and previous_name != credential.photograph_file.name:
+        delete_thumbnails(previous_name)
+    return True
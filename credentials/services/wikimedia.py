@@ -1,16 +1,46 @@
+import logging
+from functools import lru_cache
+
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "WMB/1.0 (eder.porto@wmnobrasil.org)"
+TIMEOUT = (3.05, 10)
+
+
+@lru_cache(maxsize=None)
+def get_session():
+    """
+    Function to build the HTTP session used to call the MediaWiki API. It is shared by the process, so
+    connections are reused, and it retries with exponential backoff when the API is unavailable or
+    asks to slow down
+
+    :return: requests.Session object
+    """
+    retry = Retry(total=4, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset({"POST"}))
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=4)
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def shorten_url(long_url: str) -> str | None:
-    endpoint = "https://meta.wikimedia.org/w/api.php"
-    headers = {"User-Agent": "WMB/1.0 (eder.porto@wmnobrasil.org)"}
-    params = {"action": "shortenurl", "url": long_url,"format": "json"}
+    params = {"action": "shortenurl", "url": long_url, "format": "json"}
 
     try:
-        response = requests.post(endpoint, headers=headers, data=params, timeout=5)
+        response = get_session().post(settings.WIKIMEDIA_API_ENDPOINT, data=params, timeout=TIMEOUT)
         response.raise_for_status()
         data = response.json()
 
         return data.get("shortenurl", {}).get("shorturl")
 
-    except Exception:
-        return None
\ No newline at end of file
+    except (requests.RequestException, ValueError) as error:
+        logger.warning("Could not shorten %s: %s", long_url, error)
+        return None
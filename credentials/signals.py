@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from credentials.models import Credential
+from credentials.photographs import delete_stored_photograph
+
+
+@receiver(post_delete, sender=Credential)
+def delete_credential_photograph(sender, instance, **kwargs):
+    delete_stored_photograph(instance)
@@ -1,14 +1,43 @@
+import json
+import os
+import socket
+import tempfile
+import threading
 from datetime import date, timedelta
-from unittest.mock import patch
-
-from django.test import TestCase
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO, StringIO
+from urllib.parse import parse_qs
+from unittest.mock import ANY, patch
+
+from cryptography.fernet import Fernet, InvalidToken
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.http import QueryDict
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import Permission
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext as _
+from PIL import Image
+from PyPDF2 import PdfReader
 
-from credentials.models import Credential
+from credentials.badges import (SHEET_SIZE, badge_data, credential_validation_url, qr_code_image, render_badge_sheet,
+                               stream_badge_sheets_pdf)
+from credentials.models import Credential, ExpiredCredential
+from credentials.photographs import PhotographError, fetch_photograph, photograph_filename, store_photograph
 from credentials.forms import CredentialForm
+from credentials.fields import (EncryptedValue, get_fernet, blind_index, normalize_digits, normalize_document,
+                                normalize_full_name)
+from credentials.services.wikimedia import get_session, shorten_url
+from credentials.utils import (shorten_pending_urls, store_photographs, credentials_page, purge_expired_credentials,
+                               rotate_credentials_encryption, LIST_DEFERRED_FIELDS)
+from wmb.qrcodes import qr_code_png
 
 User = get_user_model()
 class CredentialViewsTests(TestCase):
@@ -94,36 +123,36 @@ class CredentialViewsTests(TestCase):
     # CREATE
     # ------------------------
 
-    @patch("credentials.views.shorten_url")
+    @patch("credentials.views.schedule_url_shortening")
     def test_create_get(self, mock_shorten):
         self.client.login(username="admin", password="pass123")
         response = self.client.get(reverse("credentials:credential_create"))
         self.assertEqual(response.status_code, 200)
 
-    @patch("credentials.views.shorten_url")
+    @patch("credentials.views.schedule_url_shortening")
     def test_create_post_valid(self, mock_shorten):
-        mock_shorten.return_value = "https://short.url/test"
-
         self.client.login(username="admin", password="pass123")
 
-        response = self.client.post(
-            reverse("credentials:credential_create"),
-            {
-                "username": "NewUser",
-                "full_name": "New User",
-                "event": "New Event",
-                "photograph": "https://example.com/photo.jpg",
-                "valid_from": date.today(),
-                "valid_until": date.today() + timedelta(days=5),
-            },
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("credentials:credential_create"),
+                {
+                    "username": "NewUser",
+                    "full_name": "New User",
+                    "event": "New Event",
+                    "photograph": "https://example.com/photo.jpg",
+                    "valid_from": date.today(),
+                    "valid_until": date.today() + timedelta(days=5),
+                },
+            )
 
         self.assertEqual(response.status_code, 302)
+        mock_shorten.assert_called_once_with()
 
         credential = Credential.objects.get(username="NewUser")
         self.assertEqual(credential.issued_by, self.admin)
 
-    @patch("credentials.views.shorten_url")
+    @patch("credentials.views.schedule_url_shortening")
     def test_create_post_invalid(self, mock_shorten):
         self.client.login(username="admin", password="pass123")
 
@@ -459,6 +488,21 @@ class CredentialFormTests(TestCase):
         form = CredentialForm(data=self.valid_data)
         self.assertTrue(form.is_valid())
 
+    def test_duplicate_cpf_for_the_same_event(self):
+        CredentialForm(data=self.valid_data).save()
+
+        form = CredentialForm(data=dict(self.valid_data, cpf="123.456.789-01", event="test event"))
+        self.assertFalse(form.is_valid())
+        self.assertIn("cpf", form.errors)
+
+        form = CredentialForm(data=dict(self.valid_data, event="Other Event"))
+        self.assertTrue(form.is_valid())
+
+    def test_duplicate_cpf_ignores_the_credential_being_edited(self):
+        credential = CredentialForm(data=self.valid_data).save()
+        form = CredentialForm(data=self.valid_data, instance=credential)
+        self.assertTrue(form.is_valid())
+
     # ---------------------------------
     # REQUIRED FIELDS
     # ---------------------------------
@@ -532,4 +576,632 @@ class CredentialFormTests(TestCase):
         self.assertEqual(
             form.fields["username"].widget.attrs["required"],
             "required"
-        )
\ No newline at end of file
+        )
+
+class EncryptedTextFieldTests(TestCase):
+
+    def setUp(self):
+        self.credential = Credential.objects.create(
+            username="TestUser",
+            full_name="Test User",
+            cpf="12345678901",
+            event="Test Event",
+            valid_from=date.today(),
+            valid_until=date.today() + timedelta(days=10),
+        )
+
+    def stored_values(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT full_name, cpf FROM credentials_credential WHERE id = %s", [self.credential.pk])
+            return cursor.fetchone()
+
+    # ---------------------------------
+    # ENCRYPTION
+    # ---------------------------------
+
+    def test_values_are_stored_encrypted(self):
+        full_name, cpf = self.stored_values()
+        self.assertNotIn("Test User", full_name)
+        self.assertEqual(get_fernet().decrypt(cpf.encode()).decode(), "12345678901")
+
+    def test_fernet_is_cached(self):
+        self.assertIs(get_fernet(), get_fernet())
+
+    # ---------------------------------
+    # LAZY DECRYPTION
+    # ---------------------------------
+
+    def test_values_are_decrypted_on_access(self):
+        credential = Credential.objects.get(pk=self.credential.pk)
+
+        self.assertIsInstance(credential.__dict__["full_name"], EncryptedValue)
+        self.assertIsInstance(credential.__dict__["cpf"], EncryptedValue)
+
+        self.assertEqual(credential.masked_name(), "Test U.")
+        self.assertEqual(credential.__dict__["full_name"], "Test User")
+        self.assertIsInstance(credential.__dict__["cpf"], EncryptedValue)
+        self.assertEqual(credential.cpf, "12345678901")
+        self.assertIsNone(credential.cin)
+
+    def test_unread_values_are_saved_without_reencrypting(self):
+        stored = self.stored_values()
+        credential = Credential.objects.get(pk=self.credential.pk)
+        credential.full_name = "Other User"
+        credential.save()
+
+        full_name, cpf = self.stored_values()
+        self.assertNotEqual(full_name, stored[0])
+        self.assertEqual(cpf, stored[1])
+        credential = Credential.objects.get(pk=self.credential.pk)
+        self.assertEqual((credential.full_name, credential.cpf), ("Other User", "12345678901"))
+
+    # ---------------------------------
+    # BLIND INDEXES
+    # ---------------------------------
+
+    def test_blind_indexes(self):
+        self.assertEqual(self.credential.cpf_index, blind_index("123.456.789-01", normalize_digits))
+        self.assertEqual(self.credential.full_name_index, blind_index(" test  USER", normalize_full_name))
+        self.assertIsNone(self.credential.cin_index)
+        self.assertNotIn("12345678901", self.credential.cpf_index)
+
+        self.assertEqual(list(Credential.objects.with_cpf("123.456.789-01")), [self.credential])
+        self.assertEqual(list(Credential.objects.with_cpf("")), [])
+
+    def test_blind_indexes_follow_changes(self):
+        credential = Credential.objects.get(pk=self.credential.pk)
+        credential.cin = "ab-123"
+        credential.save(update_fields=["cin"])
+
+        credential.refresh_from_db()
+        self.assertEqual(credential.cin_index, blind_index("AB123", normalize_document))
+        self.assertEqual(credential.cpf_index, self.credential.cpf_index)
+
+    def test_blind_index_key_is_required(self):
+        with self.settings(FIELD_BLIND_INDEX_KEY=None):
+            with self.assertRaises(ImproperlyConfigured):
+                blind_index("12345678901", normalize_digits)
+
+    def test_blind_indexes_do_not_depend_on_secret_key(self):
+        with self.settings(SECRET_KEY="another secret key"):
+            self.assertEqual(list(Credential.objects.with_cpf("123.456.789-01")), [self.credential])
+
+    def test_reindex_after_changing_the_key(self):
+        with self.settings(FIELD_BLIND_INDEX_KEY="new blind index key"):
+            self.assertEqual(list(Credential.objects.with_cpf("123.456.789-01")), [])
+            call_command("reindex_credentials", batch_size=1, stdout=StringIO())
+            self.assertEqual(list(Credential.objects.with_cpf("123.456.789-01")), [self.credential])
+            self.assertEqual(list(Credential.objects.search("test user")), [self.credential])
+
+    def test_values_queries_decrypt_on_demand(self):
+        full_name = Credential.objects.values_list("full_name", flat=True).get()
+        self.assertEqual(str(full_name), "Test User")
+        self.assertEqual(full_name, "Test User")
+
+
+class EncryptionKeyRotationTests(TestCase):
+
+    def setUp(self):
+        self.old_key = Fernet.generate_key().decode()
+        self.new_key = Fernet.generate_key().decode()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint = os.path.join(directory.name, "checkpoint")
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.old_key]):
+            self.credentials = [
+                Credential.objects.create(username="User{}".format(number), full_name="User {}".format(number),
+                                          cpf="1234567890{}".format(number), event="Test Event",
+                                          valid_from=date.today(), valid_until=date.today())
+                for number in range(5)
+            ]
+
+    def read_credentials(self):
+        return [(credential.full_name, credential.cpf, credential.cin, credential.photograph)
+                for credential in Credential.objects.order_by("pk")]
+
+    def test_several_active_keys(self):
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key, self.old_key]):
+            self.assertEqual(Credential.objects.get(pk=self.credentials[0].pk).full_name, "User 0")
+
+    def test_rotate_encryption_key(self):
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key, self.old_key]):
+            expected = self.read_credentials()
+            call_command("rotate_encryption_key", batch_size=2, checkpoint=self.checkpoint, stdout=StringIO())
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key]):
+            self.assertEqual(self.read_credentials(), expected)
+            self.assertEqual(list(Credential.objects.with_cpf("12345678903")), [self.credentials[3]])
+
+    def test_rotate_encryption_key_reads_bounded_batches(self):
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key, self.old_key]):
+            with patch("django.db.models.query.QuerySet.iterator") as iterator, \
+                    CaptureQueriesContext(connection) as queries:
+                self.assertEqual(rotate_credentials_encryption(batch_size=2), 5)
+        iterator.assert_not_called()
+        selects = [query["sql"] for query in queries if query["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 4)
+        self.assertTrue(all("LIMIT 2" in sql for sql in selects))
+
+    def test_rotate_encryption_key_resumes_from_checkpoint(self):
+        with open(self.checkpoint, "w") as checkpoint_file:
+            checkpoint_file.write(str(self.credentials[2].pk))
+
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key, self.old_key]):
+            call_command("rotate_encryption_key", checkpoint=self.checkpoint, stdout=StringIO())
+
+        with self.settings(FIELD_ENCRYPTION_KEYS=[self.new_key]):
+            self.assertEqual(Credential.objects.get(pk=self.credentials[3].pk).full_name, "User 3")
+            with self.assertRaises(InvalidToken):
+                Credential.objects.get(pk=self.credentials[2].pk).full_name
+
+
+class StubShortenerHandler(BaseHTTPRequestHandler):
+    responses = []
+    requests = []
+
+    def do_POST(self):
+        body = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        self.requests.append(body)
+        status = self.responses.pop(0) if self.responses else 200
+        content = json.dumps({"shortenurl": {"shorturl": "https://w.wiki/{}".format(len(self.requests))}}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class URLShorteningTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = HTTPServer(("127.0.0.1", 0), StubShortenerHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.endpoint = "http://127.0.0.1:{}/w/api.php".format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        StubShortenerHandler.responses = []
+        StubShortenerHandler.requests = []
+        for username in ["First User", "Second User", "Third User"]:
+            Credential.objects.create(username=username, full_name=username, event="Test Event",
+                                      valid_from=date.today(), valid_until=date.today())
+
+    def test_shorten_url_retries(self):
+        StubShortenerHandler.responses = [503, 200]
+        with self.settings(WIKIMEDIA_API_ENDPOINT=self.endpoint):
+            self.assertEqual(shorten_url("https://meta.wikimedia.org/wiki/User:Test"), "https://w.wiki/2")
+        self.assertEqual(StubShortenerHandler.requests[0]["action"], ["shortenurl"])
+        self.assertEqual(get_session(), get_session())
+
+    def test_shorten_url_failure(self):
+        StubShortenerHandler.responses = [400]
+        with self.settings(WIKIMEDIA_API_ENDPOINT=self.endpoint), self.assertLogs("credentials.services.wikimedia"):
+            self.assertIsNone(shorten_url("https://meta.wikimedia.org/wiki/User:Test"))
+
+    def test_shorten_pending_urls(self):
+        StubShortenerHandler.responses = [200, 400]
+        with self.settings(WIKIMEDIA_API_ENDPOINT=self.endpoint):
+            with self.assertLogs("credentials.services.wikimedia"):
+                self.assertEqual(shorten_pending_urls(batch_size=2), (2, 1))
+            self.assertEqual(Credential.objects.filter(url="").count(), 1)
+
+            call_command("shorten_credential_urls", stdout=StringIO())
+        self.assertFalse(Credential.objects.filter(url="").exists())
+        self.assertEqual(StubShortenerHandler.requests[0]["url"],
+                         ["https://meta.wikimedia.org/wiki/User:First%20User"])
+
+
+class CredentialImportTests(TestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username="admin", password="pass123")
+        self.admin.user_permissions.set(Permission.objects.filter(content_type__app_label="credentials"))
+        self.client.login(username="admin", password="pass123")
+        self.data = {"event": "Test Event", "valid_from": date.today(), "valid_until": date.today() + timedelta(days=2)}
+
+    def upload(self, content, **data):
+        credentials_file = SimpleUploadedFile("credentials.csv", content.encode(), content_type="text/csv")
+        return self.client.post(reverse("credentials:credential_import"),
+                                dict(self.data, credentials_file=credentials_file, **data))
+
+    @patch("credentials.utils.schedule_url_shortening")
+    def test_import_credentials(self, mock_schedule):
+        content = ("username,full_name,cpf,cin,photograph\n"
+                   "First User,First Name,123.456.789-09,,https://example.com/1.jpg\n"
+                   "Second User,Second Name,,AB123,https://example.com/2.jpg\n"
+                   " Third User , Third Name ,11144477735,,https://example.com/3.jpg\n")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.upload(content)
+        self.assertRedirects(response, reverse("credentials:credential_list"))
+        mock_schedule.assert_called_once_with()
+
+        credentials = list(Credential.objects.order_by("pk"))
+        self.assertEqual([credential.username for credential in credentials], ["First User", "Second User", "Third User"])
+        self.assertEqual([credential.cpf for credential in credentials], ["12345678909", None, "11144477735"])
+        self.assertEqual(credentials[1].cin, "AB123")
+        self.assertEqual(len({credential.verification_code for credential in credentials}), 3)
+        self.assertTrue(all(credential.issued_by == self.admin and credential.event == "Test Event"
+                            for credential in credentials))
+        self.assertEqual(list(Credential.objects.with_cpf("111.444.777-35")), [credentials[2]])
+
+    def test_import_credentials_errors(self):
+        Credential.objects.create(username="Issued", full_name="Issued", cpf="52998224725", event="test event",
+                                  valid_from=date.today(), valid_until=date.today())
+        content = ("username,full_name,cpf,photograph\n"
+                   "First User,First Name,12345678901,https://example.com/1.jpg\n"
+                   ",Second Name,,not a url\n"
+                   "Third User,Third Name,529.982.247-25,https://example.com/3.jpg\n")
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["form"].non_field_errors())[1:], [
+            _("CPF invalid! Verify row %(row)s, column 'cpf'") % {"row": 1},
+            _("Username invalid! Verify row %(row)s, column 'username'") % {"row": 2},
+            _("Photograph URL invalid! Verify row %(row)s, column 'photograph'") % {"row": 2},
+            _("CPF repeated or already issued for this event! Verify row %(row)s, column 'cpf'") % {"row": 3},
+        ])
+        self.assertEqual(Credential.objects.count(), 1)
+
+    def test_import_credentials_missing_columns(self):
+        response = self.upload("username,cpf\nFirst User,12345678909\n")
+        self.assertEqual(list(response.context["form"].non_field_errors())[1:],
+                         [_("One or more required columns are missing. Verify and submit again")])
+
+    def test_import_requires_permission(self):
+        User.objects.create_user(username="user", password="pass123")
+        self.client.login(username="user", password="pass123")
+        response = self.client.get(reverse("credentials:credential_import"))
+        self.assertEqual(response.status_code, 302)
+
+
+FETCHED_PHOTOGRAPHS = []
+
+
+def stub_photograph_fetcher(url):
+    FETCHED_PHOTOGRAPHS.append(url)
+    if "broken" in url:
+        raise PhotographError("Not found")
+    if "invalid" in url:
+        return b"not an image"
+    photograph = BytesIO()
+    Image.new("RGB", (600, 1000), "red").save(photograph, "PNG")
+    return photograph.getvalue()
+
+
+class PhotographStoreMixin:
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        FETCHED_PHOTOGRAPHS.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=directory.name,
+                                              QR_CODE_CACHE_DIR=os.path.join(directory.name, "qr_codes"),
+                                              CREDENTIAL_PHOTOGRAPH_FETCHER="credentials.tests.stub_photograph_fetcher")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class CredentialBadgesTests(PhotographStoreMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_user(username="admin", password="pass123")
+        self.admin.user_permissions.set(Permission.objects.filter(content_type__app_label="credentials"))
+        self.credentials = [
+            Credential.objects.create(username="User{:02d}".format(number), full_name="Participant Number {}".format(number),
+                                      event="Test Event", photograph="https://example.com/{}.jpg".format(number),
+                                      valid_from=date.today(), valid_until=date.today() + timedelta(days=2))
+            for number in range(12)
+        ]
+
+    def test_badge_data(self):
+        badge = badge_data(self.credentials[0])
+        self.assertEqual(badge["full_name"], "Participant Number 0")
+        self.assertEqual(badge["validation_url"], "{}{}?verification_code={}".format(
+            settings.SITE_URL, reverse("credentials:credential_validate"), self.credentials[0].verification_code))
+        self.assertIsNone(badge["photograph"])
+        self.assertEqual(FETCHED_PHOTOGRAPHS, [])
+
+        store_photograph(self.credentials[0])
+        badge = badge_data(Credential.objects.get(pk=self.credentials[0].pk))
+        self.assertEqual(Image.open(BytesIO(badge["photograph"])).size, (300, 400))
+        self.assertEqual(FETCHED_PHOTOGRAPHS, ["https://example.com/0.jpg"])
+
+    def test_qr_code_is_cached(self):
+        self.assertIs(qr_code_image("https://wmb.toolforge.org/", 110), qr_code_image("https://wmb.toolforge.org/", 110))
+        self.assertEqual(qr_code_image("https://wmb.toolforge.org/", 110).size, (110, 110))
+
+    def test_credential_qr_code(self):
+        credential = self.credentials[0]
+        url = reverse("credentials:credential_qr_code", args=[credential.verification_code])
+        self.assertContains(self.client.get(reverse("credentials:credential_validate"),
+                                            {"verification_code": credential.verification_code}), url)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertEqual(response.content, qr_code_png(credential_validation_url(credential.verification_code)))
+
+        self.assertEqual(self.client.get(reverse("credentials:credential_qr_code", args=["UNKNOWN"])).status_code, 404)
+
+    def test_stream_badge_sheets_pdf(self):
+        pdf = b"".join(stream_badge_sheets_pdf(self.credentials, workers=2))
+        reader = PdfReader(BytesIO(pdf))
+        self.assertEqual(len(reader.pages), 2)
+        self.assertAlmostEqual(float(reader.pages[0].mediabox.width), 595.28, places=2)
+
+    def test_export_credential_badges_command(self):
+        output = os.path.join(settings.MEDIA_ROOT, "credentials.pdf")
+        call_command("export_credential_badges", "test event", output=output, workers=2, stdout=StringIO())
+        self.assertEqual(len(PdfReader(output).pages), 2)
+
+        with self.assertRaises(CommandError):
+            call_command("export_credential_badges", "Other Event", stdout=StringIO())
+
+    def test_badge_sheet_without_photograph(self):
+        self.credentials[0].photograph = "https://example.com/broken.jpg"
+        self.assertIsNone(badge_data(self.credentials[0])["photograph"])
+        sheet = Image.open(BytesIO(render_badge_sheet([badge_data(self.credentials[0])])))
+        self.assertEqual((sheet.format, sheet.size), ("JPEG", SHEET_SIZE))
+
+    @patch("credentials.views.schedule_photograph_storing")
+    def test_credential_badges_view(self, mock_schedule):
+        store_photograph(self.credentials[0])
+        self.client.login(username="admin", password="pass123")
+        response = self.client.get(reverse("credentials:credential_badges"), {"event": "test event"})
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        pdf = b"".join(response.streaming_content)
+        self.assertEqual(len(PdfReader(BytesIO(pdf)).pages), 2)
+        self.assertEqual(pdf.count(b"/Filter /DCTDecode"), 2)
+        self.assertEqual(FETCHED_PHOTOGRAPHS, ["https://example.com/0.jpg"])
+        mock_schedule.assert_not_called()
+
+        response = self.client.get(reverse("credentials:credential_badges"), {"event": "Other Event"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_validate_from_qr_code(self):
+        response = self.client.get(reverse("credentials:credential_validate"),
+                                   {"verification_code": self.credentials[0].verification_code})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Test Event")
+
+
+class CredentialPhotographTests(PhotographStoreMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.credential = Credential.objects.create(username="TestUser", full_name="Test User", event="Test Event",
+                                                    photograph="https://example.com/photo.jpg",
+                                                    valid_from=date.today(), valid_until=date.today())
+
+    def test_store_photograph(self):
+        self.assertEqual(store_photographs(), (1, 0))
+        self.credential.refresh_from_db()
+        self.assertEqual(self.credential.photograph_file.name,
+                         "credentials/photographs/" + photograph_filename("https://example.com/photo.jpg"))
+        self.assertNotIn("photo", os.path.basename(self.credential.photograph_file.name))
+        with Image.open(self.credential.photograph_file) as image:
+            self.assertEqual((image.format, image.size), ("JPEG", (600, 1000)))
+
+        self.assertEqual(store_photographs(), (0, 0))
+        self.assertEqual(FETCHED_PHOTOGRAPHS, ["https://example.com/photo.jpg"])
+
+    def test_store_photographs_command_picks_up_changed_urls(self):
+        store_photographs()
+        Credential.objects.filter(pk=self.credential.pk).update(photograph="https://example.com/other.jpg")
+
+        call_command("store_credential_photographs", stdout=StringIO())
+        self.credential.refresh_from_db()
+        self.assertEqual(FETCHED_PHOTOGRAPHS, ["https://example.com/photo.jpg", "https://example.com/other.jpg"])
+        self.assertEqual(os.path.basename(self.credential.photograph_file.name),
+                         photograph_filename("https://example.com/other.jpg"))
+        self.assertEqual(store_photographs(), (0, 0))
+
+    def test_store_invalid_photographs(self):
+        for url in ["https://example.com/broken.jpg", "https://example.com/invalid.jpg"]:
+            Credential.objects.filter(pk=self.credential.pk).update(photograph_file="")
+            self.credential.photograph = url
+            self.credential.save()
+            self.assertEqual(store_photographs([self.credential.pk]), (0, 1))
+            self.credential.refresh_from_db()
+            self.assertFalse(self.credential.photograph_file)
+
+    def test_credential_photograph_view(self):
+        store_photographs()
+        url = reverse("credentials:credential_photograph", kwargs={"verification_code": self.credential.verification_code,
+                                                                   "size": "thumbnail"})
+        response = self.client.get(url)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertIn("max-age=86400", response["Cache-Control"])
+        self.assertEqual(Image.open(BytesIO(response.content)).size, (120, 160))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(reverse("credentials:credential_photograph", kwargs={
+            "verification_code": self.credential.verification_code, "size": "original"}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_photograph_is_deleted_with_the_credential(self):
+        store_photographs()
+        self.credential.refresh_from_db()
+        path = self.credential.photograph_file.path
+        self.credential.delete()
+        self.assertFalse(os.path.exists(path))
+
+    def test_failed_download_keeps_the_stored_photograph(self):
+        store_photographs()
+        self.credential.refresh_from_db()
+        path = self.credential.photograph_file.path
+
+        self.credential.photograph = "https://example.com/broken.jpg"
+        self.assertFalse(store_photograph(self.credential))
+        self.credential.refresh_from_db()
+        self.assertEqual(self.credential.photograph_file.path, path)
+        self.assertTrue(os.path.exists(path))
+
+        self.credential.photograph = "https://example.com/other.jpg"
+        self.assertTrue(store_photograph(self.credential))
+        self.assertNotEqual(self.credential.photograph_file.path, path)
+        self.assertTrue(os.path.exists(self.credential.photograph_file.path))
+        self.assertFalse(os.path.exists(path))
+
+    @patch("credentials.photographs.get_photograph_session")
+    def test_fetch_photograph_refuses_internal_addresses(self, mock_session):
+        for url in ["http://example.com/photo.jpg", "https://127.0.0.1/photo.jpg",
+                    "https://169.254.169.254/latest/meta-data", "https://[::ffff:10.0.0.5]/photo.jpg",
+                    "file:///etc/passwd"]:
+            with self.assertRaises(PhotographError):
+                fetch_photograph(url)
+        mock_session.assert_not_called()
+
+        redirect = mock_session.return_value.get.return_value.__enter__.return_value
+        redirect.is_redirect = True
+        redirect.headers = {"Location": "https://169.254.169.254/latest/meta-data"}
+        with self.assertRaises(PhotographError):
+            fetch_photograph("https://example.com/photo.jpg")
+        mock_session.return_value.get.assert_called_once_with("https://example.com/photo.jpg", timeout=ANY,
+                                                              stream=True, allow_redirects=False)
+
+        with override_settings(CREDENTIAL_PHOTOGRAPH_HOSTS=["upload.wikimedia.org"]):
+            with self.assertRaises(PhotographError):
+                fetch_photograph("https://example.com/photo.jpg")
+
+    def test_fetch_photograph_checks_the_connected_address(self):
+        # A host name is only resolved when connecting, so the address actually connected to is checked
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+        with self.assertRaisesMessage(PhotographError, "not public"):
+            fetch_photograph("https://localhost:{}/photo.jpg".format(listener.getsockname()[1]))
+
+    @patch("credentials.views.schedule_photograph_storing")
+    def test_photograph_is_stored_again_when_changed(self, mock_schedule):
+        admin = User.objects.create_user(username="admin", password="pass123")
+        admin.user_permissions.set(Permission.objects.filter(content_type__app_label="credentials"))
+        self.client.login(username="admin", password="pass123")
+        data = {"username": "TestUser", "full_name": "Test User", "event": "Test Event",
+                "photograph": "https://example.com/photo.jpg", "valid_from": date.today(), "valid_until": date.today()}
+        url = reverse("credentials:credential_update", kwargs={"verification_code": self.credential.verification_code})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, data)
+        mock_schedule.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, dict(data, photograph="https://example.com/other.jpg"))
+        mock_schedule.assert_called_once_with([self.credential.pk])
+
+
+class CredentialListTests(TestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username="admin", password="pass123")
+        self.admin.user_permissions.set(Permission.objects.filter(content_type__app_label="credentials"))
+        self.other = User.objects.create_user(username="other", password="pass123")
+        self.client.login(username="admin", password="pass123")
+        today = date.today()
+        self.credentials = [
+            Credential.objects.create(username="User{:02d}".format(number), full_name="User {}".format(number),
+                                      cpf="1234567890{}".format(number % 10), event="Event {}".format(number % 2),
+                                      issued_by=self.admin if number % 3 else self.other,
+                                      valid_from=today + timedelta(days=number), valid_until=today + timedelta(days=number + 1))
+            for number in range(7)
+        ]
+        Credential.objects.update(issued_at=self.credentials[0].issued_at)
+
+    def list_credentials(self, **params):
+        response = self.client.get(reverse("credentials:credential_list"), params)
+        return response, [credential.username for credential in response.context["credentials"]]
+
+    @patch("credentials.views.credentials_page")
+    def test_list_defers_encrypted_fields(self, mock_page):
+        mock_page.return_value = ([], None)
+        self.client.get(reverse("credentials:credential_list"))
+        queryset = mock_page.call_args[0][0]
+        self.assertEqual(queryset.query.deferred_loading, (frozenset(LIST_DEFERRED_FIELDS), True))
+        self.assertIn("issued_by", queryset.query.select_related)
+
+    def test_keyset_pagination(self):
+        usernames = []
+        params = {}
+        with patch("credentials.views.credentials_page", wraps=lambda queryset, cursor: credentials_page(
+                queryset, cursor, page_size=3)):
+            for page in range(3):
+                response, page_usernames = self.list_credentials(**params)
+                usernames += page_usernames
+                if response.context["next_page"]:
+                    params = QueryDict(response.context["next_page"]).dict()
+        self.assertEqual(usernames, ["User06", "User05", "User04", "User03", "User02", "User01", "User00"])
+        self.assertIsNone(response.context["next_page"])
+        self.assertEqual(response.context["first_page"], "")
+
+    def test_filters(self):
+        self.assertEqual(self.list_credentials(event="Event 1")[1], ["User05", "User03", "User01"])
+        self.assertEqual(self.list_credentials(issued_by=self.other.pk)[1], ["User06", "User03", "User00"])
+        window = date.today() + timedelta(days=2)
+        self.assertEqual(self.list_credentials(valid_from=window, valid_until=window)[1], ["User02", "User01"])
+        self.assertEqual(self.list_credentials(event="Event 0", q="user04")[1], ["User04"])
+
+    def test_invalid_cursor_starts_from_the_first_page(self):
+        response, usernames = self.list_credentials(after="invalid")
+        self.assertEqual(len(usernames), 7)
+
+
+class PurgeExpiredCredentialsTests(TestCase):
+
+    def setUp(self):
+        today = date.today()
+        self.credentials = [
+            Credential.objects.create(username="User{}".format(number), full_name="User {}".format(number),
+                                      cpf="12345678909", event="Test Event",
+                                      valid_from=today - timedelta(days=days + 2), valid_until=today - timedelta(days=days))
+            for number, days in enumerate([800, 500, 400, 10, -10])
+        ]
+
+    def test_purge_expired_credentials(self):
+        output = StringIO()
+        call_command("purge_expired_credentials", days=365, batch_size=2, stdout=output)
+        self.assertIn("Removed 3 credentials", output.getvalue())
+
+        self.assertEqual(list(Credential.objects.order_by("pk").values_list("username", flat=True)), ["User3", "User4"])
+        stubs = ExpiredCredential.objects.order_by("valid_until")
+        self.assertEqual([stub.verification_code for stub in stubs],
+                         [credential.verification_code for credential in self.credentials[:3]])
+        self.assertEqual(stubs[0].username, "")
+        self.assertEqual(stubs[0].event, "")
+
+    def test_archive_expired_credentials(self):
+        self.assertEqual(purge_expired_credentials(date.today() - timedelta(days=365), archive=True), 3)
+        archived = ExpiredCredential.objects.get(verification_code=self.credentials[0].verification_code)
+        self.assertEqual((archived.username, archived.event, archived.valid_from),
+                         ("User0", "Test Event", self.credentials[0].valid_from))
+        self.assertEqual(archived.issued_at, self.credentials[0].issued_at)
+
+    def test_dry_run(self):
+        output = StringIO()
+        call_command("purge_expired_credentials", dry_run=True, stdout=output)
+        self.assertIn("3 credentials expired", output.getvalue())
+        self.assertEqual(Credential.objects.count(), 5)
+
+    def test_validate_purged_credential(self):
+        purge_expired_credentials(date.today() - timedelta(days=365))
+        response = self.client.get(reverse("credentials:credential_validate"),
+                                   {"verification_code": self.credentials[0].verification_code})
+        self.assertContains(response, _("This credential verification code has expired."))
+
+        response = self.client.get(reverse("credentials:credential_validate"), {"verification_code": "unknown"})
+        self.assertContains(response, _("Invalid verification code."))
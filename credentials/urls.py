@@ -6,8 +6,13 @@ app_name = 'credentials'
 urlpatterns = [
     path("list/", views.credential_list, name="credential_list"),
     path("create/", views.credential_create, name="credential_create"),
+    path("import/", views.credential_import, name="credential_import"),
+    path("badges/", views.credential_badges, name="credential_badges"),
     path("<str:verification_code>/", views.credential_detail, name="credential_detail"),
     path("<str:verification_code>/edit/", views.credential_update, name="credential_update"),
+    path("<str:verification_code>/photograph/<str:size>.jpg", views.credential_photograph,
+         name="credential_photograph"),
+    path("<str:verification_code>/qr-code.png", views.credential_qr_code, name="credential_qr_code"),
     path("<str:verification_code>/delete/", views.credential_delete, name="credential_delete"),
     path("", views.credential_validate, name="credential_validate"),
 ]
\ No newline at end of file
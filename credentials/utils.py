@@ -0,0 +1,375 @@
+import datetime
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import connections, transaction
+from django.utils.translation import gettext as _
+from localflavor.br.validators import BRCPFValidator
+
+from credentials.fields import EncryptedTextField, blind_index, normalize_digits
+from credentials.models import Credential, ExpiredCredential, BLIND_INDEXES
+from credentials.photographs import photograph_is_current, store_photograph
+from credentials.services.wikimedia import shorten_url
+
+ROTATION_BATCH_SIZE = 500
+PURGE_BATCH_SIZE = 500
+SHORTENING_BATCH_SIZE = 50
+CREDENTIAL_COLUMNS = ["username", "full_name", "cpf", "cin", "photograph"]
+CREDENTIALS_PAGE_SIZE = 50
+# Encrypted columns and blind indexes that the list of credentials doesn't show
+LIST_DEFERRED_FIELDS = ["cpf", "cin", "photograph", "full_name_index", "cpf_index", "cin_index"]
+
+# Best effort only: queued tasks are lost when the process is recycled, and the thread may never run under
+# servers started without thread support. The management commands, run periodically, pick up whatever is left
+background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="credentials")
+background_lock = threading.Lock()
+queued_tasks = set()
+
+
+def encrypted_fields():
+    return [field.name for field in Credential._meta.concrete_fields if isinstance(field, EncryptedTextField)]
+
+
+def reindex_credentials(batch_size=ROTATION_BATCH_SIZE, pause=0, progress=None):
+    """
+    Function to compute again the blind indexes of every credential, after FIELD_BLIND_INDEX_KEY
+    changes. The credentials are read in batches of consecutive ids and each batch is written back
+    in its own short transaction
+
+    :param batch_size: Number of credentials updated per query
+    :param pause: Seconds to wait between two batches, to throttle the load on the database
+    :param progress: Function called after each batch with the id of the last credential indexed
+    :return: Number of credentials indexed
+    """
+    index_fields = [index_name for index_name, normalize in BLIND_INDEXES.values()]
+    total = 0
+    last_pk = 0
+    while True:
+        batch = list(Credential.objects.filter(pk__gt=last_pk).order_by("pk").only("pk", *BLIND_INDEXES)[:batch_size])
+        if not batch:
+            break
+        for credential in batch:
+            credential.update_blind_indexes(force=True)
+        with transaction.atomic():
+            Credential.objects.bulk_update(batch, index_fields)
+        last_pk = batch[-1].pk
+        total += len(batch)
+        if progress:
+            progress(last_pk)
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def rotate_credentials_encryption(batch_size=ROTATION_BATCH_SIZE, start_after=0, pause=0, progress=None):
+    """
+    Function to encrypt again every encrypted field of the credentials with the current encryption
+    key. The credentials are read in batches of consecutive ids, which needs no server side cursor,
+    and each batch is written back in its own short transaction, so the table is never locked for
+    long nor loaded into memory at once
+
+    :param batch_size: Number of credentials updated per query
+    :param start_after: Id of the last credential already rotated, to resume an interrupted rotation
+    :param pause: Seconds to wait between two batches, to throttle the load on the database
+    :param progress: Function called after each batch with the id of the last credential rotated
+    :return: Number of credentials rotated
+    """
+    fields = encrypted_fields()
+    total = 0
+    last_pk = start_after
+    while True:
+        batch = list(Credential.objects.filter(pk__gt=last_pk).order_by("pk").only("pk", *fields)[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            # Reading the fields decrypts them with any active key and saving them encrypts with the current one
+            Credential.objects.bulk_update(batch, fields)
+        last_pk = batch[-1].pk
+        total += len(batch)
+        if progress:
+            progress(last_pk)
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def shorten_pending_urls(batch_size=SHORTENING_BATCH_SIZE):
+    """
+    Function to shorten the Meta-Wiki profile URL of every credential that doesn't have one yet. The
+    credentials are read and updated in batches, and the ones that fail keep an empty URL so the next
+    run tries them again
+
+    :param batch_size: Number of credentials shortened before their URLs are saved
+    :return: Tuple with the number of URLs shortened and the number of failures
+    """
+    pending = Credential.objects.filter(url="").order_by("pk").only("pk", "username")
+    shortened = failed = 0
+    last_pk = 0
+    while True:
+        batch = list(pending.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+
+        updated = []
+        for credential in batch:
+            credential.url = shorten_url(credential.get_wikimedia_profile_url()) or ""
+            if credential.url:
+                updated.append(credential)
+        Credential.objects.bulk_update(updated, ["url"])
+        shortened += len(updated)
+        failed += len(batch) - len(updated)
+    return shortened, failed
+
+
+def run_in_background(task, args):
+    with background_lock:
+        queued_tasks.discard((task, args))
+    try:
+        task(*args)
+    finally:
+        connections.close_all()
+
+
+def schedule_in_background(task, *args):
+    """
+    Function to run a task in the background thread of the credentials, so requests don't wait for
+    Meta-Wiki or for the photographs to be downloaded. Calls made while the same task is already
+    waiting to start are merged into it. This is not durable: the pending work stays recorded in the
+    database, and the shorten_credential_urls and store_credential_photographs commands, run by a
+    scheduled job, complete it if the run is lost
+
+    :param task: Function to run
+    :param args: Arguments of the function
+    :return: Future of the run, or None if the same run was already waiting
+    """
+    with background_lock:
+        if (task, args) in queued_tasks:
+            return None
+        queued_tasks.add((task, args))
+    return background_executor.submit(run_in_background, task, args)
+
+
+def schedule_url_shortening():
+    return schedule_in_background(shorten_pending_urls)
+
+
+def store_photographs(credential_ids=None):
+    """
+    Function to download and store the photographs of some credentials, or of every credential whose
+    stored photograph is missing or was downloaded from another URL. Photograph URLs are encrypted, so
+    the credentials are compared in batches rather than filtered by the database
+
+    :param credential_ids: Ids of the credentials, all the pending ones by default
+    :return: Tuple with the number of photographs stored and the number of failures
+    """
+    credentials = Credential.objects.only("pk", "photograph", "photograph_file").order_by("pk")
+    if credential_ids is not None:
+        credentials = credentials.filter(pk__in=credential_ids)
+    stored = failed = 0
+    last_pk = 0
+    while True:
+        batch = list(credentials.filter(pk__gt=last_pk)[:SHORTENING_BATCH_SIZE])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        for credential in batch:
+            if not credential.photograph or photograph_is_current(credential):
+                continue
+            if store_photograph(credential):
+                stored += 1
+            else:
+                failed += 1
+    return stored, failed
+
+
+def schedule_photograph_storing(credential_ids=None):
+    if credential_ids is None:
+        return schedule_in_background(store_photographs)
+    return schedule_in_background(store_photographs, tuple(sorted(credential_ids)))
+
+
+def is_valid(validator, value):
+    try:
+        validator(value)
+    except ValidationError:
+        return False
+    return True
+
+
+def read_credentials_file(credentials_file):
+    """
+    Function to read a CSV file of credentials
+
+    :param credentials_file: Uploaded CSV file
+    :return: DataFrame with one credential per row, with the CPFs reduced to their digits
+    """
+    df = pd.read_csv(credentials_file, dtype=str, keep_default_na=False)
+    df.columns = df.columns.str.strip()
+    df = df.apply(lambda column: column.str.strip())
+    df.replace("", pd.NA, inplace=True)
+    if "cpf" in df.columns:
+        df["cpf"] = df["cpf"].map(normalize_digits, na_action="ignore").replace("", pd.NA)
+    return df
+
+
+def validate_credentials(df, event):
+    """
+    Function to validate all the credentials of a file at once. CPFs are checked with their check
+    digits, and must not repeat in the file nor belong to a credential already issued for the event
+
+    :param df: DataFrame read by read_credentials_file
+    :param event: Name of the event the credentials are issued for
+    :return: List of errors
+    """
+    if not {"username", "full_name", "photograph"}.issubset(df.columns):
+        return [_("One or more required columns are missing. Verify and submit again")]
+    if df.empty:
+        return [_("Your file is empty. Verify and submit again")]
+
+    df = df.reindex(columns=CREDENTIAL_COLUMNS).astype("string")
+    cpf_validator = BRCPFValidator()
+    url_validator = URLValidator()
+    issued_cpfs = set(Credential.objects.filter(event__iexact=event, cpf_index__isnull=False)
+                      .values_list("cpf_index", flat=True))
+    cpf_indexes = df["cpf"].map(lambda cpf: blind_index(cpf, normalize_digits), na_action="ignore")
+
+    checks = [
+        (df["username"].isna() | (df["username"].str.len() > 240),
+         _("Username invalid! Verify row %(row)s, column 'username'")),
+        (df["full_name"].isna() | (df["full_name"].str.len() > 240),
+         _("Full name invalid! Verify row %(row)s, column 'full_name'")),
+        (df["cpf"].notna() & ~df["cpf"].map(lambda cpf: is_valid(cpf_validator, cpf), na_action="ignore")
+         .fillna(True).astype(bool),
+         _("CPF invalid! Verify row %(row)s, column 'cpf'")),
+        (df["cpf"].notna() & (df["cpf"].duplicated(keep=False) | cpf_indexes.isin(issued_cpfs)),
+         _("CPF repeated or already issued for this event! Verify row %(row)s, column 'cpf'")),
+        (df["cin"].str.len() > 24, _("CIN invalid! Verify row %(row)s, column 'cin'")),
+        (df["photograph"].isna() | (df["photograph"].str.len() > 420)
+         | ~df["photograph"].map(lambda url: is_valid(url_validator, url), na_action="ignore").fillna(False)
+         .astype(bool),
+         _("Photograph URL invalid! Verify row %(row)s, column 'photograph'")),
+    ]
+    errors = sorted((position, index, message)
+                    for index, (invalid, message) in enumerate(checks)
+                    for position in np.flatnonzero(invalid.fillna(False).to_numpy(dtype=bool)))
+    return [message % {"row": position + 1} for position, index, message in errors]
+
+
+def import_credentials(df, event, valid_from, valid_until, issued_by):
+    """
+    Function to issue the credentials of a validated file with a single insertion. As bulk_create does
+    not call save(), the verification codes and blind indexes are generated here, and the URLs are
+    shortened and the photographs stored in the background once the credentials are committed
+
+    :param df: DataFrame validated by validate_credentials
+    :param event: Name of the event the credentials are issued for
+    :param valid_from: First day the credentials are valid
+    :param valid_until: Last day the credentials are valid
+    :param issued_by: User issuing the credentials
+    :return: List of the Credential objects created
+    """
+    df = df.reindex(columns=CREDENTIAL_COLUMNS)
+    df = df.astype(object).where(df.notna(), None)
+    credentials = []
+    for row in df.itertuples(index=False):
+        credential = Credential(username=row.username, full_name=row.full_name, cpf=row.cpf, cin=row.cin,
+                                photograph=row.photograph, event=event, valid_from=valid_from,
+                                valid_until=valid_until, issued_by=issued_by,
+                                verification_code=secrets.token_urlsafe(16))
+        credential.update_blind_indexes()
+        credentials.append(credential)
+
+    with transaction.atomic():
+        credentials = Credential.objects.bulk_create(credentials, batch_size=500)
+        transaction.on_commit(schedule_url_shortening)
+        # Some databases don't return the ids of the rows inserted in bulk, then every pending photograph is stored
+        credential_ids = None if any(credential.pk is None for credential in credentials) else [
+            credential.pk for credential in credentials]
+        transaction.on_commit(lambda: schedule_photograph_storing(credential_ids))
+    return credentials
+
+
+def encode_cursor(credential):
+    return "{}_{}".format(credential.issued_at.isoformat(), credential.pk)
+
+
+def decode_cursor(cursor):
+    """
+    Function to read the position of a page of credentials
+
+    :param cursor: Text built by encode_cursor
+    :return: Tuple with the issue date and the id of the last credential of the previous page, or None if invalid
+    """
+    try:
+        issued_at, pk = (cursor or "").rsplit("_", 1)
+        return datetime.datetime.fromisoformat(issued_at), int(pk)
+    except ValueError:
+        return None
+
+
+def credentials_page(queryset, cursor=None, page_size=CREDENTIALS_PAGE_SIZE):
+    """
+    Function to get one page of credentials, from the newest to the oldest. The page starts after the
+    credential given by the cursor instead of skipping an offset, so every page is read through the
+    indexes on the issue date no matter how far it is
+
+    :param queryset: Credentials to paginate
+    :param cursor: Position of the page, built by encode_cursor from the last credential of the previous page
+    :param page_size: Number of credentials per page
+    :return: Tuple with the list of credentials and the cursor of the next page, or None if it is the last one
+    """
+    queryset = queryset.order_by("-issued_at", "-pk")
+    position = decode_cursor(cursor)
+    if position:
+        queryset = queryset.issued_before(*position)
+    credentials = list(queryset[:page_size + 1])
+    if len(credentials) > page_size:
+        return credentials[:page_size], encode_cursor(credentials[page_size - 1])
+    return credentials, None
+
+
+def purge_expired_credentials(before, archive=False, batch_size=PURGE_BATCH_SIZE, pause=0, progress=None):
+    """
+    Function to remove the credentials that expired before a date, in batches that each run in a short
+    transaction. A stub with the verification code is kept for each one, so its QR code still answers
+    that it expired, and archiving also keeps the username, event and dates, but no personal data
+
+    :param before: Credentials valid until before this date are removed
+    :param archive: Whether to keep the username, event and dates of the credentials
+    :param batch_size: Number of credentials removed per transaction
+    :param pause: Seconds to wait between two batches, to throttle the load on the database
+    :param progress: Function called after each batch with the number of credentials removed so far
+    :return: Number of credentials removed
+    """
+    fields = ["pk", "verification_code", "valid_until"]
+    if archive:
+        fields += ["username", "event", "valid_from", "issued_at"]
+    expired = Credential.objects.filter(valid_until__lt=before).order_by("valid_until", "pk").only(*fields)
+
+    total = 0
+    while True:
+        batch = list(expired[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            ExpiredCredential.objects.bulk_create([
+                ExpiredCredential(verification_code=credential.verification_code, valid_until=credential.valid_until,
+                                  **({"username": credential.username, "event": credential.event,
+                                      "valid_from": credential.valid_from, "issued_at": credential.issued_at}
+                                     if archive else {}))
+                for credential in batch
+            ], ignore_conflicts=True)
+            Credential.objects.filter(pk__in=[credential.pk for credential in batch]).delete()
+        total += len(batch)
+        if progress:
+            progress(total)
+        if pause:
+            time.sleep(pause)
+    return total
@@ -1,13 +1,24 @@
+import hashlib
 from datetime import date
+
+import pandas as pd
 from django.utils.translation import gettext_lazy as _
 from django.db import transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required, permission_required
 from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from wmb.qrcodes import qr_code_png, QR_CODE_MAX_AGE
 
-from .models import Credential
-from .forms import CredentialForm
-from .services.wikimedia import shorten_url
+from .models import Credential, ExpiredCredential
+from .badges import credential_validation_url, stream_badge_sheets_pdf
+from .forms import CredentialForm, CredentialImportForm, CredentialFilterForm
+from .photographs import photograph_thumbnail, PHOTOGRAPH_SIZES, PHOTOGRAPH_MAX_AGE
+from .utils import (schedule_url_shortening, schedule_photograph_storing, read_credentials_file, validate_credentials,
+                    import_credentials, credentials_page, LIST_DEFERRED_FIELDS)
 
 
 # LIST
@@ -15,8 +26,24 @@ def credential_list(request):
     if not request.user.has_perm("credentials.add_credential"):
         return redirect("credentials:credential_validate")
 
-    credentials = Credential.objects.all().order_by("-issued_at")
-    return render(request, "credentials/credential_list.html", {"credentials": credentials})
+    form = CredentialFilterForm(request.GET)
+    credentials = (form.filter(Credential.objects.all()).select_related("issued_by")
+                   .defer(*LIST_DEFERRED_FIELDS))
+    credentials, next_cursor = credentials_page(credentials, form.cleaned_data.get("after"))
+
+    first_query = request.GET.copy()
+    first_query.pop("after", None)
+    next_query = request.GET.copy()
+    next_query["after"] = next_cursor
+    events = Credential.objects.order_by("event").values_list("event", flat=True).distinct()
+    context = {
+        "credentials": credentials,
+        "form": form,
+        "events": events,
+        "next_page": next_query.urlencode() if next_cursor else None,
+        "first_page": first_query.urlencode() if form.cleaned_data.get("after") else None,
+    }
+    return render(request, "credentials/credential_list.html", context)
 
 
 # DETAIL
@@ -37,16 +64,8 @@ def credential_create(request):
             credential = form.save(commit=False)
             credential.issued_by = request.user
             credential.save()
-
-            def generate_short_url():
-                long_url = credential.get_wikimedia_profile_url()
-                short = shorten_url(long_url)
-
-                if short:
-                    credential.url = short
-                    credential.save(update_fields=["url"])
-
-            transaction.on_commit(generate_short_url)
+            transaction.on_commit(schedule_url_shortening)
+            transaction.on_commit(lambda: schedule_photograph_storing([credential.pk]))
 
             return redirect(reverse("credentials:credential_detail", kwargs={"verification_code":credential.verification_code}))
     else:
@@ -57,6 +76,73 @@ def credential_create(request):
     })
 
 
+# IMPORT
+@permission_required("credentials.add_credential")
+def credential_import(request):
+    form = CredentialImportForm(request.POST or None, request.FILES or None)
+    if request.method == "POST" and form.is_valid():
+        try:
+            df = read_credentials_file(form.cleaned_data["credentials_file"])
+            errors = validate_credentials(df, form.cleaned_data["event"])
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError):
+            errors = [_("The file could not be read. Verify and submit again")]
+
+        if errors:
+            form.add_error(None, _("Errors in the file:"))
+            for err in errors:
+                form.add_error(None, err)
+        else:
+            import_credentials(df, form.cleaned_data["event"], form.cleaned_data["valid_from"],
+                               form.cleaned_data["valid_until"], request.user)
+            return redirect(reverse("credentials:credential_list"))
+
+    return render(request, "credentials/credential_import.html", {"form": form})
+
+
+# BADGES
+@permission_required("credentials.view_credential", raise_exception=True)
+def credential_badges(request):
+    event = request.GET.get("event", "").strip()
+    credentials = list(Credential.objects.filter(event__iexact=event).order_by("username", "pk")) if event else []
+    if not credentials:
+        raise Http404
+
+    # Sheets are drawn serially in the web process; the export_credential_badges command draws them in parallel
+    response = StreamingHttpResponse(stream_badge_sheets_pdf(credentials, workers=1), content_type="application/pdf")
+    response["Content-Disposition"] = 'attachment; filename="credentials.pdf"'
+    return response
+
+
+# PHOTOGRAPH
+def photograph_etag(request, verification_code, size):
+    credential = Credential.objects.filter(verification_code=verification_code).only("photograph_file").first()
+    if credential and credential.photograph_file and size in PHOTOGRAPH_SIZES:
+        return hashlib.md5("{}:{}".format(credential.photograph_file.name, size).encode("utf-8")).hexdigest()
+    return None
+
+
+@condition(etag_func=photograph_etag)
+def credential_photograph(request, verification_code, size):
+    credential = get_object_or_404(Credential.objects.only("photograph_file", "valid_until"),
+                                   verification_code=verification_code)
+    if (size not in PHOTOGRAPH_SIZES or not credential.photograph_file
+            or (credential.valid_until < date.today() and not request.user.has_perm("credentials.view_credential"))):
+        raise Http404
+
+    thumbnail = photograph_thumbnail(credential, size)
+    response = HttpResponse(thumbnail.read(), content_type="image/jpeg")
+    patch_cache_control(response, private=True, max_age=PHOTOGRAPH_MAX_AGE)
+    return response
+
+
+# QR CODE
+def credential_qr_code(request, verification_code):
+    get_object_or_404(Credential.objects.only("pk"), verification_code=verification_code)
+    response = HttpResponse(qr_code_png(credential_validation_url(verification_code)), content_type="image/png")
+    patch_cache_control(response, public=True, max_age=QR_CODE_MAX_AGE)
+    return response
+
+
 # UPDATE
 @permission_required("credentials.change_credential")
 def credential_update(request, verification_code):
@@ -66,6 +152,8 @@ def credential_update(request, verification_code):
         form = CredentialForm(request.POST, instance=credential)
         if form.is_valid():
             form.save()
+            if "photograph" in form.changed_data:
+                transaction.on_commit(lambda: schedule_photograph_storing([credential.pk]))
             return redirect("credentials:credential_detail", verification_code=verification_code)
     else:
         form = CredentialForm(instance=credential)
@@ -91,8 +179,8 @@ def credential_delete(request, verification_code):
 
 
 def credential_validate(request):
-    if request.method == "POST":
-        verification_code = request.POST.get("verification_code", "").strip()
+    if request.method == "POST" or "verification_code" in request.GET:
+        verification_code = request.POST.get("verification_code", request.GET.get("verification_code", "")).strip()
 
         if verification_code:
             try:
@@ -102,7 +190,8 @@ def credential_validate(request):
                 else:
                     return render(request, "credentials/credential_detail.html", {"credential": credential})
             except Credential.DoesNotExist:
-                pass
+                if ExpiredCredential.objects.filter(verification_code=verification_code).exists():
+                    return render(request, "credentials/credential_validate.html", {"error": _("This credential verification code has expired.")})
 
         return render(request, "credentials/credential_validate.html", {"error": _("Invalid verification code.")})
 
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from events.statistics import rebuild_statistics
+
+
+class Command(BaseCommand):
+    help = "Recomputes the aggregated event statistics from the certificates table"
+
+    def handle(self, *args, **options):
+        statistics, participations = rebuild_statistics()
+        self.stdout.write(self.style.SUCCESS(
+            "Rebuilt {} event statistics and {} participations.".format(statistics, participations)))
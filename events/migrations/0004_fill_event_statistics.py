@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:10
+
+import re
+from collections import defaultdict
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def fill_event_statistics(apps, schema_editor):
+    Certificate = apps.get_model('certificates', 'Certificate')
+    EventStatistic = apps.get_model('events', 'EventStatistic')
+    EventParticipation = apps.get_model('events', 'EventParticipation')
+
+    statistics = defaultdict(lambda: [0, 0])
+    participations = defaultdict(int)
+    certificates = (Certificate.objects.filter(event__isnull=False)
+                    .only('event', 'username', 'role', 'hours', 'emitted_at').order_by('id'))
+    for certificate in certificates.iterator(chunk_size=1000):
+        month = timezone.localdate(certificate.emitted_at or timezone.now()).replace(day=1)
+        match = re.match(r"^(\d+)[h,H](\d+)$", certificate.hours or "")
+        statistic = statistics[(certificate.event_id, month, certificate.role)]
+        statistic[0] += 1
+        statistic[1] += int(match.group(1)) * 60 + int(match.group(2)) if match else 0
+        if certificate.username_id:
+            participations[(certificate.event_id, certificate.username_id)] += 1
+
+    EventStatistic.objects.all().delete()
+    EventParticipation.objects.all().delete()
+    EventStatistic.objects.bulk_create([
+        EventStatistic(event_id=event_id, month=month, role=role, number_of_certificates=count, minutes=minutes)
+        for (event_id, month, role), (count, minutes) in statistics.items()
+    ], batch_size=500)
+    EventParticipation.objects.bulk_create([
+        EventParticipation(event_id=event_id, participant_id=participant_id, number_of_certificates=count)
+        for (event_id, participant_id), count in participations.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_eventparticipation_eventstatistic'),
+        ('certificates', '0003_certificate_with_hours'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_event_statistics, migrations.RunPython.noop),
+    ]
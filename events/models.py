@@ -16,4 +16,34 @@ class Event(models.Model):
     def save(self, *args, **kwargs):
         if not self.date_end:
             self.date_end = self.date_start
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+
+class EventStatistic(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='statistics')
+    month = models.DateField()
+    role = models.CharField(max_length=200)
+    number_of_certificates = models.IntegerField(default=0)
+    minutes = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'month', 'role'], name='unique_event_statistic'),
+        ]
+
+    def __str__(self):
+        return f"{self.event} - {self.month:%m/%Y} - {self.role}"
+
+
+class EventParticipation(models.Model):
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='participations')
+    participant = models.ForeignKey('users.Participant', on_delete=models.CASCADE, related_name='participations')
+    number_of_certificates = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'participant'], name='unique_event_participation'),
+        ]
+
+    def __str__(self):
+        return f"{self.event} - {self.participant}"
@@ -0,0 +1,25 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from certificates.models import Certificate
+from events.statistics import update_statistics
+
+
+@receiver(pre_save, sender=Certificate)
+def discard_previous_certificate_statistics(sender, instance, raw=False, **kwargs):
+    if raw or not instance.pk:
+        return
+    previous = Certificate.objects.filter(pk=instance.pk).only("event", "username", "role", "minutes", "emitted_at").first()
+    if previous:
+        update_statistics(previous, -1)
+
+
+@receiver(post_save, sender=Certificate)
+def record_certificate_statistics(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_statistics(instance, 1)
+
+
+@receiver(post_delete, sender=Certificate)
+def discard_certificate_statistics(sender, instance, **kwargs):
+    update_statistics(instance, -1)
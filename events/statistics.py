@@ -0,0 +1,87 @@
+from django.db import transaction
+from django.db.models import F, Count, Sum, DateField
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from certificates.models import Certificate
+from events.models import EventStatistic, EventParticipation
+
+
+def certificate_month(certificate):
+    """
+    Function to get the month a certificate was emitted in, used as the
+    time bucket of the event statistics
+
+    :param certificate: Certificate object
+    :return: Date of the first day of the month the certificate was emitted
+    """
+    emitted_at = certificate.emitted_at or timezone.now()
+    return timezone.localdate(emitted_at).replace(day=1)
+
+
+def update_statistics(certificate, sign):
+    """
+    Function to add (sign=1) or remove (sign=-1) the contribution of one
+    certificate to the aggregated statistics of its event
+
+    :param certificate: Certificate object
+    :param sign: 1 when the certificate is created, -1 when it is removed
+    """
+    if not certificate.event_id:
+        return
+
+    with transaction.atomic():
+        statistic, created = EventStatistic.objects.get_or_create(event_id=certificate.event_id,
+                                                                  month=certificate_month(certificate),
+                                                                  role=certificate.role)
+        EventStatistic.objects.filter(pk=statistic.pk).update(
+            number_of_certificates=F("number_of_certificates") + sign,
+            minutes=F("minutes") + sign * certificate.minutes)
+        EventStatistic.objects.filter(pk=statistic.pk, number_of_certificates__lte=0).delete()
+
+        if certificate.username_id:
+            participation, created = EventParticipation.objects.get_or_create(event_id=certificate.event_id,
+                                                                              participant_id=certificate.username_id)
+            EventParticipation.objects.filter(pk=participation.pk).update(
+                number_of_certificates=F("number_of_certificates") + sign)
+            EventParticipation.objects.filter(pk=participation.pk, number_of_certificates__lte=0).delete()
+
+
+def rebuild_statistics(event_ids=None):
+    """
+    Function to recompute the event statistics from the certificates table. Used to initialize
+    the aggregates and to repair them if they ever drift. The signals only see certificates that
+    are saved or deleted one at a time, so code that changes them with a queryset update() or
+    bulk_create() must call this function with the events it touched
+
+    :param event_ids: Ids of the events to recompute, every event by default
+    :return: Tuple with the number of statistics and participations created
+    """
+    certificates = Certificate.objects.filter(event__isnull=False).order_by()
+    existing_statistics = EventStatistic.objects.all()
+    existing_participations = EventParticipation.objects.all()
+    if event_ids is not None:
+        certificates = certificates.filter(event_id__in=event_ids)
+        existing_statistics = existing_statistics.filter(event_id__in=event_ids)
+        existing_participations = existing_participations.filter(event_id__in=event_ids)
+
+    statistics = (certificates.annotate(month=TruncMonth("emitted_at", output_field=DateField()))
+                  .values_list("event", "month", "role")
+                  .annotate(count=Count("id"), minutes=Sum("minutes")))
+    participations = (certificates.filter(username__isnull=False)
+                      .values_list("event", "username")
+                      .annotate(count=Count("id")))
+
+    with transaction.atomic():
+        existing_statistics.delete()
+        existing_participations.delete()
+        statistics = EventStatistic.objects.bulk_create([
+            EventStatistic(event_id=event_id, month=month, role=role, number_of_certificates=count, minutes=minutes)
+            for event_id, month, role, count, minutes in statistics
+        ], batch_size=500)
+        participations = EventParticipation.objects.bulk_create([
+            EventParticipation(event_id=event_id, participant_id=participant_id, number_of_certificates=count)
+            for event_id, participant_id, count in participations
+        ], batch_size=500)
+
+    return len(statistics), len(participations)
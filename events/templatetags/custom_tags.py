@@ -1,8 +1,9 @@
-import calendar
-import locale
 from django.utils.translation import gettext_lazy as _
 from django import template
 
+from certificates.models import minutes_to_hours
+from certificates.utils import month_name, CERTIFICATE_LANGUAGE
+
 
 register = template.Library()
 
@@ -10,7 +11,7 @@ register = template.Library()
 @register.filter
 def format_date(date_start, date_end):
     d_start, d_end = date_start.day, date_end.day
-    m_start, m_end = calendar.month_name[date_start.month], calendar.month_name[date_end.month]
+    m_start, m_end = month_name(date_start.month), month_name(date_end.month)
     y_start, y_end = date_start.year, date_end.year
 
     if date_start == date_end:
@@ -41,5 +42,10 @@ def format_date(date_start, date_end):
 
 @register.filter
 def get_month_name(month):
-    locale.setlocale(locale.LC_TIME, 'pt_BR.UTF-8')
-    return calendar.month_name[int(month)]
\ No newline at end of file
+    return month_name(month, CERTIFICATE_LANGUAGE)
+
+
+@register.filter
+def format_minutes(minutes):
+    return minutes_to_hours(minutes)
+
@@ -1,9 +1,16 @@
 import io
 import calendar
+import importlib
+from io import StringIO
 import pandas as pd
 from datetime import date
+from unittest.mock import patch
 
+from django.apps import apps
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.core.management import call_command
 from django.urls import reverse
 from django.conf import settings
 from django.templatetags.static import static
@@ -16,8 +23,10 @@ from django.contrib.contenttypes.models import ContentType
 
 from certificates.forms import UploadForm
 from certificates.models import Certificate
-from events.models import Event
+from certificates.tests import QRCodeStoreMixin
+from events.models import Event, EventStatistic, EventParticipation
 from events.forms import EventForm
+from events.statistics import rebuild_statistics
 from users.models import User, Participant
 
 
@@ -92,8 +101,9 @@ class EventModelTest(TestCase):
         self.assertIsNotNone(event.created_by)
         self.assertEqual(event.created_by, self.user)
 
-class EventViewsTest(TestCase):
+class EventViewsTest(QRCodeStoreMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.username = "Username"
         self.password = "Password"
         self.user = User.objects.create_user(self.username, self.password)
@@ -374,6 +384,21 @@ class EventViewsTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse("events:event_detail", kwargs={"event_id": event.id}))
 
+    def test_event_confirm_certification_post_view_merges_usernames_with_different_case(self):
+        event = Event.objects.create(**self.data)
+        participant = Participant.objects.create(participant_username="Test Username", participant_full_name="Test Name")
+        data = {"csv_table": "name,username,pronoun,hours,role\n"
+                             "Test Name,test_username,o,02h29,participant\n"
+                             "Other Name,Other Username,a,01h00,participant\n"
+                             "Another Name,OTHER USERNAME,a,01h00,participant",
+                "background": "background.png"}
+        self.client.post(reverse("events:event_confirm_certificate", kwargs={"event_id": event.id}), data=data)
+
+        self.assertEqual(Participant.objects.count(), 2)
+        self.assertEqual(Certificate.objects.filter(event=event, username=participant).count(), 1)
+        other = Participant.objects.get(participant_username_key="other username")
+        self.assertEqual(other.number_of_certificates, 2)
+
     def test_event_confirm_certification_post_view_with_missing_data(self):
         self.client.login(username=self.username, password=self.password)
         event = Event.objects.create(**self.data)
@@ -446,4 +471,127 @@ class FormatDateFilterTest(TestCase):
         self.assertEqual(rendered, "janeiro")
 
         rendered = self.template_2.render(self.context_6)
-        self.assertEqual(rendered, "dezembro")
\ No newline at end of file
+        self.assertEqual(rendered, "dezembro")
+
+
+class EventStatisticsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("Username", password="Password")
+        self.user.user_permissions.add(Permission.objects.get(codename="view_event", name="Can view event"))
+        self.event = Event.objects.create(event_name="Event Name", date_start=date(2024, 1, 1))
+        self.participant = Participant.objects.create(participant_username="Participant")
+
+    def create_certificate(self, **kwargs):
+        data = {"name": "Name", "username": self.participant, "event": self.event, "hours": "02h30",
+                "role": "ouvinte", "background": "background.png"}
+        data.update(kwargs)
+        return Certificate.objects.create(**data)
+
+    def test_creating_certificates_updates_the_aggregates(self):
+        self.create_certificate()
+        self.create_certificate(hours="01h45")
+        self.create_certificate(role="palestrante", username=None)
+
+        self.assertEqual(EventStatistic.objects.get(event=self.event, role="ouvinte").number_of_certificates, 2)
+        self.assertEqual(EventStatistic.objects.get(event=self.event, role="ouvinte").minutes, 255)
+        self.assertEqual(EventStatistic.objects.get(event=self.event, role="palestrante").number_of_certificates, 1)
+        self.assertEqual(EventParticipation.objects.get(event=self.event, participant=self.participant).number_of_certificates, 2)
+
+    def test_deleting_certificates_updates_the_aggregates(self):
+        certificate = self.create_certificate()
+        self.create_certificate(hours="01h45")
+
+        certificate.delete()
+        statistic = EventStatistic.objects.get(event=self.event, role="ouvinte")
+        self.assertEqual(statistic.number_of_certificates, 1)
+        self.assertEqual(statistic.minutes, 105)
+
+        Certificate.objects.all().delete()
+        self.assertFalse(EventStatistic.objects.exists())
+        self.assertFalse(EventParticipation.objects.exists())
+
+    def test_updating_a_certificate_moves_its_contribution(self):
+        certificate = self.create_certificate()
+        certificate.role = "palestrante"
+        certificate.hours = "10h00"
+        certificate.save()
+
+        self.assertFalse(EventStatistic.objects.filter(role="ouvinte").exists())
+        self.assertEqual(EventStatistic.objects.get(role="palestrante").minutes, 600)
+
+    def test_failed_update_keeps_the_aggregates(self):
+        certificate = self.create_certificate()
+        certificate.role = "palestrante"
+
+        with patch.object(Certificate, "_save_table", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                certificate.save()
+
+        self.assertEqual(EventStatistic.objects.get().role, "ouvinte")
+        self.assertEqual(EventStatistic.objects.get().number_of_certificates, 1)
+
+    def test_rebuild_command_recomputes_the_aggregates(self):
+        self.create_certificate()
+        self.create_certificate(hours="01h45")
+        EventStatistic.objects.all().delete()
+        EventParticipation.objects.all().delete()
+
+        call_command("rebuild_event_statistics", stdout=StringIO())
+
+        statistic = EventStatistic.objects.get(event=self.event, role="ouvinte")
+        self.assertEqual(statistic.number_of_certificates, 2)
+        self.assertEqual(statistic.minutes, 255)
+        self.assertEqual(EventParticipation.objects.get().number_of_certificates, 2)
+
+    def test_migration_fills_the_aggregates(self):
+        self.create_certificate()
+        self.create_certificate(hours="01h45", username=None)
+        EventStatistic.objects.all().delete()
+        EventParticipation.objects.all().delete()
+
+        migration = importlib.import_module("events.migrations.0004_fill_event_statistics")
+        migration.fill_event_statistics(apps, None)
+
+        self.assertEqual(EventStatistic.objects.get(event=self.event, role="ouvinte").minutes, 255)
+        self.assertEqual(EventParticipation.objects.get().number_of_certificates, 1)
+
+    def test_rebuilding_the_events_changed_by_a_queryset_update(self):
+        other_event = Event.objects.create(event_name="Other Event", date_start=date(2024, 2, 1))
+        self.create_certificate()
+        self.create_certificate(event=other_event)
+
+        Certificate.objects.filter(event=self.event).update(role="palestrante")
+        rebuild_statistics([self.event.pk])
+
+        self.assertEqual(EventStatistic.objects.get(event=self.event).role, "palestrante")
+        self.assertEqual(EventStatistic.objects.get(event=other_event).role, "ouvinte")
+        self.assertEqual(EventParticipation.objects.count(), 2)
+
+    def test_deleting_an_event_discards_its_aggregates(self):
+        certificate = self.create_certificate()
+        other_event = Event.objects.create(event_name="Other Event", date_start=date(2024, 2, 1))
+        self.create_certificate(event=other_event)
+
+        self.event.delete()
+
+        certificate.refresh_from_db()
+        self.assertIsNone(certificate.event)
+        self.assertEqual(list(EventStatistic.objects.values_list("event", flat=True)), [other_event.pk])
+        self.assertEqual(list(EventParticipation.objects.values_list("event", flat=True)), [other_event.pk])
+
+    def test_statistics_view_reads_the_aggregates(self):
+        self.create_certificate()
+        self.create_certificate(hours="01h45", username=None)
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("events:event_statistics"))
+
+        self.assertFalse([query for query in queries if "certificates_certificate" in query["sql"]])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "events/event_statistics.html")
+        self.assertEqual(response.context["certificates"], 2)
+        self.assertEqual(response.context["minutes"], 255)
+        self.assertEqual(response.context["participants"], 1)
+        self.assertContains(response, "4h15")
@@ -7,6 +7,7 @@ app_name = "events"
 urlpatterns = [
     path('create', views.event_create, name='event_create'),
     path('', views.event_list, name='event_list'),
+    path('statistics', views.event_statistics, name='event_statistics'),
     path('<int:event_id>', views.event_detail, name='event_detail'),
     path('<int:event_id>/update', views.event_update, name='event_update'),
     path('<int:event_id>/delete', views.event_delete, name='event_delete'),
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, Sum
 from django.shortcuts import render, redirect, reverse
 from django.utils.translation import gettext_lazy as _
 from django.core.files.storage import default_storage
@@ -11,10 +12,11 @@ from django.templatetags.static import static
 from django.contrib.auth.decorators import permission_required
 
 from certificates.forms import UploadForm
-from certificates.utils import validate_csv, certificate_create, download_certificate, download_certificates
+from certificates.utils import validate_csv, certificate_create, download_certificate, download_certificates, resolve_participants
 
 from events.forms import EventForm
-from events.models import Event
+from events.models import Event, EventStatistic, EventParticipation
+from users.models import normalize_username
 
 
 # ======================================================================================================================
@@ -49,6 +51,31 @@ def event_detail(request, event_id):
     return render(request, "events/event_detail.html", context)
 
 
+@permission_required('events.view_event', raise_exception=True)
+def event_statistics(request):
+    statistics = EventStatistic.objects.all()
+    totals = statistics.aggregate(certificates=Sum("number_of_certificates"), minutes=Sum("minutes"))
+    participants = dict(EventParticipation.objects.values_list("event").annotate(participants=Count("participant")))
+
+    per_event = list(statistics.values("event", "event__event_name", "event__date_start")
+                     .annotate(certificates=Sum("number_of_certificates"), minutes=Sum("minutes"))
+                     .order_by("-event__date_start"))
+    for row in per_event:
+        row["participants"] = participants.get(row["event"], 0)
+
+    context = {
+        "certificates": totals["certificates"] or 0,
+        "minutes": totals["minutes"] or 0,
+        "participants": EventParticipation.objects.values("participant").distinct().count(),
+        "per_event": per_event,
+        "per_month": statistics.values("month").annotate(certificates=Sum("number_of_certificates"),
+                                                         minutes=Sum("minutes")).order_by("-month"),
+        "per_role": statistics.values("role").annotate(certificates=Sum("number_of_certificates"),
+                                                       minutes=Sum("minutes")).order_by("-certificates"),
+    }
+    return render(request, "events/event_statistics.html", context)
+
+
 @permission_required('events.change_event', raise_exception=True)
 def event_update(request, event_id):
     event = Event.objects.get(pk=event_id)
@@ -141,9 +168,14 @@ def event_confirm_certification(request, event_id):
                     return redirect(reverse("events:event_certificate", kwargs={"event_id": event.id}))
                 else:
                     df = pd.read_csv(StringIO(csv_table))
+                    participants = resolve_participants(df["username"], request.user)
 
                     for i, row in df.iterrows():
-                        certificate_create(row, event, background, request.user)
+                        data = row.to_dict()
+                        participant = participants.get(normalize_username(data["username"]))
+                        if participant:
+                            data["username"] = participant
+                        certificate_create(data, event, background, request.user)
 
                     return redirect(reverse("events:event_detail", kwargs={"event_id": event.id}))
         except Exception as e:
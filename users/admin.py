@@ -1,6 +1,44 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext_lazy as _
+
 from users.models import User, Participant
+from users.utils import find_duplicate_participants, merge_participants, is_exact_group
+
+
+@admin.action(description=_("Merge duplicated participants among the selected ones"))
+def merge_duplicates(modeladmin, request, queryset):
+    groups = find_duplicate_participants(queryset)
+
+    # Like the delete action, nothing is merged before the groups are confirmed in an intermediate page
+    if request.POST.get("post"):
+        selected = set(request.POST.getlist("group"))
+        merged = 0
+        for keeper, *duplicates in groups:
+            if str(keeper.pk) in selected:
+                merge_participants(keeper, duplicates)
+                merged += 1
+        modeladmin.message_user(request, _("Merged %(groups)s groups of duplicated participants.") % {"groups": merged},
+                                messages.SUCCESS)
+        return None
+
+    context = {
+        **modeladmin.admin_site.each_context(request),
+        "title": _("Merge duplicated participants"),
+        "opts": modeladmin.model._meta,
+        "queryset": queryset,
+        "groups": [{"keeper": group[0], "participants": group, "exact": is_exact_group(group)} for group in groups],
+        "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+    }
+    return TemplateResponse(request, "admin/users/participant/merge_duplicates_confirmation.html", context)
+
+
+class ParticipantAdmin(admin.ModelAdmin):
+    list_display = ["participant_full_name", "participant_username", "number_of_certificates"]
+    search_fields = ["participant_full_name", "participant_username"]
+    actions = [merge_duplicates]
 
 
 admin.site.register(User)
-admin.site.register(Participant)
\ No newline at end of file
+admin.site.register(Participant, ParticipantAdmin)
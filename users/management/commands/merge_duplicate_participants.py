@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from users.utils import SIMILARITY_THRESHOLD, find_duplicate_participants, merge_participants
+
+
+class Command(BaseCommand):
+    help = ("Finds participants that are probably the same person and merges them. Only identical names are "
+            "merged unless --similar is given")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only list the duplicates found")
+        parser.add_argument("--similar", action="store_true",
+                            help="Also merge names that are only similar, such as a missing middle name or a typo. "
+                                 "Review them with --dry-run first")
+        parser.add_argument("--threshold", type=float, default=SIMILARITY_THRESHOLD,
+                            help="Minimal similarity between two names that are spelled differently")
+
+    def handle(self, *args, **options):
+        groups = find_duplicate_participants(threshold=options["threshold"], similar=options["similar"])
+
+        for keeper, *duplicates in groups:
+            self.stdout.write("{} ({}) <- {}".format(
+                keeper.participant_full_name, keeper.participant_username or "-",
+                "; ".join("{} ({})".format(duplicate.participant_full_name, duplicate.participant_username or "-")
+                          for duplicate in duplicates)))
+            if not options["dry_run"]:
+                merge_participants(keeper, duplicates)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("Found {} groups of duplicated participants.".format(len(groups))))
+        else:
+            self.stdout.write(self.style.SUCCESS("Merged {} groups of duplicated participants.".format(len(groups))))
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:40
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def normalize_username(username):
+    if not isinstance(username, str):
+        return None
+    return " ".join(username.replace("_", " ").split()).casefold() or None
+
+
+def merge_duplicate_participants(apps, schema_editor):
+    Participant = apps.get_model('users', 'Participant')
+    Certificate = apps.get_model('certificates', 'Certificate')
+    EventParticipation = apps.get_model('events', 'EventParticipation')
+
+    groups = defaultdict(list)
+    for participant in Participant.objects.exclude(participant_username=None).order_by('id').iterator():
+        key = normalize_username(participant.participant_username)
+        if key:
+            groups[key].append(participant)
+
+    for key, participants in groups.items():
+        keeper, duplicates = participants[0], participants[1:]
+        keeper.participant_username_key = key
+
+        if duplicates:
+            duplicate_ids = [duplicate.id for duplicate in duplicates]
+            if not keeper.participant_full_name:
+                keeper.participant_full_name = next((duplicate.participant_full_name for duplicate in duplicates
+                                                     if duplicate.participant_full_name), "")
+
+            for participation in EventParticipation.objects.filter(participant_id__in=duplicate_ids):
+                kept, created = EventParticipation.objects.get_or_create(event_id=participation.event_id,
+                                                                         participant_id=keeper.id)
+                EventParticipation.objects.filter(pk=kept.pk).update(
+                    number_of_certificates=F('number_of_certificates') + participation.number_of_certificates)
+                participation.delete()
+
+            Certificate.objects.filter(username_id__in=duplicate_ids).update(username_id=keeper.id)
+            keeper.number_of_certificates = Certificate.objects.filter(username_id=keeper.id).count()
+            Participant.objects.filter(id__in=duplicate_ids).delete()
+
+        keeper.save(update_fields=['participant_username_key', 'participant_full_name', 'number_of_certificates'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('certificates', '0004_certificate_minutes'),
+        ('events', '0003_eventparticipation_eventstatistic'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='participant_username_key',
+            field=models.CharField(blank=True, editable=False, max_length=150, null=True),
+        ),
+        migrations.RunPython(merge_duplicate_participants, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='participant',
+            name='participant_username_key',
+            field=models.CharField(blank=True, editable=False, max_length=150, null=True, unique=True),
+        ),
+    ]
@@ -1,8 +1,23 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 
 
+def normalize_username(username):
+    """
+    Normalizes a Wikimedia username so the same account is always found, regardless of
+    letter case, underscores used instead of spaces or surrounding whitespace
+
+    :param username: Username as typed or imported
+    :return: Normalized username, or None if there is no username
+    """
+    if not isinstance(username, str):
+        return None
+    username = " ".join(username.replace("_", " ").split()).casefold()
+    return username or None
+
+
 class User(AbstractUser):
     full_name = models.CharField(_("full name"), max_length=300, blank=True)
 
@@ -19,6 +34,7 @@ class User(AbstractUser):
 class Participant(models.Model):
     participant_full_name = models.CharField(_("full name"), max_length=300)
     participant_username = models.CharField(_("username"), max_length=150, blank=True, null=True)
+    participant_username_key = models.CharField(max_length=150, unique=True, blank=True, null=True, editable=False)
     number_of_certificates = models.IntegerField(_("number of certificates"), default=0)
     enrolled_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(_("date created"), auto_now_add=True)
@@ -26,6 +42,19 @@ class Participant(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='created_users', null=True, blank=True)
     modified_by = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='modified_users', null=True, blank=True)
 
+    def validate_unique(self, exclude=None):
+        super().validate_unique(exclude)
+        # The key is not editable, so forms don't validate it: check the username it is made from instead
+        if exclude and "participant_username" in exclude:
+            return
+        key = normalize_username(self.participant_username)
+        if key and Participant.objects.filter(participant_username_key=key).exclude(pk=self.pk).exists():
+            raise ValidationError({"participant_username": _("A participant with that username already exists.")})
+
+    def save(self, *args, **kwargs):
+        self.participant_username_key = normalize_username(self.participant_username)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         if self.participant_username:
             return self.participant_username
@@ -1,16 +1,25 @@
 import os
-from django.db import IntegrityError
+import importlib
+from datetime import date
+
+from django.apps import apps
+from django.db import IntegrityError, connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from django.urls import reverse
+from django.core.management import call_command
 from django.conf import settings
+from io import StringIO
 from unittest.mock import patch, Mock
 
 from users.pipeline import get_username
 from certificates.models import Certificate
-from users.models import User, Participant
+from events.models import Event, EventParticipation
+from users.models import User, Participant, normalize_username
 from users.forms import UserForm
 from users.views import list_media_files, get_used_files, delete_unused_files
+from users.utils import normalize_name, blocking_keys, find_duplicate_participants, merge_participants
 
 
 class UsersModelTest(TestCase):
@@ -63,6 +72,21 @@ class ParticipantModelTest(TestCase):
         self.assertIsNotNone(participant.created_at)
         self.assertIsNotNone(participant.modified_at)
 
+    def test_participant_cannot_be_renamed_to_an_existing_normalized_username(self):
+        Participant.objects.create(participant_username="John_Doe", participant_full_name="John Doe")
+        participant = Participant.objects.create(participant_username="Jane", participant_full_name="Jane Doe")
+        admin_user = User.objects.create_superuser(username="admin", password="password")
+        self.client.force_login(admin_user)
+
+        url = reverse("admin:users_participant_change", args=[participant.pk])
+        response = self.client.post(url, {"participant_full_name": "Jane Doe", "participant_username": " john doe",
+                                          "number_of_certificates": 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("participant_username", response.context["adminform"].form.errors)
+        participant.refresh_from_db()
+        self.assertEqual(participant.participant_username, "Jane")
+
     def test_participant_username_max_length(self):
         long_username = 'a' * 151
         with self.assertRaises(ValidationError):
@@ -100,6 +124,48 @@ class ParticipantModelTest(TestCase):
         participant = Participant.objects.create(participant_full_name=self.full_name)
         self.assertEqual(str(participant), "")
 
+    def test_normalize_username(self):
+        self.assertEqual(normalize_username("  Foo_Bar  baz "), "foo bar baz")
+        self.assertEqual(normalize_username("FOO"), normalize_username("foo"))
+        self.assertIsNone(normalize_username(""))
+        self.assertIsNone(normalize_username(None))
+        self.assertIsNone(normalize_username(float("nan")))
+
+    def test_participant_username_key_is_normalized_on_save(self):
+        participant = Participant.objects.create(participant_username="Foo_Bar")
+        self.assertEqual(participant.participant_username_key, "foo bar")
+
+    def test_participant_username_key_is_unique(self):
+        Participant.objects.create(participant_username="Foo")
+        with self.assertRaises(IntegrityError):
+            Participant.objects.create(participant_username="foo")
+
+    def test_participants_without_username_do_not_collide(self):
+        Participant.objects.create(participant_full_name="First")
+        Participant.objects.create(participant_full_name="Second", participant_username="")
+        self.assertEqual(Participant.objects.filter(participant_username_key__isnull=True).count(), 2)
+
+    def test_migration_merges_duplicate_participants(self):
+        migration = importlib.import_module("users.migrations.0002_participant_username_key")
+        event = Event.objects.create(event_name="Event", date_start=date(2024, 1, 1))
+        first, second = Participant.objects.bulk_create([
+            Participant(participant_username="Foo", participant_full_name=""),
+            Participant(participant_username="foo", participant_full_name="Foo Bar"),
+        ])
+        first, second = Participant.objects.order_by("id")
+        for participant in (first, second):
+            Certificate.objects.create(name="Foo Bar", username=participant, event=event, hours="01h00")
+
+        migration.merge_duplicate_participants(apps, None)
+
+        participant = Participant.objects.get()
+        self.assertEqual(participant.pk, first.pk)
+        self.assertEqual(participant.participant_username_key, "foo")
+        self.assertEqual(participant.participant_full_name, "Foo Bar")
+        self.assertEqual(participant.number_of_certificates, 2)
+        self.assertEqual(Certificate.objects.filter(username=participant).count(), 2)
+        self.assertEqual(EventParticipation.objects.get().number_of_certificates, 2)
+
     def test_created_by_foreign_key(self):
         creator = User.objects.create(username='Test User', password='Password')
         participant = Participant.objects.create(participant_username=self.username, created_by=creator)
@@ -111,6 +177,130 @@ class ParticipantModelTest(TestCase):
         self.assertEqual(participant.modified_by, modifier)
 
 
+class ParticipantDeduplicationTest(TestCase):
+    def setUp(self):
+        self.event = Event.objects.create(event_name="Event", date_start=date(2024, 1, 1))
+
+    def create_participant(self, full_name, username=None, certificates=0):
+        participant = Participant.objects.create(participant_full_name=full_name, participant_username=username)
+        for i in range(certificates):
+            Certificate.objects.create(name=full_name, username=participant, event=self.event, hours="01h00")
+        participant.number_of_certificates = certificates
+        participant.save()
+        return participant
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("  José da Silva-Souza "), ["jose", "silva", "souza"])
+
+    def test_find_duplicates_groups_the_same_person(self):
+        keeper = self.create_participant("Maria da Conceição Silva", "MariaSilva", certificates=1)
+        without_username = self.create_participant("Maria Conceicao Silva")
+        without_middle_name = self.create_participant("Maria Silva")
+        misspelled = self.create_participant("Maria Conceiçao Silvaa")
+        self.create_participant("João Souza")
+
+        groups = find_duplicate_participants()
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0][0], keeper)
+        self.assertEqual(set(groups[0][1:]), {without_username, without_middle_name, misspelled})
+
+    def test_find_duplicates_never_groups_different_usernames(self):
+        self.create_participant("Maria Silva", "MariaSilva")
+        self.create_participant("Maria Silva", "OtherMaria")
+        self.create_participant("Maria Silva")
+
+        groups = find_duplicate_participants()
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(len(groups[0]), 2)
+
+    def test_blocks_use_a_prefix_of_the_first_name(self):
+        self.assertFalse(blocking_keys(normalize_name("Ana Silva")) & blocking_keys(normalize_name("Antonio Silva")))
+        self.assertTrue(blocking_keys(normalize_name("Mariana Silva")) & blocking_keys(normalize_name("Marianna Silva")))
+
+    def test_big_blocks_only_group_identical_names(self):
+        self.create_participant("Maria Silva")
+        self.create_participant("Maria  Silva")
+        self.create_participant("Maria Conceição Silva")
+
+        with patch("users.utils.MAX_BLOCK_SIZE", 2):
+            groups = find_duplicate_participants()
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual({participant.participant_full_name for participant in groups[0]}, {"Maria Silva", "Maria  Silva"})
+
+    def test_merge_participants_reassigns_certificates(self):
+        keeper = self.create_participant("Maria Silva", certificates=1)
+        duplicate = self.create_participant("Maria Silva", "MariaSilva", certificates=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            merge_participants(keeper, [duplicate])
+
+        updates = [query for query in queries
+                   if query["sql"].startswith('UPDATE "certificates_certificate" SET "username_id" = {}'.format(keeper.pk))]
+        self.assertEqual(len(updates), 1)
+
+        keeper.refresh_from_db()
+        self.assertEqual(keeper.participant_username, "MariaSilva")
+        self.assertEqual(keeper.number_of_certificates, 3)
+        self.assertEqual(Certificate.objects.filter(username=keeper).count(), 3)
+        self.assertFalse(Participant.objects.filter(pk=duplicate.pk).exists())
+        self.assertEqual(EventParticipation.objects.get().number_of_certificates, 3)
+
+    def test_merge_command_only_merges_similar_names_when_asked(self):
+        self.create_participant("Maria Silva", "MariaSilva", certificates=1)
+        self.create_participant("Maria Conceição Silva", certificates=1)
+
+        call_command("merge_duplicate_participants", stdout=StringIO())
+        self.assertEqual(Participant.objects.count(), 2)
+
+        call_command("merge_duplicate_participants", "--similar", stdout=StringIO())
+        self.assertEqual(Participant.objects.get().number_of_certificates, 2)
+
+    def test_admin_action_asks_for_confirmation(self):
+        identical = [self.create_participant("Maria Silva", "MariaSilva"), self.create_participant("Maria Silva")]
+        similar = [self.create_participant("João Souza", "JoaoSouza"), self.create_participant("João Pedro Souza")]
+        self.client.force_login(User.objects.create_superuser(username="admin", password="password"))
+        url = reverse("admin:users_participant_changelist")
+        data = {"action": "merge_duplicates", "_selected_action": [participant.pk for participant in identical + similar]}
+
+        response = self.client.post(url, data)
+        self.assertTemplateUsed(response, "admin/users/participant/merge_duplicates_confirmation.html")
+        self.assertEqual({group["keeper"].pk: group["exact"] for group in response.context["groups"]},
+                         {identical[0].pk: True, similar[0].pk: False})
+        self.assertEqual(Participant.objects.count(), 4)
+
+        response = self.client.post(url, dict(data, post="yes", group=[identical[0].pk]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Participant.objects.filter(pk=identical[1].pk).exists())
+        self.assertEqual(Participant.objects.filter(pk__in=[participant.pk for participant in similar]).count(), 2)
+
+    def test_merge_command(self):
+        self.create_participant("Maria Silva", "MariaSilva", certificates=1)
+        self.create_participant("Maria  Silva", certificates=1)
+
+        call_command("merge_duplicate_participants", "--dry-run", stdout=StringIO())
+        self.assertEqual(Participant.objects.count(), 2)
+
+        call_command("merge_duplicate_participants", stdout=StringIO())
+        self.assertEqual(Participant.objects.get().number_of_certificates, 2)
+
+    def test_merge_admin_action(self):
+        admin_user = User.objects.create_superuser(username="admin", password="password")
+        first = self.create_participant("Maria Silva", certificates=1)
+        second = self.create_participant("Maria Silva", certificates=1)
+        self.create_participant("Maria Silva")
+        self.client.force_login(admin_user)
+
+        self.client.post(reverse("admin:users_participant_changelist"),
+                         {"action": "merge_duplicates", "_selected_action": [first.pk, second.pk], "post": "yes",
+                          "group": [first.pk]})
+
+        self.assertEqual(Participant.objects.count(), 2)
+        self.assertEqual(Participant.objects.get(pk=first.pk).number_of_certificates, 2)
+
+
 class UserFormTest(TestCase):
     def setUp(self):
         self.username = "Test Username"
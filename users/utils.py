@@ -0,0 +1,173 @@
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from django.db import transaction
+
+from certificates.cache import invalidate_portfolios
+from certificates.models import Certificate
+from events.statistics import rebuild_statistics
+from users.models import Participant
+
+NAME_PARTICLES = {"da", "das", "de", "del", "della", "di", "do", "dos", "du", "e", "van", "von"}
+SIMILARITY_THRESHOLD = 0.9
+# Blocks bigger than this, made of very common names, only have their identical names compared
+MAX_BLOCK_SIZE = 100
+
+
+def normalize_name(name):
+    """
+    Function to normalize a full name for comparison: accents, letter case, punctuation
+    and name particles (such as "da" or "dos") are removed
+
+    :param name: Full name of the participant
+    :return: List with the remaining name parts
+    """
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(char for char in name if not unicodedata.combining(char)).casefold()
+    name = "".join(char if char.isalnum() else " " for char in name)
+    return [part for part in name.split() if part not in NAME_PARTICLES]
+
+
+def blocking_keys(name_parts):
+    """
+    Function to build the blocks a participant belongs to. Only participants sharing a block are
+    compared, which avoids comparing every pair of participants. The prefixes of the first and
+    last names keep names with typos in their endings in the same block, and a shorter prefix
+    of the first name next to the whole last name catches typos in the first name
+
+    :param name_parts: Normalized name parts
+    :return: Set of blocking keys
+    """
+    if not name_parts:
+        return set()
+    first, last = name_parts[0], name_parts[-1]
+    return {(first[:4], last[:4]), (first[:3], last)}
+
+
+def names_match(name_parts, other_parts, threshold=SIMILARITY_THRESHOLD):
+    """
+    Function to check if two normalized names belong to the same person: either one name is contained
+    in the other (e.g. a missing middle name) or they are spelled almost the same way
+
+    :return: True if the names match
+    """
+    if not name_parts or not other_parts:
+        return False
+    if name_parts[0] == other_parts[0] and name_parts[-1] == other_parts[-1]:
+        shorter, longer = sorted((name_parts, other_parts), key=len)
+        if set(shorter) <= set(longer):
+            return True
+    return SequenceMatcher(None, " ".join(name_parts), " ".join(other_parts)).ratio() >= threshold
+
+
+def block_pairs(block, participants):
+    """
+    Function to list the pairs of participants of a block that must be compared. Every pair is
+    compared in the small blocks, while in the big ones only participants with identical names are
+
+    :param block: List of participant ids
+    :param participants: Dictionary of participant ids to tuples of the participant and its normalized name
+    :return: Iterable of pairs of participant ids
+    """
+    if len(block) <= MAX_BLOCK_SIZE:
+        return combinations(block, 2)
+    same_names = defaultdict(list)
+    for participant_id in block:
+        same_names[tuple(participants[participant_id][1])].append(participant_id)
+    return [(ids[0], other_id) for ids in same_names.values() for other_id in ids[1:]]
+
+
+def find_duplicate_participants(queryset=None, threshold=SIMILARITY_THRESHOLD, similar=True):
+    """
+    Function to find groups of participants that are probably the same person. Participants
+    with two different usernames are never grouped, as they are two different Wikimedia accounts
+
+    :param queryset: Participants to search in, all of them by default
+    :param threshold: Minimal similarity between two names that are spelled differently
+    :param similar: If False, only participants with the same normalized name are grouped
+    :return: List of groups, each one a list of participants with the one to keep first
+    """
+    queryset = Participant.objects.all() if queryset is None else queryset
+    participants = {}
+    blocks = defaultdict(list)
+    for participant in queryset.only("id", "participant_full_name", "participant_username",
+                                     "participant_username_key", "number_of_certificates").iterator():
+        participants[participant.id] = (participant, normalize_name(participant.participant_full_name))
+        for key in blocking_keys(participants[participant.id][1]):
+            blocks[key].append(participant.id)
+
+    parents = {participant_id: participant_id for participant_id in participants}
+    usernames = {participant_id: participant.participant_username_key
+                 for participant_id, (participant, name_parts) in participants.items()}
+
+    def find(participant_id):
+        while parents[participant_id] != participant_id:
+            parents[participant_id] = parents[parents[participant_id]]
+            participant_id = parents[participant_id]
+        return participant_id
+
+    for block in blocks.values():
+        for participant_id, other_id in block_pairs(block, participants):
+            root, other_root = find(participant_id), find(other_id)
+            if root == other_root:
+                continue
+            if usernames[root] and usernames[other_root] and usernames[root] != usernames[other_root]:
+                continue
+            name_parts, other_parts = participants[participant_id][1], participants[other_id][1]
+            if similar:
+                match = names_match(name_parts, other_parts, threshold)
+            else:
+                match = name_parts == other_parts
+            if match:
+                parents[other_root] = root
+                usernames[root] = usernames[root] or usernames[other_root]
+
+    groups = defaultdict(list)
+    for participant_id, (participant, name_parts) in participants.items():
+        groups[find(participant_id)].append(participant)
+
+    return [sorted(group, key=lambda participant: (not participant.participant_username_key,
+                                                   -participant.number_of_certificates,
+                                                   participant.id))
+            for group in groups.values() if len(group) > 1]
+
+
+def is_exact_group(group):
+    names = {tuple(normalize_name(participant.participant_full_name)) for participant in group}
+    return len(names) == 1
+
+
+def merge_participants(keeper, duplicates):
+    """
+    Function to merge duplicated participants into one. Their certificates are reassigned with a
+    single UPDATE, so the statistics of the events involved and the number of certificates of the
+    participant kept are recomputed
+
+    :param keeper: Participant to keep
+    :param duplicates: Participants to merge into the keeper and delete
+    :return: The participant kept
+    """
+    duplicates = [duplicate for duplicate in duplicates if duplicate.pk != keeper.pk]
+    duplicate_ids = [duplicate.pk for duplicate in duplicates]
+    if not duplicate_ids:
+        return keeper
+
+    with transaction.atomic():
+        certificates = Certificate.objects.filter(username_id__in=duplicate_ids)
+        event_ids = set(certificates.filter(event__isnull=False).values_list("event_id", flat=True))
+        certificates.update(username=keeper)
+        Participant.objects.filter(pk__in=duplicate_ids).delete()
+        rebuild_statistics(event_ids)
+
+        for duplicate in duplicates:
+            if not keeper.participant_username and duplicate.participant_username:
+                keeper.participant_username = duplicate.participant_username
+            if not keeper.participant_full_name and duplicate.participant_full_name:
+                keeper.participant_full_name = duplicate.participant_full_name
+        keeper.number_of_certificates = Certificate.objects.filter(username=keeper).count()
+        keeper.save()
+
+    invalidate_portfolios([keeper.participant_username] + [duplicate.participant_username for duplicate in duplicates])
+    return keeper
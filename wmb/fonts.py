@@ -0,0 +1,21 @@
+import os
+from functools import lru_cache
+
+from django.conf import settings
+from PIL import ImageFont
+
+
+@lru_cache(maxsize=None)
+def get_font(name, size):
+    """
+    Function to load one of the bundled fonts. If the font file can't be read, the default
+    font of Pillow is used, so a calendar or a badge can still be drawn
+
+    :param name: Filename of the font, inside static/fonts
+    :param size: Font size, in pixels
+    :return: Font object
+    """
+    try:
+        return ImageFont.truetype(os.path.join(settings.BASE_DIR, "static", "fonts", name), size)
+    except OSError:
+        return ImageFont.load_default(size)
@@ -0,0 +1,79 @@
+import io
+import os
+import hashlib
+import tempfile
+from functools import lru_cache
+
+import qrcode
+from django.conf import settings
+
+# How long browsers and proxies may keep a served QR code, in seconds. Its content never changes
+QR_CODE_MAX_AGE = 60 * 60 * 24 * 365
+
+
+def qr_code_path(data):
+    fingerprint = hashlib.sha256(data.encode("utf-8")).hexdigest()
+    return os.path.join(settings.QR_CODE_CACHE_DIR, fingerprint[:2], fingerprint + ".png")
+
+
+def encode_qr_code(data):
+    """
+    Function to encode a text as a QR code, drawn with one pixel per module. The image is scaled by
+    whoever shows it, so a single small file serves the PDFs, the badges and the pages
+
+    :param data: Text encoded in the QR code
+    :return: Black and white PNG image, in bytes
+    """
+    code = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, box_size=1, border=1)
+    code.add_data(data)
+    output = io.BytesIO()
+    code.make_image().get_image().convert("1").save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def write_qr_code(path, image):
+    """
+    Function to store a QR code on disk. The file is written to a temporary name and then renamed, so
+    a concurrent reader never sees a partial image
+
+    :param path: Path of the image, built by qr_code_path
+    :param image: PNG image, in bytes
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(file_descriptor, "wb") as image_file:
+        image_file.write(image)
+    os.replace(temporary_path, path)
+
+
+@lru_cache(maxsize=1024)
+def qr_code_png(data):
+    """
+    Function to get the QR code of a text, encoding it only the first time it is ever requested. The
+    image is kept on disk, under QR_CODE_CACHE_DIR, and in the memory of the process
+
+    :param data: Text encoded in the QR code
+    :return: PNG image, in bytes
+    """
+    path = qr_code_path(data)
+    try:
+        with open(path, "rb") as image_file:
+            return image_file.read()
+    except OSError:
+        pass
+    image = encode_qr_code(data)
+    write_qr_code(path, image)
+    return image
+
+
+def qr_code_file(data):
+    """
+    Function to get the path of the stored QR code of a text, for the libraries that only read images from files
+
+    :param data: Text encoded in the QR code
+    :return: Path of the PNG image
+    """
+    path = qr_code_path(data)
+    if not os.path.exists(path):
+        write_qr_code(path, qr_code_png(data))
+    return path
@@ -157,3 +157,43 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Shared by every worker process, so the version keys bumped on changes invalidate the cached pages,
+# portfolios, feeds and embeds everywhere. It is kept outside MEDIA_ROOT, which is served publicly
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache'),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# Rendered calendar pages are kept on disk, up to this size in bytes
+CALENDAR_CACHE_DIR = os.path.join(MEDIA_ROOT, 'calendar_cache')
+CALENDAR_CACHE_MAX_SIZE = 200 * 1024 * 1024
+
+# How long browsers and proxies may keep the public calendar embed, in seconds
+CALENDAR_EMBED_MAX_AGE = 60 * 60
+
+# QR codes of the validation links of certificates and credentials are encoded once and kept on disk
+QR_CODE_CACHE_DIR = os.path.join(MEDIA_ROOT, 'qr_codes')
+
+# MediaWiki API used to shorten the Meta-Wiki profile URLs of the credentials
+WIKIMEDIA_API_ENDPOINT = "https://meta.wikimedia.org/w/api.php"
+
+# Public address of the site, used in the links printed on documents such as the credential badges
+SITE_URL = "https://wmb.toolforge.org"
+
+# Function that downloads the photographs of the credentials, given their URL. Tests replace it by an offline stub
+CREDENTIAL_PHOTOGRAPH_FETCHER = "credentials.photographs.fetch_photograph"
+
+# Hosts the photographs of the credentials may be downloaded from, such as "upload.wikimedia.org". When empty,
+# any host is accepted as long as it resolves to public addresses only
+CREDENTIAL_PHOTOGRAPH_HOSTS = []
+
+# Key of the blind indexes that look up the encrypted credential fields. It is independent of SECRET_KEY, and
+# changing it requires running the reindex_credentials command
+FIELD_BLIND_INDEX_KEY = os.environ.get("FIELD_BLIND_INDEX_KEY", globals().get("FIELD_BLIND_INDEX_KEY"))
+
+# Days an expired credential is kept before purge_expired_credentials archives or deletes it
+CREDENTIAL_RETENTION_DAYS = 365